@@ -1,4 +1,47 @@
-from NBprocessing.categorical._NBcategorical_class import NBcategorical
-from NBprocessing.continuous._NBcontinuous_class import NBcontinuous
-from NBprocessing.general._NBgeneral_class import NBgeneral
-from NBprocessing.plot._NBplot_class import NBplot
\ No newline at end of file
+"""
+NBprocessing - Pre-processing database using pre-written functions.
+
+The classes and functions of the package are loaded lazily - on their first access - thus
+'import NBprocessing' does not import pandas, seaborn, matplotlib, plotly or sklearn.
+The heavy plot and model selection packages are loaded only when a method that uses them is called.
+
+Create by: Nir Barazida
+Good luck!
+"""
+
+import importlib
+
+_LAZY_OBJECTS = {
+    "NBcategorical": "NBprocessing.categorical._NBcategorical_class",
+    "CategoryCombiner": "NBprocessing.categorical._category_combiner",
+    "CategoryEncoder": "NBprocessing.categorical._category_encoder",
+    "CategoryOneHotEncoder": "NBprocessing.categorical._one_hot_encoder",
+    "NBcontinuous": "NBprocessing.continuous._NBcontinuous_class",
+    "QuantileSketch": "NBprocessing.continuous._quantile_sketch",
+    "OutlierDetector": "NBprocessing.continuous._outlier_detector",
+    "OutlierClipper": "NBprocessing.continuous._outlier_clipper",
+    "Discretizer": "NBprocessing.continuous._discretizer",
+    "Scaler": "NBprocessing.continuous._scaler",
+    "SkewCorrector": "NBprocessing.continuous._skew_corrector",
+    "NBgeneral": "NBprocessing.general._NBgeneral_class",
+    "DatasetProfile": "NBprocessing.general._dataset_profile",
+    "NBplot": "NBprocessing.plot._NBplot_class",
+    "ExecutionPolicy": "NBprocessing.src._execution_policy",
+    "ActionReport": "NBprocessing.src._execution_policy",
+    "set_execution_policy": "NBprocessing.src._execution_policy",
+    "get_execution_policy": "NBprocessing.src._execution_policy",
+}
+
+__all__ = list(_LAZY_OBJECTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_OBJECTS:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(_LAZY_OBJECTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
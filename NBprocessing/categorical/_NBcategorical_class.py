@@ -2,68 +2,76 @@
 Generic functions to manipulate categorical features in pandas data frame.
 
 This library include the functions:
-    1. remove_categories(database, column_name, categories_to_drop):
+    1. remove_categories(database, column_name, categories_to_drop, policy=None):
         Remove all indexes in the database that contain the categories from the categories_to_drop.
-        Before removing the indexes will print a message to the user with the number of indexes that
+        Before removing the indexes will consult the execution policy with the number of indexes that
         will be remove and the percent of the database that will be lost.
-        the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
-        If the user choose 'yes' the method will continue to drop the indexes and will
-        plot the new database shape.
+        In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+        Returns an ActionReport with the outcome of the action.
 
-    2. fill_na_by_ratio(database, column_name):
-        Fill all missing values in the given column by the ratio of the categories in the column.
-        Because the ratio sum is not a perfect one - the extra missing values will
-        be filled with the most common category in the column.
+    2. fill_na_by_ratio(database, column_name, random_state=None, by=None):
+        Fill all missing values in the given column (or list of columns) by the ratio of the categories
+        in the column. Only the missing values are sampled, the sampling is reproducible with 'random_state'.
+        With 'by' the missing values are sampled from the ratio of the categories within their group.
 
     3. combine_categories(database, column_name, category_name="other", threshold=0.01):
         Receives a threshold that is the minimum relative part of the category within the column.
         all categories that are less than this threshold will be combined under the same category
         under the name 'category_name'.
-        the method will return a list with all the name of categories that were combined under 'category_name'
-        with this list the user will be able to make the same action on the test set (assuming that the data
-        was already splitted to train and test sets)
+        the method will return a fitted CategoryCombiner, with the combiner the user will be able to make
+        the same action on the test set (assuming that the data was already splitted to train and test sets)
 
-    4. categories_not_in_common(train, test, column_name):
+    4. categories_not_in_common(train, test, column_name=None, align=False):
         To avoid different shapes of train and test data sets after creating dummies, the user is able to
         check if one categories is missing in the data sets.
-        It will check all categories name of the two data sets and returns the name of the categories not
-        in common for every data set.
-        The information from this method will be returned as list of tuples:
-            [(exists only in the first data set),(exists only in the second data set)]
-        will also print every list as a message to the user.
-
-    5. category_ratio(database, columns_to_check=None, num_categories=5):
-        Returns a data base with categories and their ratio of appearance in the column.
+        It will check all categories name of the two data sets for one, many or all columns and returns the
+        name of the categories not in common for every data set as a dictionary:
+            {column name: ([exists only in the first data set], [exists only in the second data set])}
+        With 'align' both data sets are cast to a shared CategoricalDtype per column.
+
+    5. category_ratio(database, columns_to_check=None, num_categories=5, style=False, n_jobs=None,
+                      profile=None):
+        Returns a numeric long format data base with categories and their ratio and rank of appearance in the column.
         The user can input a list of columns to check or the method will return all the columns categories ratio.
         The user can choose how many *top* categories will be returned.
-        Categories with value under 5% or over 90% will be marked in red to raise a flag that the data
-        is imbalanced.
-
-        6. label_encoder_features(database, features_to_encode):
-            Encode features in the giving database using LabelEncoder() from sklearn.
-            Will preform encoding on all giving features and returns a dictionary with all the different
-            encoders where the ket is the feature name and the value is the LabelEncoder instance fitted
-            to that feature. Thus, the user is able to un-encode the feature when necessary.
-
-        7.  OHE(database, features_list=None):
-            Encode features in the giving database using get_dummies() from pandas.
+        With 'style' returns a styled table where categories with value over 90% will be marked in red
+        to raise a flag that the data is imbalanced.
+        With 'profile' the ratios are read from a DatasetProfile of the database.
+
+        6. label_encoder_features(database, features_to_encode, n_jobs=None):
+            Encode features in the giving database using a CategoryEncoder.
+            Will preform encoding on all giving features inplace and returns the fitted CategoryEncoder,
+            the codes are stored in the smallest sufficient integer dtype, missing values are encoded to -1
+            and unseen categories to -2.
+            Thus, the user is able to encode the test set and un-encode the features when necessary.
+
+        7.  OHE(database, features_list=None, policy=None, sparse=False, encoder=None, return_report=False):
+            Encode features in the giving database using a CategoryOneHotEncoder.
             Will preform one hot encoding on all giving features or if non were given will preform on all non-numeric
-            features in the database.
-            Will check with the user that agree to add num of features
+            features in the database. The features can be added as sparse columns and a fitted encoder
+            produces the same columns for the train and test sets.
+            Will consult the execution policy with the num of added features and their estimated memory
             Return the encoded database and the name of the original features that was encoded
+            (and an ActionReport if return_report)
 
 Create by: Nir Barazida
 Good luck!
 """
 
 from NBprocessing.categorical._input_check_categorical import _InputCheckCategorical
+from NBprocessing.categorical._category_combiner import CategoryCombiner
+from NBprocessing.categorical._category_encoder import CategoryEncoder
+from NBprocessing.categorical._one_hot_encoder import CategoryOneHotEncoder
 
-from NBprocessing.categorical._general_functions_categorical import color_imbalanced
+from NBprocessing.categorical._general_functions_categorical import color_imbalanced, fill_column_by_ratio, \
+    fill_column_by_group_ratio, unique_categories, column_category_ratio
 from NBprocessing.src import constance_object
+from NBprocessing.src._execution_policy import ActionReport, Timer, resolve_policy
+from NBprocessing.src._general_functions import remove_rows_by_mask, get_random_generator, to_column_list
+from NBprocessing.src._parallel import parallel_map
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import LabelEncoder
 
 
 class NBcategorical(object):
@@ -71,55 +79,57 @@ class NBcategorical(object):
     Generic functions to manipulate categorical features in pandas data frame.
 
     This library include the functions:
-        1. remove_categories(database, column_name, categories_to_drop):
+        1. remove_categories(database, column_name, categories_to_drop, policy=None):
             Remove all indexes in the database that contain the categories from the categories_to_drop.
-            Before removing the indexes will print a message to the user with the number of indexes that
+            Before removing the indexes will consult the execution policy with the number of indexes that
             will be remove and the percent of the database that will be lost.
-            the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
-            If the user choose 'yes' the method will continue to drop the indexes and will
-            plot the new database shape.
+            In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+            Returns an ActionReport with the outcome of the action.
 
-        2. fill_na_by_ratio(database, column_name):
-            Fill all missing values in the given column by the ratio of the categories in the column.
-            Because the ratio sum is not a perfect one - the extra missing values will
-            be filled with the most common category in the column.
+        2. fill_na_by_ratio(database, column_name, random_state=None, by=None):
+            Fill all missing values in the given column (or list of columns) by the ratio of the categories
+            in the column. Only the missing values are sampled, the sampling is reproducible with 'random_state'.
+            With 'by' the missing values are sampled from the ratio of the categories within their group.
 
         3. combine_categories(database, column_name, category_name="other", threshold=0.01):
             Receives a threshold that is the minimum relative part of the category within the column.
             all categories that are less than this threshold will be combined under the same category
             under the name 'category_name'.
-            the method will return a list with all the name of categories that were combined under 'category_name'
-            with this list the user will be able to make the same action on the test set (assuming that the data
-            was already splitted to train and test sets)
+            the method will return a fitted CategoryCombiner, with the combiner the user will be able to make
+            the same action on the test set (assuming that the data was already splitted to train and test sets)
 
-        4. categories_not_in_common(train, test, column_name):
+        4. categories_not_in_common(train, test, column_name=None, align=False):
             To avoid different shapes of train and test data sets after creating dummies, the user is able to
             check if one categories is missing in the data sets.
-            It will check all categories name of the two data sets and returns the name of the categories not
-            in common for every data set.
-            The information from this method will be returned as list of tuples:
-                [(exists only in the first data set),(exists only in the second data set)]
-            will also print every list as a message to the user.
-
-        5. category_ratio(database, columns_to_check=None, num_categories=5):
-            Returns a data base with categories and their ratio of appearance in the column.
+            It will check all categories name of the two data sets for one, many or all columns and returns the
+            name of the categories not in common for every data set as a dictionary:
+                {column name: ([exists only in the first data set], [exists only in the second data set])}
+            With 'align' both data sets are cast to a shared CategoricalDtype per column.
+
+        5. category_ratio(database, columns_to_check=None, num_categories=5, style=False, n_jobs=None,
+                      profile=None):
+            Returns a numeric long format data base with categories and their ratio and rank of appearance in the column.
             The user can input a list of columns to check or the method will return all the columns categories ratio.
             The user can choose how many *top* categories will be returned.
-            Categories with value over 90% will be marked in red to raise a flag that the data
-            is imbalanced.
-
-        6. label_encoder_features(database, features_to_encode):
-            Encode features in the giving database using LabelEncoder() from sklearn.
-            Will preform encoding on all giving features and returns a dictionary with all the different
-            encoders where the ket is the feature name and the value is the LabelEncoder instance fitted
-            to that feature. Thus, the user is able to un-encode the feature when necessary.
-
-        7.  OHE(database, features_list=None):
-            Encode features in the giving database using get_dummies() from pandas.
+            With 'style' returns a styled table where categories with value over 90% will be marked in red
+            to raise a flag that the data is imbalanced.
+            With 'profile' the ratios are read from a DatasetProfile of the database.
+
+        6. label_encoder_features(database, features_to_encode, n_jobs=None):
+            Encode features in the giving database using a CategoryEncoder.
+            Will preform encoding on all giving features inplace and returns the fitted CategoryEncoder,
+            the codes are stored in the smallest sufficient integer dtype, missing values are encoded to -1
+            and unseen categories to -2.
+            Thus, the user is able to encode the test set and un-encode the features when necessary.
+
+        7.  OHE(database, features_list=None, policy=None, sparse=False, encoder=None, return_report=False):
+            Encode features in the giving database using a CategoryOneHotEncoder.
             Will preform one hot encoding on all giving features or if non were given will preform on all non-numeric
-            features in the database.
-            Will check with the user that agree to add num of features
+            features in the database. The features can be added as sparse columns and a fitted encoder
+            produces the same columns for the train and test sets.
+            Will consult the execution policy with the num of added features and their estimated memory
             Return the encoded database and the name of the original features that was encoded
+            (and an ActionReport if return_report)
 
     Create by: Nir Barazida
     Good luck!
@@ -128,16 +138,15 @@ class NBcategorical(object):
 
     @staticmethod
     @_InputCheckCategorical._remove_categories_checker
-    def remove_categories(database, column_name, categories_to_drop):
+    def remove_categories(database, column_name, categories_to_drop, policy=None):
         """
         General Information
         ----------
         Remove all indexes in the database that contain the categories from the categories_to_drop.
-        Before removing the indexes will print a message to the user with the number of indexes that
+        Before removing the indexes the execution policy is consulted with the number of indexes that
         will be remove and the percent of the database that will be lost.
-        the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
-        If the user choose 'yes' the method will continue to drop the indexes and will
-        plot the new database shape.
+        In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+        If the action is approved the method will continue to drop the indexes.
 
         Parameters
         ----------
@@ -152,50 +161,65 @@ class NBcategorical(object):
         :param categories_to_drop: list or tuple of string int of float
         The name of the categories the user wish to drop.
 
+        :param policy: ExecutionPolicy or string - 'prompt', 'confirm', 'reject' or 'threshold'
+        The policy that approves the action. If None the package execution policy will be used.
+
         Returns
         -------
-        None
-        This method prints information to help the user decide rather to drop the categories or not.
-        eventually returns None
+        ActionReport
+        The number of rows that were (or would have been) removed and rather the action was executed.
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
         """
 
-        remove_df = database[database[column_name].isin(categories_to_drop)]
+        timer = Timer()
+        policy = resolve_policy(policy)
+        rows_before = len(database)
+        remove_mask = database[column_name].isin(categories_to_drop).to_numpy()
+        rows_lost = int(remove_mask.sum())
+        percent_lost = round(rows_lost * 100 / rows_before, 2) if rows_before else 0.0
 
-        user_input = input(
-            constance_object.USER_INPUT.format(len(remove_df), round(len(remove_df) * 100 / len(database), 2)))
+        executed = policy.approve(constance_object.USER_INPUT.format(rows_lost, percent_lost),
+                                  rows_lost=rows_lost, percent_lost=percent_lost)
 
-        while user_input != 'y' and user_input != 'n':
-            user_input = input(
-                constance_object.USER_INPUT.format(len(remove_df), round(len(remove_df) * 100 / len(database), 2)))
+        if executed:
+            remove_rows_by_mask(database, remove_mask)
+            if policy.is_interactive:
+                print(constance_object.DATABASE_SHAPE.format(database.shape))
 
-        if user_input == 'y':
-            for value in categories_to_drop:
-                database.drop(database.loc[database[column_name] == value].index, inplace=True)
-            print(constance_object.DATABASE_SHAPE.format(database.shape))
+        return ActionReport("remove_categories", executed, rows_before, rows_affected=rows_lost,
+                            elapsed_seconds=timer.elapsed)
 
     @staticmethod
     @_InputCheckCategorical._fill_na_by_ratio_checker
-    def fill_na_by_ratio(database, column_name):
+    def fill_na_by_ratio(database, column_name, random_state=None, by=None):
         """
         General Information
         ----------
         Fill all missing values in the given column by the ratio of the categories in the column.
-        Because the ratio sum is not a perfect one - the extra missing values will
-        be filled with the most common category in the column.
+        Only the missing values are sampled - exactly one sample per missing value, and the samples are
+        written by the position of the missing values so the fill is correct for any index of the database.
 
         Parameters
         ----------
         :param database: pandas Data Frame
         the database must contain the column that was sent to the method 'column_name'
 
-        :param column_name:  string
+        :param column_name:  string or list/tuple of strings
         The name of the column where method will fill the missing values in.
+        A list of columns will fill all the columns in one call.
         This column must be a categorical column
 
+        :param random_state: int, numpy Generator or None
+        Seed or Generator of the sampling - the same seed will produce the same fill.
+
+        :param by: string or list/tuple of strings
+        Column names to group by. If given, the missing values of every group are sampled from the ratio of
+        the categories within that group (e.g. 'fuel' by the car brand). Groups without any known value
+        are filled by the ratio of the whole column.
+
         Returns
         -------
         None
@@ -205,17 +229,15 @@ class NBcategorical(object):
         ------
         ValueError : If input value not as mentioned above.
         """
-        try:
-            categories_names = list(database[column_name].value_counts(normalize=True, dropna=True).index)
-            categories_ratio = list(database[column_name].value_counts(normalize=True, dropna=True).values)
-
-            database[column_name] = database[column_name].fillna(
-                pd.Series(np.random.choice(categories_names, p=categories_ratio, size=len(database))))
 
-            # Fill the extra missing values
-            database[column_name].fillna(database[column_name].value_counts().index[0], inplace=True)
-        except NameError as e:
-            print(e)
+        random_generator = get_random_generator(random_state)
+        if by is None:
+            for column in to_column_list(column_name):
+                fill_column_by_ratio(database, column, random_generator)
+        else:
+            group_codes = database.groupby(to_column_list(by), sort=False, dropna=False).ngroup().to_numpy()
+            for column in to_column_list(column_name):
+                fill_column_by_group_ratio(database, column, group_codes, random_generator)
 
     @staticmethod
     @_InputCheckCategorical._combine_categories_checker
@@ -226,17 +248,17 @@ class NBcategorical(object):
         Receives a threshold that is the minimum relative part of the category within the column.
         all categories that are less than this threshold will be combined under the same category
         under the name 'category_name'.
-        the method will return a list with all the name of categories that were combined under 'category_name'
-        with this list the user will be able to make the same action on the test set (assuming that the data
-        was already splitted to train and test sets)
+        the method will return a fitted CategoryCombiner that makes the same action on the test set or
+        on any later batch of data (assuming that the data was already splitted to train and test sets)
 
         Parameters
         ----------
         :param database: pandas Data Frame
         the database must contain the column that was sent to the method 'column_name'
 
-        :param column_name: string
-        The name of the column where method will fill the missing values in.
+        :param column_name: string or list/tuple of strings
+        The name of the column where method will combine the categories in.
+        A list of columns will combine the categories of every column in one call.
         This column must be a categorical column
 
         :param category_name: string
@@ -247,26 +269,24 @@ class NBcategorical(object):
 
         Returns
         -------
-        the method will return a list with all the name of categories that were combined under 'category_name'
-        with this list the user will be able to make the same action on the test set (assuming that the data
-        was already splitted to train and test sets)
+        the method will return a fitted CategoryCombiner.
+        with the combiner the user will be able to make the same action on the test set (assuming that the data
+        was already splitted to train and test sets).
+        The names of the categories that were combined are in 'combiner.combined_categories_[column_name]'
 
-        for exemple: (LIST - the returned list from the function)
-        X_test["column_name"].replace(LIST, category_name, inplace=True)
+        for exemple: (COMBINER - the returned combiner from the function)
+        COMBINER.transform(X_test)
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
         """
 
-        values_to_combine = database[column_name].value_counts()[
-            database[column_name].value_counts(normalize=True) < threshold].index
-        database[column_name].replace(values_to_combine, category_name, inplace=True)
-        return values_to_combine
+        return CategoryCombiner(category_name, threshold).fit_transform(database, column_name)
 
     @staticmethod
     @_InputCheckCategorical._categories_not_in_common_checker
-    def categories_not_in_common(train, test, column_name):
+    def categories_not_in_common(train, test, column_name=None, align=False):
         """
         General Information
         ----------
@@ -274,9 +294,10 @@ class NBcategorical(object):
         check if one categories is missing in the data sets.
         It will check all categories name of the two data sets and returns the name of the categories not
         in common for every data set.
-        The information from this method will be returned as list of tuples:
-            [(exists only in the first data set),(exists only in the second data set)]
-        will also print every list as a message to the user.
+        The categories of every column are de-duplicated before comparing, thus the check is made on the
+        unique categories and not on every row.
+        With 'align' both data sets are cast to a shared CategoricalDtype per column, so encoding them
+        results in identically shaped matrices.
 
         Parameters
         ----------
@@ -286,35 +307,55 @@ class NBcategorical(object):
         :param test: pandas Data Frame
         Second data set to check columns names from
 
-        :param column_name: string
-        The name of the column to preform the check.
-        This column must be a categorical column
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to preform the check, or a list of columns.
+        If None will check all the non-numeric columns of the first data set that are in the second data set.
+        The columns must be categorical columns
+
+        :param align: bool
+        If True both data sets are cast inplace to a shared CategoricalDtype per column with the categories
+        of both data sets.
 
         :return:
-        The information from this method will be returned as list of tuples:
-            [(exists only in the first data set),(exists only in the second data set)]
+        The information from this method will be returned as a dictionary:
+            {column name: ([exists only in the first data set], [exists only in the second data set])}
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
         """
 
-        in_test = set(test[column_name]) - set(train[column_name])
-        in_train = set(train[column_name]) - set(test[column_name])
-        print(constance_object.FIRST.format(in_test))
-        print(constance_object.SECOND.format(in_train))
+        if column_name is None:
+            numeric_columns = list(train._get_numeric_data().columns)
+            column_name = [col for col in train.columns if col not in numeric_columns and col in test.columns]
+
+        not_in_common = {}
+        for column in to_column_list(column_name):
+            train_categories = unique_categories(train[column])
+            test_categories = unique_categories(test[column])
+            only_in_train = train_categories.difference(test_categories, sort=False)
+            only_in_test = test_categories.difference(train_categories, sort=False)
+            not_in_common[column] = (only_in_train.tolist(), only_in_test.tolist())
+
+            if align:
+                shared_dtype = pd.CategoricalDtype(train_categories.append(only_in_test))
+                train[column] = train[column].astype(shared_dtype)
+                test[column] = test[column].astype(shared_dtype)
+
+        return not_in_common
 
     @staticmethod
     @_InputCheckCategorical._category_ratio_checker
-    def category_ratio(database, columns_to_check=None, num_categories=5):
+    def category_ratio(database, columns_to_check=None, num_categories=5, style=False, n_jobs=None, profile=None):
         """
         General Information
         ----------
         Returns a data base with categories and their ratio of appearance in the column.
         The user can input a list of columns to check or the method will return all the columns categories ratio.
         The user can choose how many *top* categories will be returned.
-        Categories with value over 90% will be marked in red to raise a flag that the data
-        is imbalanced.
+        The ratios are computed with a single value_counts per column, the columns can be computed in parallel.
+        With 'style' the ratios are returned as a styled table where categories with value over 90%
+        will be marked in red to raise a flag that the data is imbalanced.
 
         Parameters
         ----------
@@ -325,47 +366,62 @@ class NBcategorical(object):
         The column name that the user wishes to check the categories ratio in.
         All column names must be in the database.
 
-
         :param num_categories: int
         The number of top categories that will be plotted.
-        If the number is higher than the number of categories than will insert '0.00'
+        If the number is higher than the number of categories than the styled table will insert '0.00'
+
+        :param style: bool
+        If True returns a styled table (a row per column, a cell per top category) instead of the long data frame.
+
+        :param n_jobs: int or None
+        Number of threads that compute the columns in parallel. None for one thread, -1 for all the cpus.
+
+        :param profile: DatasetProfile or None
+        A profile of the database (see 'NBgeneral.profile') with at least 'num_categories' top categories -
+        the ratios are read from it instead of scanning the database again.
 
         :return:
-        The information from this method will be returned as list of tuples:
-            [(exists only in the first data set),(exists only in the second data set)]
+        A numeric long format data frame with the columns: column, category, ratio (0-1) and rank (1 is the
+        most common category), or a pandas Styler if 'style' is True.
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
         """
 
-        category_ratio_df = pd.DataFrame()
         if not columns_to_check:
-            columns_to_check = database.columns
-
-        for column_name in columns_to_check:
-            name = database[column_name].value_counts(normalize=True).index
-            values = database[column_name].value_counts(normalize=True).values
-            val_count_temp = [f"{category} : {round(frequent * 100, 2)}%" for category, frequent in zip(name, values)]
-            if len(val_count_temp) < num_categories:
-                val_count = ['0.00'] * num_categories
-                val_count[:len(val_count_temp)] = val_count_temp
-            else:
-                val_count = val_count_temp[:num_categories]
-            category_ratio_df[column_name] = val_count
-        return category_ratio_df.transpose().style.applymap(color_imbalanced)
-
-    # todo: debug
+            columns_to_check = list(database.columns)
+
+        if profile is not None:
+            category_ratio_df = profile.category_ratio(columns_to_check, num_categories)
+        else:
+            category_ratio_df = pd.concat(parallel_map(lambda column_name:
+                                                       column_category_ratio(database[column_name], num_categories),
+                                                       columns_to_check, n_jobs), ignore_index=True)
+        if not style:
+            return category_ratio_df
+
+        # a row per column and a cell per rank, the colors are computed from the numeric ratios
+        category_ratio_df["position"] = category_ratio_df["rank"] - 1
+        category_ratio_df["label"] = category_ratio_df["category"].astype(str) + " : " + \
+            (category_ratio_df["ratio"] * 100).round(2).astype(str) + "%"
+        wide_ratio = category_ratio_df.pivot(index="column", columns="position", values="ratio") \
+            .reindex(index=columns_to_check, columns=range(num_categories)).fillna(0)
+        wide_label = category_ratio_df.pivot(index="column", columns="position", values="label") \
+            .reindex(index=columns_to_check, columns=range(num_categories)).fillna("0.00")
+        return wide_label.style.apply(lambda _: color_imbalanced(wide_ratio), axis=None)
+
     @staticmethod
     @_InputCheckCategorical._label_encoder_features_checker
-    def label_encoder_features(database, features_to_encode):
+    def label_encoder_features(database, features_to_encode, n_jobs=None):
         """
         General Information
         ----------
-        Encode features in the giving database using LabelEncoder() from sklearn.
-        Will preform encoding on all giving features and returns a dictionary with all the different
-        encoders where the ket is the feature name and the value is the LabelEncoder instance fitted
-        to that feature. Thus, the user is able to un-encode the feature when necessary.
+        Encode features in the giving database using a CategoryEncoder.
+        Will preform encoding on all giving features inplace and returns the fitted CategoryEncoder.
+        The categories are factorized by hashing (no sorting), the codes are stored in the smallest sufficient
+        integer dtype and missing values are encoded to -1.
+        Thus, the user is able to encode the test set and to un-encode the features when necessary.
 
         Parameters
         ----------
@@ -376,41 +432,34 @@ class NBcategorical(object):
         The column names that the user wishes to encode.
         All column names must be in the database and categorical/
 
+        :param n_jobs: int or None
+        Number of threads that encode the features in parallel. None for one thread, -1 for all the cpus.
+
         :return:
-        returns a dictionary with all the different
-        encoders where the ket is the feature name and the value is the LabelEncoder instance fitted
-        to that feature. Thus, the user is able to un-encode the feature when necessary.
+        returns the fitted CategoryEncoder.
+        with 'encoder.transform(X_test)' the same encoding is made on the test set - unseen categories are
+        encoded to -2, and with 'encoder.inverse_transform(database)' the features are un-encoded
+        (-1 to a missing value and -2 to '<unknown>').
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
         """
 
-        label_encoder_dict = {}
-
-        for feat in features_to_encode:
-            le = LabelEncoder()
-
-            # fit the feature that we want to encode and tresform to numeric categories
-            database[feat] = le.fit_transform(database[feat])
-
-            print(f"for feature {feat} the categories are:\n", database[feat].value_counts().index)
-
-            label_encoder_dict[feat] = le
-
-        return label_encoder_dict
+        return CategoryEncoder().fit_transform(database, features_to_encode, n_jobs)
 
     @staticmethod
     @_InputCheckCategorical._OHE_checker
-    def OHE(database, features_list=None):
+    def OHE(database, features_list=None, policy=None, sparse=False, encoder=None, return_report=False):
         """
         General Information
         ----------
-        Encode features in the giving database using get_dummies() from pandas.
+        Encode features in the giving database using a CategoryOneHotEncoder.
         Will preform one hot encoding on all giving features or if non were given will preform on all non-numeric
         features in the database.
-        Will check with the user that agree to add num of features
+        Will consult the execution policy with the num of added features and their estimated memory
         Return the encoded database and the name of the original features that was encoded
+        (and an ActionReport if return_report)
 
         Parameters
         ----------
@@ -421,33 +470,59 @@ class NBcategorical(object):
         The column names that the user wishes to encode.
         All column names must be in the database and categorical/
 
+        :param policy: ExecutionPolicy or string - 'prompt', 'confirm', 'reject' or 'threshold'
+        The policy that approves the action. If None the package execution policy will be used.
+
+        :param sparse: bool
+        If True the encoded features are added as pandas sparse columns with uint8 values,
+        otherwise as dense uint8 columns.
+
+        :param encoder: fitted CategoryOneHotEncoder or None
+        An encoder that was fitted on another data set (e.g. the train set), the database will be encoded
+        to exactly the same columns. If None a new encoder is fitted on the database.
+
+        :param return_report: bool
+        If True an ActionReport is returned as a third value.
+
         :return:
-        the encoded database and the name of the original features that was encoded
+        the encoded database and the name of the original features that was encoded.
+        If return_report also an ActionReport with the number of features that were (or would have been) added,
+        the fitted encoder is in 'report.details["encoder"]' to encode the test set to the same columns.
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
+        ValueError : If the features list contains numeric features.
         """
-        total_cat = 0
-        user_input = None
+
+        timer = Timer()
+        policy = resolve_policy(policy)
+        if encoder is not None:
+            features_list = list(encoder.categories_)
         # check if one of the columns is numeric
-        if features_list and database[features_list]._get_numeric_data().columns.tolist():
-            return print("features list contains numeric features please check again")
+        elif features_list and database[features_list]._get_numeric_data().columns.tolist():
+            raise ValueError(constance_object.OHE_NUMERIC_FEATURES)
         # all the non-numeric column will be OHE
         elif not features_list:
             numeric_col = list(database._get_numeric_data().columns)
             features_list = [col for col in database.columns if col not in numeric_col]
 
-        # Number of new features
-        for feat in features_list: total_cat += database[feat].nunique()
-        # Make sure that the user aware to the num of added features
-        while user_input != 'n' and user_input != 'y':
-            user_input = input(
-                f"By OHE you will add {total_cat - len(features_list)} "
-                f"features to the database. Do you wish to continue[y/n]:")
-        if user_input == 'n':
-            return database, features_list
-        else:
-            database = pd.get_dummies(database, columns=features_list)
-            return database, features_list
-
+        if encoder is None:
+            encoder = CategoryOneHotEncoder().fit(database, features_list)
+
+        # Make sure that the action approved to add the num of features
+        estimate = encoder.estimate(database)
+        executed = policy.approve(constance_object.OHE_USER_INPUT.format(estimate["features_added"],
+                                                                         round(estimate["dense_bytes"] / 2 ** 20, 2),
+                                                                         round(estimate["sparse_bytes"] / 2 ** 20, 2)),
+                                  features_added=estimate["features_added"])
+        if executed:
+            encoded = encoder.transform(database, encoder.PANDAS if sparse else encoder.DENSE)
+            database = pd.concat([database.drop(columns=features_list), encoded], axis=1)
+
+        estimate["encoder"] = encoder
+        report = ActionReport("OHE", executed, len(database), features_added=estimate["features_added"],
+                              elapsed_seconds=timer.elapsed, details=estimate)
+        if return_report:
+            return database, features_list, report
+        return database, features_list
@@ -0,0 +1,113 @@
+"""
+Fitted object that combines low appearance categories under one category.
+
+The combiner learns once which categories of every column are kept (their ratio is at least 'threshold')
+and applies the same combination to the train set, the test set and every later batch of data.
+Categories that were not seen in fit are combined as well.
+The combination remaps the codes of a categorical column with a lookup array, any other column is masked with
+Series.where and keeps its dtype - no string replace.
+The fitted combiner can be pickled and used when serving a model.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import numpy as np
+import pandas as pd
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src._general_functions import to_column_list
+
+
+class CategoryCombiner(object):
+    """
+    Combine all categories with a ratio under 'threshold' under the same category named 'category_name'.
+
+    Parameters
+    ----------
+    :param category_name: string
+     The name of the new category of the combined categories
+
+    :param threshold: float - 0 < threshold_percentage < 1
+    Threshold that represent the ratio value the categories under it will be combined
+
+    Attributes
+    ----------
+    kept_categories_: dictionary - {column name : pandas Index of the categories that are kept}
+    combined_categories_: dictionary - {column name : pandas Index of the categories that were combined in fit}
+
+    for exemple:
+    combiner = CategoryCombiner("other", 0.01).fit(X_train, ["fuel", "owner"])
+    combiner.transform(X_train)
+    combiner.transform(X_test)
+    """
+
+    def __init__(self, category_name="other", threshold=0.01):
+        _CheckInput._check_column_name(category_name)
+        _CheckInput._check_threshold(threshold)
+        self.category_name = category_name
+        self.threshold = threshold
+        self.kept_categories_ = {}
+        self.combined_categories_ = {}
+
+    def fit(self, database, columns):
+        """
+        Learn the categories to keep for every column in 'columns' (a column name or a list/tuple of names).
+        Returns the fitted combiner.
+        """
+
+        _CheckInput._check_database_input(database)
+        _CheckInput._check_column_names_in_database(columns, database)
+
+        self.kept_categories_ = {}
+        self.combined_categories_ = {}
+        for column_name in to_column_list(columns):
+            categories_ratio = database[column_name].value_counts(normalize=True)
+            to_combine = (categories_ratio < self.threshold).to_numpy()
+            self.kept_categories_[column_name] = pd.Index(categories_ratio.index[~to_combine].to_numpy(dtype=object))
+            self.combined_categories_[column_name] = categories_ratio.index[to_combine]
+        return self
+
+    def transform(self, database):
+        """
+        Combine inplace the categories of all the fitted columns in the given database.
+        Categories that were not kept in fit (including unseen categories) are combined, missing values are kept.
+        """
+
+        _CheckInput._check_database_input(database)
+        if not self.kept_categories_:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
+
+        for column_name, kept_categories in self.kept_categories_.items():
+            _CheckInput._check_column_in_database(column_name, database)
+            database[column_name] = self._combine_column(database[column_name], kept_categories)
+
+    def fit_transform(self, database, columns):
+        """
+        Fit the combiner on 'columns' and combine them inplace in the given database.
+        Returns the fitted combiner.
+        """
+
+        self.fit(database, columns)
+        self.transform(database)
+        return self
+
+    def _combine_column(self, column, kept_categories):
+        codes, uniques = pd.factorize(column)
+
+        output_categories = kept_categories
+        if self.category_name not in kept_categories:
+            output_categories = kept_categories.append(pd.Index([self.category_name], dtype=object))
+
+        # code of every unique value in the output categories, combined values get the code of 'category_name'
+        code_lookup = output_categories.get_indexer(pd.Index(np.asarray(uniques, dtype=object)))
+        if (code_lookup != -1).all():
+            return column
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            code_lookup[code_lookup == -1] = output_categories.get_loc(self.category_name)
+            return pd.Categorical.from_codes(np.append(code_lookup, -1).take(codes), output_categories)
+
+        # Series.where keeps the dtype of the column when 'category_name' fits it (e.g. a number in a numeric column)
+        combined = np.append(code_lookup == -1, False).take(codes)
+        return column.where(~combined, self.category_name)
@@ -0,0 +1,127 @@
+"""
+Fitted label encoder of categorical features.
+
+The encoder factorizes every column by hashing (no sorting of the categories), stores the categories
+of every column and emits the codes in the smallest sufficient integer dtype (int8/int16/int32).
+Missing values are encoded to the reserved code -1 and categories that were not seen in fit to the reserved
+code -2, thus they stay apart - the codes are decoded back from the stored categories, -1 to a missing value
+and -2 to the 'unknown_category' value.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import numpy as np
+import pandas as pd
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src._general_functions import to_column_list, smallest_int_dtype
+from NBprocessing.src._parallel import parallel_map
+
+
+class CategoryEncoder(object):
+    """
+    Encode categorical features to integer codes.
+
+    Parameters
+    ----------
+    :param unknown_category: object
+    The value the code of the categories that were not seen in fit (-2) is decoded to. Default '<unknown>'.
+
+    Attributes
+    ----------
+    categories_: dictionary - {column name : pandas Index of the categories, the position is the code}
+    dtypes_: dictionary - {column name : numpy integer dtype of the codes}
+
+    for exemple:
+    encoder = CategoryEncoder().fit(X_train, ["fuel", "owner"])
+    encoder.transform(X_train)
+    encoder.transform(X_test)
+    encoder.inverse_transform(X_test)
+    """
+
+    MISSING_CODE = -1
+    UNKNOWN_CODE = -2
+    UNKNOWN_CATEGORY = "<unknown>"
+
+    def __init__(self, unknown_category=UNKNOWN_CATEGORY):
+        self.unknown_category = unknown_category
+        self.categories_ = {}
+        self.dtypes_ = {}
+
+    def fit(self, database, columns, n_jobs=None):
+        """
+        Learn the categories of every column in 'columns' (a column name or a list/tuple of names).
+        Returns the fitted encoder.
+        """
+
+        self._fit_factorize(database, columns, n_jobs)
+        return self
+
+    def transform(self, database, n_jobs=None):
+        """
+        Encode inplace all the fitted columns in the given database.
+        Missing values are encoded to -1 and categories that were not seen in fit to -2.
+        """
+
+        self._check_fitted(database)
+        _CheckInput._check_n_jobs(n_jobs)
+        columns = list(self.categories_)
+        codes = parallel_map(lambda column_name: self._encode(column_name, database[column_name]), columns, n_jobs)
+        for column_name, column_codes in zip(columns, codes):
+            database[column_name] = column_codes.astype(self.dtypes_[column_name])
+
+    def fit_transform(self, database, columns, n_jobs=None):
+        """
+        Fit the encoder on 'columns' and encode them inplace in the given database.
+        Returns the fitted encoder.
+        """
+
+        for column_name, column_codes in self._fit_factorize(database, columns, n_jobs).items():
+            database[column_name] = column_codes.astype(self.dtypes_[column_name])
+        return self
+
+    def inverse_transform(self, database):
+        """
+        Decode inplace all the fitted columns in the given database back to their categories.
+        The code -1 is decoded to a missing value and the code -2 to 'unknown_category'.
+        """
+
+        self._check_fitted(database)
+        for column_name, categories in self.categories_.items():
+            # the reserved codes -2 and -1 take the last two values
+            reserved = np.array([self.unknown_category, np.nan], dtype=object)
+            database[column_name] = np.append(categories.to_numpy(dtype=object), reserved) \
+                .take(database[column_name].to_numpy())
+
+    def _encode(self, column_name, column):
+        codes = self.categories_[column_name].get_indexer(column)
+        # get_indexer returns -1 for both - the values that are not missing are unseen categories
+        not_found = np.flatnonzero(codes == self.MISSING_CODE)
+        codes[not_found[~pd.isna(column.to_numpy()[not_found])]] = self.UNKNOWN_CODE
+        return codes
+
+    def _fit_factorize(self, database, columns, n_jobs):
+        _CheckInput._check_database_input(database)
+        _CheckInput._check_column_names_in_database(columns, database)
+        _CheckInput._check_n_jobs(n_jobs)
+
+        columns = to_column_list(columns)
+        factorized = parallel_map(lambda column_name: pd.factorize(database[column_name]), columns, n_jobs)
+
+        self.categories_ = {}
+        self.dtypes_ = {}
+        codes = {}
+        for column_name, (column_codes, uniques) in zip(columns, factorized):
+            self.categories_[column_name] = pd.Index(np.asarray(uniques))
+            self.dtypes_[column_name] = smallest_int_dtype(len(uniques) - 1, self.UNKNOWN_CODE)
+            codes[column_name] = column_codes
+        return codes
+
+    def _check_fitted(self, database):
+        _CheckInput._check_database_input(database)
+        if not self.categories_:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
+        for column_name in self.categories_:
+            _CheckInput._check_column_in_database(column_name, database)
@@ -1,20 +1,91 @@
-import re
+import numpy as np
+import pandas as pd
 from NBprocessing.src import constance_object
 
-def color_imbalanced(raw_input):
+def color_imbalanced(ratio_database):
     """
-    Takes a scalar and returns a string with
-    the css property `'color: red'` for negative
-    strings, black otherwise.
+    Takes a data frame of categories ratios and returns a data frame of the same shape with
+    the css property `'color: red'` for ratios of 90% and above, black otherwise.
     """
 
-    color = constance_object.BLACK
-    if raw_input != "0.00":
-        pattern = re.compile(r'(: )(\d+)')
-        val = int(pattern.search(raw_input)[2])
-        if val >= 90:
-            color =  constance_object.RED
-    return constance_object.OUTPUT.format(color)
+    colors = np.where(ratio_database.to_numpy() >= 0.9, constance_object.OUTPUT.format(constance_object.RED),
+                      constance_object.OUTPUT.format(constance_object.BLACK))
+    return pd.DataFrame(colors, index=ratio_database.index, columns=ratio_database.columns)
 
 
+def column_category_ratio(column, num_categories):
+    """
+    Returns a long format data frame with the ratio and rank of the top 'num_categories' categories of the column.
+    """
+
+    categories_ratio = column.value_counts(normalize=True).iloc[:num_categories]
+    return pd.DataFrame({"column": [column.name] * len(categories_ratio),
+                         "category": categories_ratio.index.to_numpy(dtype=object),
+                         "ratio": categories_ratio.to_numpy(),
+                         "rank": np.arange(1, len(categories_ratio) + 1)})
+
+
+def fill_column_by_ratio(database, column_name, random_generator):
+    """
+    Fill inplace the missing values of a single column by the ratio of the categories in the column.
+    Draws exactly one sample per missing value and writes the samples by position,
+    thus the fill is correct for any index of the database.
+    """
+
+    missing_positions = np.flatnonzero(database[column_name].isna().to_numpy())
+    categories_ratio = database[column_name].value_counts(normalize=True, dropna=True)
+    if not len(missing_positions) or categories_ratio.empty:
+        return
+
+    samples = random_generator.choice(categories_ratio.index.to_numpy(), size=len(missing_positions),
+                                      p=categories_ratio.to_numpy())
+    database.iloc[missing_positions, database.columns.get_loc(column_name)] = samples
+
+
+def fill_column_by_group_ratio(database, column_name, group_codes, random_generator):
+    """
+    Fill inplace the missing values of a single column by the ratio of the categories within every group.
+    'group_codes' is an integer array with the group of every row (from groupby().ngroup()).
+    All the groups are sampled at once: the (group, category) counts are sorted by group, and every missing
+    value draws a uniform number inside the count range of its group (inverse-CDF) that is located with
+    a single searchsorted. Groups without any known value are filled by the ratio of the whole column.
+    """
+
+    category_codes, categories = pd.factorize(database[column_name])
+    missing = category_codes == -1
+    if not missing.any() or not len(categories):
+        return
+
+    known = ~missing
+    n_categories = len(categories)
+    n_groups = int(group_codes.max()) + 1
+    pairs, pair_counts = np.unique(group_codes[known].astype(np.int64) * n_categories + category_codes[known],
+                                   return_counts=True)
+    cumulative_counts = np.cumsum(pair_counts)
+
+    group_totals = np.bincount(group_codes[known], minlength=n_groups)
+    group_offsets = np.concatenate(([0], np.cumsum(group_totals)[:-1]))
+
+    missing_groups = group_codes[missing]
+    sample_codes = np.empty(len(missing_groups), dtype=np.int64)
+
+    in_known_group = group_totals[missing_groups] > 0
+    targets = group_offsets[missing_groups[in_known_group]] + np.floor(
+        random_generator.random(in_known_group.sum()) * group_totals[missing_groups[in_known_group]]).astype(np.int64)
+    sample_codes[in_known_group] = pairs[np.searchsorted(cumulative_counts, targets, side='right')] % n_categories
+
+    if not in_known_group.all():
+        categories_counts = np.bincount(category_codes[known], minlength=n_categories)
+        sample_codes[~in_known_group] = random_generator.choice(n_categories, size=(~in_known_group).sum(),
+                                                                p=categories_counts / categories_counts.sum())
+
+    database.iloc[np.flatnonzero(missing), database.columns.get_loc(column_name)] = \
+        np.asarray(categories.take(sample_codes))
+
+
+def unique_categories(column):
+    """
+    Returns a pandas Index with the unique non-missing categories of the column by order of appearance.
+    """
 
+    return pd.Index(pd.unique(column.dropna().to_numpy()))
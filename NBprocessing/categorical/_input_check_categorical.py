@@ -11,6 +11,8 @@ Good luck
 
 from functools import wraps
 from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src import constance_object
+from NBprocessing.categorical._one_hot_encoder import CategoryOneHotEncoder
 
 class _InputCheckCategorical(object):
     """
@@ -31,12 +33,13 @@ class _InputCheckCategorical(object):
         """
 
         @wraps(func)
-        def wrapper_checker(database, column_name, categories_to_drop):
+        def wrapper_checker(database, column_name, categories_to_drop, policy=None):
             _CheckInput._check_database_input(database)
             _CheckInput._check_column_name(column_name)
             _CheckInput._check_column_in_database(column_name,database)
             _CheckInput._check_list_tuple_None(categories_to_drop)
-            func(database, column_name, categories_to_drop)
+            _CheckInput._check_policy(policy)
+            return func(database, column_name, categories_to_drop, policy)
 
         return wrapper_checker
 
@@ -48,11 +51,13 @@ class _InputCheckCategorical(object):
         """
 
         @wraps(func)
-        def wrapper_checker(database, column_name):
+        def wrapper_checker(database, column_name, random_state=None, by=None):
             _CheckInput._check_database_input(database)
-            _CheckInput._check_column_name(column_name)
-            _CheckInput._check_column_in_database(column_name, database)
-            func(database, column_name)
+            _CheckInput._check_column_names_in_database(column_name, database)
+            _CheckInput._check_random_state(random_state)
+            if by is not None:
+                _CheckInput._check_column_names_in_database(by, database)
+            return func(database, column_name, random_state, by)
         return wrapper_checker
 
     @staticmethod
@@ -65,9 +70,8 @@ class _InputCheckCategorical(object):
         @wraps(func)
         def wrapper_checker(database, column_name, category_name="other", threshold=0.01):
             _CheckInput._check_database_input(database)
-            _CheckInput._check_column_name(column_name)
+            _CheckInput._check_column_names_in_database(column_name, database)
             _CheckInput._check_column_name(category_name)
-            _CheckInput._check_column_in_database(column_name, database)
             _CheckInput._check_threshold(threshold)
             return func(database, column_name, category_name, threshold)
         return wrapper_checker
@@ -80,13 +84,13 @@ class _InputCheckCategorical(object):
         """
 
         @wraps(func)
-        def wrapper_checker(train, test, column_name):
+        def wrapper_checker(train, test, column_name=None, align=False):
             _CheckInput._check_database_input(train)
             _CheckInput._check_database_input(test)
-            _CheckInput._check_column_name(column_name)
-            _CheckInput._check_column_in_database(column_name, train)
-            _CheckInput._check_column_in_database(column_name, test)
-            return func(train, test, column_name)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, train)
+                _CheckInput._check_column_names_in_database(column_name, test)
+            return func(train, test, column_name, align)
 
         return wrapper_checker
 
@@ -98,11 +102,16 @@ class _InputCheckCategorical(object):
         """
 
         @wraps(func)
-        def wrapper_checker(database, columns_to_check=None, num_categories=5):
+        def wrapper_checker(database, columns_to_check=None, num_categories=5, style=False, n_jobs=None,
+                            profile=None):
             _CheckInput._check_database_input(database)
             _CheckInput._check_list_tuple_None(columns_to_check) # todo: replace to a new check - list/tuple/None
+            if columns_to_check:
+                _CheckInput._check_column_names_in_database(columns_to_check, database)
             _CheckInput._check_num_categories(num_categories)
-            return func(database, columns_to_check, num_categories)
+            _CheckInput._check_n_jobs(n_jobs)
+            _CheckInput._check_profile(profile)
+            return func(database, columns_to_check, num_categories, style, n_jobs, profile)
 
         return wrapper_checker
 
@@ -110,16 +119,17 @@ class _InputCheckCategorical(object):
     @staticmethod
     def _label_encoder_features_checker(func):
         """
-        Wrapper function to validate the input for method 'category_ratio'
+        Wrapper function to validate the input for method 'label_encoder_features'
         Will raise Exception if input incorrect
         """
 
         @wraps(func)
-        def wrapper_checker(database, features_to_encode):
+        def wrapper_checker(database, features_to_encode, n_jobs=None):
             _CheckInput._check_database_input(database)
             for column in features_to_encode:
                 _CheckInput._check_column_in_database(column,database)
-            return func(database, features_to_encode)
+            _CheckInput._check_n_jobs(n_jobs)
+            return func(database, features_to_encode, n_jobs)
         return wrapper_checker
 
     @staticmethod
@@ -130,10 +140,16 @@ class _InputCheckCategorical(object):
         """
 
         @wraps(func)
-        def wrapper_checker(database, features_list=None):
+        def wrapper_checker(database, features_list=None, policy=None, sparse=False, encoder=None,
+                            return_report=False):
             _CheckInput._check_database_input(database)
             if features_list:
                 for column in features_list:
                     _CheckInput._check_column_in_database(column,database)
-            return func(database, features_list)
+            _CheckInput._check_policy(policy)
+            if encoder is not None and (not isinstance(encoder, CategoryOneHotEncoder) or not encoder.categories_):
+                raise ValueError(constance_object.CHECK_OHE_ENCODER)
+            if type(return_report) != bool:
+                raise ValueError(constance_object.CHECK_RETURN_REPORT)
+            return func(database, features_list, policy, sparse, encoder, return_report)
         return wrapper_checker
\ No newline at end of file
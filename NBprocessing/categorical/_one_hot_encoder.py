@@ -0,0 +1,161 @@
+"""
+Fitted one hot encoder of categorical features.
+
+The encoder learns the categories of every column in fit (the column schema) and produces the same
+columns for every later data set - categories that were not seen in fit are dropped or put in an
+'unknown' bucket column. The output is a SciPy CSR matrix, pandas sparse columns or dense columns,
+all with uint8 values. The added width and memory can be estimated before encoding.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import numpy as np
+import pandas as pd
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src._general_functions import to_column_list
+
+
+class CategoryOneHotEncoder(object):
+    """
+    One hot encode categorical features with a fixed column schema.
+
+    Parameters
+    ----------
+    :param handle_unknown: string - 'ignore' or 'bucket'
+    'ignore' - a category that was not seen in fit is encoded to zeros in all the columns of its feature.
+    'bucket' - a category that was not seen in fit is encoded to the column '<feature>_unknown'.
+    Missing values are always encoded to zeros, as in pandas get_dummies.
+
+    Attributes
+    ----------
+    categories_: dictionary - {column name : pandas Index of the categories}
+    feature_names_: list of the names of the encoded columns - '<feature>_<category>'
+
+    for exemple:
+    encoder = CategoryOneHotEncoder().fit(X_train, ["fuel", "owner"])
+    train_matrix = encoder.transform(X_train)
+    test_matrix = encoder.transform(X_test)  # same columns as train_matrix
+    """
+
+    IGNORE = "ignore"
+    BUCKET = "bucket"
+    SPARSE = "sparse"
+    PANDAS = "pandas"
+    DENSE = "dense"
+
+    def __init__(self, handle_unknown=IGNORE):
+        if handle_unknown not in (self.IGNORE, self.BUCKET):
+            raise ValueError(constance_object.CHECK_HANDLE_UNKNOWN)
+        self.handle_unknown = handle_unknown
+        self.categories_ = {}
+        self.feature_names_ = []
+
+    def fit(self, database, columns):
+        """
+        Learn the categories of every column in 'columns' (a column name or a list/tuple of names).
+        Returns the fitted encoder.
+        """
+
+        _CheckInput._check_database_input(database)
+        _CheckInput._check_column_names_in_database(columns, database)
+
+        self.categories_ = {}
+        self.feature_names_ = []
+        for column_name in to_column_list(columns):
+            categories = pd.Index(np.asarray(database[column_name].dropna().unique()))
+            try:
+                categories = categories.sort_values()
+            except TypeError:
+                pass
+            self.categories_[column_name] = categories
+            self.feature_names_ += ["{}_{}".format(column_name, category) for category in categories]
+            if self.handle_unknown == self.BUCKET:
+                self.feature_names_.append("{}_unknown".format(column_name))
+        return self
+
+    def estimate(self, database):
+        """
+        Estimate the encoding of the given database without encoding it.
+        Returns a dictionary with:
+            features_added - number of columns that will be added (encoded columns minus the original columns)
+            dense_bytes - memory of the encoded columns as dense uint8 columns
+            sparse_bytes - memory of the encoded columns as a CSR matrix
+        """
+
+        self._check_fitted(database)
+        n_rows = len(database)
+        n_values = int(database[list(self.categories_)].count().sum())
+        return {"features_added": len(self.feature_names_) - len(self.categories_),
+                "dense_bytes": n_rows * len(self.feature_names_),
+                "sparse_bytes": n_values * (np.dtype(np.uint8).itemsize + np.dtype(np.int32).itemsize) +
+                                (n_rows + 1) * np.dtype(np.int32).itemsize}
+
+    def transform(self, database, output=SPARSE):
+        """
+        Encode the fitted columns of the given database. The database is not changed.
+
+        :param output: string - 'sparse', 'pandas' or 'dense'
+        'sparse' - returns a SciPy CSR matrix, the columns are 'feature_names_'.
+        'pandas' - returns a data frame with pandas sparse columns and the index of the database.
+        'dense' - returns a data frame with dense columns and the index of the database.
+        """
+
+        self._check_fitted(database)
+        if output not in (self.SPARSE, self.PANDAS, self.DENSE):
+            raise ValueError(constance_object.CHECK_OHE_OUTPUT)
+
+        indices, valid = self._column_indices(database)
+        n_rows, n_features = len(database), len(self.feature_names_)
+
+        if output == self.DENSE:
+            dense = np.zeros((n_rows, n_features), dtype=np.uint8)
+            dense[np.nonzero(valid)[0], indices[valid]] = 1
+            return pd.DataFrame(dense, index=database.index, columns=self.feature_names_)
+
+        from scipy import sparse
+
+        # every row holds its ones in increasing column order, thus the CSR is built without sorting
+        indptr = np.concatenate(([0], np.cumsum(valid.sum(axis=1))))
+        matrix = sparse.csr_matrix((np.ones(indptr[-1], dtype=np.uint8), indices[valid], indptr),
+                                   shape=(n_rows, n_features))
+        if output == self.SPARSE:
+            return matrix
+        return pd.DataFrame.sparse.from_spmatrix(matrix, index=database.index, columns=self.feature_names_)
+
+    def fit_transform(self, database, columns, output=SPARSE):
+        """
+        Fit the encoder on 'columns' and encode them. Returns the encoded columns as in 'transform'.
+        """
+
+        return self.fit(database, columns).transform(database, output)
+
+    def _column_indices(self, database):
+        """
+        Returns a (rows x features) matrix with the encoded column index of every value
+        and a boolean matrix that is True where the value is encoded to one.
+        """
+
+        indices = np.empty((len(database), len(self.categories_)), dtype=np.int32)
+        valid = np.empty((len(database), len(self.categories_)), dtype=bool)
+        offset = 0
+        for position, (column_name, categories) in enumerate(self.categories_.items()):
+            codes = categories.get_indexer(database[column_name])
+            known = codes != -1
+            if self.handle_unknown == self.BUCKET:
+                unknown = ~known & database[column_name].notna().to_numpy()
+                codes[unknown] = len(categories)
+                known |= unknown
+            indices[:, position] = codes + offset
+            valid[:, position] = known
+            offset += len(categories) + (self.handle_unknown == self.BUCKET)
+        return indices, valid
+
+    def _check_fitted(self, database):
+        _CheckInput._check_database_input(database)
+        if not self.categories_:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
+        for column_name in self.categories_:
+            _CheckInput._check_column_in_database(column_name, database)
@@ -2,28 +2,72 @@
 Generic functions to manipulate continuous features in pandas data frame.
 
 This library include the functions:
-    1. fill_na_timedate(database, column_name):
-        Fill all the missing values in a time-date column with the mean time of the column.
-
-    2. remove_outliers_by_boundaries(database, column_name, bot_qu, top_qu):
-        Remove outliers values from column by top and bottom boundaries.
-        Before removing the indexes will print a message to the user with the number of indexes that
+    1. fill_na_timedate(database, column_name, strategy="midpoint", by=None):
+        Fill all the missing values in one or many time-date columns by the midpoint, the median, forward/backward
+        fill or linear interpolation of the time, computed on the int64 view of the column.
+        With 'by' every group is filled by its own values.
+
+    2. remove_outliers_by_boundaries(database, column_name, bot_qu, top_qu, policy=None):
+        Remove outliers values from one, many or all numeric columns by top and bottom quantile boundaries.
+        Before removing the indexes will consult the execution policy with the number of indexes that
         will be remove and the percent of the database that will be lost.
-        the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
-        If the user choose 'yes' the method will continue to drop the indexes and will
-        plot the new database shape.
+        In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+        Returns an ActionReport with the outcome of the action.
 
     3. get_num_outliers_by_value(database, filter_dict_up, filter_dict_down):
         Prints how many indexes are above the values in the 'filter_dict_up' dictionary and how many indexes are below
         The values in the 'filter_dict_down' dictionary.
         The dictionary keys are the column names while the values are the top/ bottom boundaries.
         Will not conduct the action on all columns - only on columns in keys.
+        Returns the outliers of every column, the exact number of rows that are outliers in at least one column
+        and the overlap matrix between the columns.
 
-    4. remove_outliers_by_value(database, filter_dict_up, filter_dict_down):
+    4. remove_outliers_by_value(database, filter_dict_up, filter_dict_down, policy=None):
         remove all indexes that are above the values in the 'filter_dict_up' dictionary and indexes that are below
         The values in the 'filter_dict_down' dictionary.
         The dictionary keys are the column names while the values are the top/ bottom boundaries.
         Will not conduct the action on all columns - only on columns in keys.
+        Before removing the indexes will consult the execution policy, returns an ActionReport.
+
+    5. quantile_sketches(source, column_name=None, k=200, chunksize=100000, random_state=None):
+        Build a mergeable quantile sketch of one, many or all numeric columns of data that does not fit in memory
+        (a CSV/Parquet file or an iterable of data frames) by reading it chunk by chunk.
+        Sketches of different files or worker processes can be merged and used to get approximate quantiles.
+
+    6. remove_outliers_by_sketches(source, sketches, bot_qu, top_qu, chunksize=100000):
+        Second streaming pass - yields the chunks of the source without the rows that are outside the
+        bottom and top quantile boundaries of the column sketches.
+
+    7. remove_outliers_by_method(database, column_name=None, method='iqr', threshold=None, policy=None, detector=None):
+        Remove outliers from one, many or all numeric columns by the IQR fences, the median absolute deviation
+        or the z-score, computed for all the columns in one vectorized pass.
+        Before removing the indexes will consult the execution policy.
+        Returns an ActionReport with the boundaries and the fitted OutlierDetector that can be reused on new data.
+
+    8. clip_outliers_by_value(database, filter_dict_up=None, filter_dict_down=None):
+        Cap inplace the values above the 'filter_dict_up' values and below the 'filter_dict_down' values
+        instead of removing the rows. Returns the fitted OutlierClipper to reapply on the test set.
+
+    9. clip_outliers_by_boundaries(database, column_name, bot_qu, top_qu):
+        Cap inplace the values of one, many or all numeric columns at their bottom and top quantiles
+        instead of removing the rows. Returns the fitted OutlierClipper to reapply on the test set.
+
+    10. extract_datetime_features(database, column_name, features=None, reference=None):
+        Add the year, month, day, day of week, hour, minute, is-weekend and elapsed-seconds features of one or
+        many time-date columns in one pass of integer arithmetic on the int64 view, with compact int8/int16 dtypes.
+
+    11. discretize(database, column_name=None, n_bins=5, strategy='quantile'):
+        Replace inplace one, many or all numeric columns with their quantile or uniform bin codes.
+        Returns the fitted Discretizer to bin the test set and streaming batches by the same edges.
+
+    12. scale(database, column_name=None, method='standard', dtype=None):
+        Scale inplace one, many or all numeric columns by the standard, min-max or robust method,
+        optionally downcast to float32. Returns the fitted Scaler to scale the test set and to serialize.
+
+    13. correct_skewness(database, column_name=None, method='auto', threshold=0.5, n_jobs=None):
+        Measure the skewness of one, many or all numeric columns in one vectorized pass and transform inplace
+        the skewed columns by log1p, Box-Cox or Yeo-Johnson with lambdas estimated for all the columns together.
+        Returns the fitted SkewCorrector to transform the test set.
 
 
 Created by: Nir Barazida
@@ -32,6 +76,22 @@ Good luck!
 
 from NBprocessing.continuous._input_check_continuous import _InputCheckContinuous
 from NBprocessing.src import constance_object
+from NBprocessing.continuous._general_functions_continuous import DATETIME_FEATURES, outliers_mask_by_value, numeric_columns, \
+    numeric_block, nan_quantiles, outliers_by_value, overlap_matrix, sketch_boundaries, fill_datetime_column, \
+    datetime_features
+from NBprocessing.continuous._quantile_sketch import QuantileSketch
+from NBprocessing.continuous._outlier_detector import OutlierDetector
+from NBprocessing.continuous._outlier_clipper import OutlierClipper
+from NBprocessing.continuous._discretizer import Discretizer
+from NBprocessing.continuous._scaler import Scaler
+from NBprocessing.continuous._skew_corrector import SkewCorrector
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src._execution_policy import ActionReport, Timer, resolve_policy
+from NBprocessing.src._general_functions import remove_rows_by_mask, iter_chunks, get_random_generator, \
+    to_column_list
+
+import numpy as np
+import pandas as pd
 
 
 class NBcontinuous(object):
@@ -39,28 +99,72 @@ class NBcontinuous(object):
     Generic functions to manipulate continuous features in pandas data frame.
 
     This library include the functions:
-        1. fill_na_timedate(database, column_name):
-            Fill all the missing values in a time-date column with the mean time of the column.
-
-        2. remove_outliers_by_boundaries(database, column_name, bot_qu, top_qu):
-            Remove outliers values from column by top and bottom boundaries.
-            Before removing the indexes will print a message to the user with the number of indexes that
+        1. fill_na_timedate(database, column_name, strategy="midpoint", by=None):
+            Fill all the missing values in one or many time-date columns by the midpoint, the median, forward/backward
+            fill or linear interpolation of the time, computed on the int64 view of the column.
+            With 'by' every group is filled by its own values.
+
+        2. remove_outliers_by_boundaries(database, column_name, bot_qu, top_qu, policy=None):
+            Remove outliers values from one, many or all numeric columns by top and bottom quantile boundaries.
+            Before removing the indexes will consult the execution policy with the number of indexes that
             will be remove and the percent of the database that will be lost.
-            the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
-            If the user choose 'yes' the method will continue to drop the indexes and will
-            plot the new database shape.
+            In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+            Returns an ActionReport with the outcome of the action.
 
         3. get_num_outliers_by_value(database, filter_dict_up, filter_dict_down):
             Prints how many indexes are above the values in the 'filter_dict_up' dictionary and how many indexes are below
             The values in the 'filter_dict_down' dictionary.
             The dictionary keys are the column names while the values are the top/ bottom boundaries.
             Will not conduct the action on all columns - only on columns in keys.
+            Returns the outliers of every column, the exact number of rows that are outliers in at least one column
+            and the overlap matrix between the columns.
 
-        4. remove_outliers_by_value(database, filter_dict_up, filter_dict_down):
+        4. remove_outliers_by_value(database, filter_dict_up, filter_dict_down, policy=None):
             remove all indexes that are above the values in the 'filter_dict_up' dictionary and indexes that are below
             The values in the 'filter_dict_down' dictionary.
             The dictionary keys are the column names while the values are the top/ bottom boundaries.
             Will not conduct the action on all columns - only on columns in keys.
+            Before removing the indexes will consult the execution policy, returns an ActionReport.
+
+        5. quantile_sketches(source, column_name=None, k=200, chunksize=100000, random_state=None):
+            Build a mergeable quantile sketch of one, many or all numeric columns of data that does not fit in memory
+            (a CSV/Parquet file or an iterable of data frames) by reading it chunk by chunk.
+            Sketches of different files or worker processes can be merged and used to get approximate quantiles.
+
+        6. remove_outliers_by_sketches(source, sketches, bot_qu, top_qu, chunksize=100000):
+            Second streaming pass - yields the chunks of the source without the rows that are outside the
+            bottom and top quantile boundaries of the column sketches.
+
+        7. remove_outliers_by_method(database, column_name=None, method='iqr', threshold=None, policy=None, detector=None):
+            Remove outliers from one, many or all numeric columns by the IQR fences, the median absolute deviation
+            or the z-score, computed for all the columns in one vectorized pass.
+            Before removing the indexes will consult the execution policy.
+            Returns an ActionReport with the boundaries and the fitted OutlierDetector that can be reused on new data.
+
+        8. clip_outliers_by_value(database, filter_dict_up=None, filter_dict_down=None):
+            Cap inplace the values above the 'filter_dict_up' values and below the 'filter_dict_down' values
+            instead of removing the rows. Returns the fitted OutlierClipper to reapply on the test set.
+
+        9. clip_outliers_by_boundaries(database, column_name, bot_qu, top_qu):
+            Cap inplace the values of one, many or all numeric columns at their bottom and top quantiles
+            instead of removing the rows. Returns the fitted OutlierClipper to reapply on the test set.
+
+        10. extract_datetime_features(database, column_name, features=None, reference=None):
+            Add the year, month, day, day of week, hour, minute, is-weekend and elapsed-seconds features of one or
+            many time-date columns in one pass of integer arithmetic on the int64 view, with compact int8/int16 dtypes.
+
+        11. discretize(database, column_name=None, n_bins=5, strategy='quantile'):
+            Replace inplace one, many or all numeric columns with their quantile or uniform bin codes.
+            Returns the fitted Discretizer to bin the test set and streaming batches by the same edges.
+
+        12. scale(database, column_name=None, method='standard', dtype=None):
+            Scale inplace one, many or all numeric columns by the standard, min-max or robust method,
+            optionally downcast to float32. Returns the fitted Scaler to scale the test set and to serialize.
+
+        13. correct_skewness(database, column_name=None, method='auto', threshold=0.5, n_jobs=None):
+            Measure the skewness of one, many or all numeric columns in one vectorized pass and transform inplace
+            the skewed columns by log1p, Box-Cox or Yeo-Johnson with lambdas estimated for all the columns together.
+            Returns the fitted SkewCorrector to transform the test set.
 
 
     Created by: Nir Barazida
@@ -69,21 +173,34 @@ class NBcontinuous(object):
 
     @staticmethod
     @_InputCheckContinuous._fill_na_timedate_checker
-    def fill_na_timedate(database, column_name):
+    def fill_na_timedate(database, column_name, strategy="midpoint", by=None):
         """
         General Information
         ----------
-        Fill all the missing values in a time-date column with the mean time of the column.
+        Fill all the missing values in one or many time-date columns by the given strategy.
+        All the strategies are computed on the int64 view of the column with a single groupby-transform,
+        thus with 'by' every entity (e.g. every user of an event log) is filled by its own values.
 
         Parameters
         ----------
         :param database: pandas Data Frame
         data set to fill missing values in.
 
-        :param column_name: string
-        The name of the column to preform the check.
+        :param column_name: string or list/tuple of strings
+        The name of the column to preform the check, or a list of columns.
         This column must be a time-date column
 
+        :param strategy: string - 'midpoint', 'median', 'ffill', 'bfill' or 'interpolate'
+            'midpoint' - the middle time between the minimum and the maximum time (the default).
+            'median' - the median time.
+            'ffill' / 'bfill' - the previous / next known time in the row order.
+            'interpolate' - linear interpolation in the row order between the previous and the next known time,
+                            missing values at the edges get the nearest known time.
+
+        :param by: string or list/tuple of strings
+        Column names to group by. If given, the missing values of every group are filled by the values
+        of that group only. A group without any known value is left missing.
+
         Returns
         -------
         None.
@@ -95,17 +212,19 @@ class NBcontinuous(object):
         ValueError : If the column type is not date-time
         """
 
-        start_date = database[column_name].max()
-        end_date = database[column_name].min()
-        missing_date_value = start_date + (end_date - start_date) / 2
+        if by is None:
+            group_codes = np.zeros(len(database), dtype=np.int64)
+        else:
+            group_codes = database.groupby(to_column_list(by), sort=False, dropna=False).ngroup().to_numpy()
 
-        database[column_name].fillna(missing_date_value, inplace=True)
+        for column in to_column_list(column_name):
+            fill_datetime_column(database, column, strategy, group_codes)
 
     @staticmethod
     @_InputCheckContinuous._remove_outliers_by_boundaries_checker
-    def remove_outliers_by_boundaries(database, column_name, bot_qu, top_qu):
+    def remove_outliers_by_boundaries(database, column_name, bot_qu, top_qu, policy=None):
         """
-        Remove outliers values from column by top and bottom boundaries.
+        Remove outliers values from one, many or all numeric columns by top and bottom boundaries.
 
         The theory behind it:
         the number of outliers  will follow a binomial distribution with parameter p, which can generally be
@@ -117,19 +236,23 @@ class NBcontinuous(object):
         Thus, in a normal distribution the top and bottom boundaries should contain 99.7% of the data.
         However, not all data has Normal distribution thus the user is able to change the top and bottom boundaries
 
-        Before removing the indexes will print a message to the user with the number of indexes that
+        The quantiles of all the columns are computed in one vectorized call, a row is an outlier if it is outside
+        the boundaries of at least one column, and all the outliers are removed at once. As in 'Series.between',
+        a missing value in one of the columns is outside the boundaries - its row is removed.
+
+        Before removing the indexes will consult the execution policy with the number of indexes that
         will be remove and the percent of the database that will be lost.
-        the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
-        If the user choose 'yes' the method will continue to drop the indexes and will
-        plot the new database shape.
+        In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+        If the action is approved the method will continue to drop the indexes.
 
         Parameters
         ----------
         :param database: pandas Data Frame
         data set to remove outliers from.
 
-        :param column_name: string
-        The name of the column to preform the check.
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to preform the check, or a list of columns.
+        If None will check all the numeric columns in the database.
         the data type must be numeric
 
         :param bot_qu: float, 0 < bot_qu < 1
@@ -138,33 +261,45 @@ class NBcontinuous(object):
         :param top_qu: float, 0 < top_qu < 1
          upper boundary to remove outliers from - percent in fraction
 
+        :param policy: ExecutionPolicy or string - 'prompt', 'confirm', 'reject' or 'threshold'
+        The policy that approves the action. If None the package execution policy will be used.
+
         Returns
         -------
-        None
+        ActionReport
+        The number of rows that were (or would have been) removed and rather the action was executed.
+        'report.details' holds the 'boundaries' {column name: (bottom, top)} and the 'rows_lost_per_column'.
         preform the action on the database inplace
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
         """
-        try:
-            removed_outliers = database[column_name].between(database[column_name].quantile(bot_qu),
-                                                             database[column_name].quantile(top_qu))
+        timer = Timer()
+        policy = resolve_policy(policy)
+        rows_before = len(database)
+        columns = numeric_columns(database, column_name)
+        block = numeric_block(database, columns)
 
-            drop_row = input(constance_object.DROP_ROW.format(removed_outliers.value_counts()[0],
-                                                              round(removed_outliers.value_counts()[0] * 100 / len(
-                                                                  database), 2)))
+        boundaries = nan_quantiles(block, [bot_qu, top_qu])
+        # NaN is outside the boundaries as in Series.between - rows with missing values are removed
+        outliers = ~((block >= boundaries[0]) & (block <= boundaries[1]))
+        remove_mask = outliers.any(axis=1)
 
-            while drop_row != 'y' and drop_row != 'n':
-                drop_row = input(constance_object.DROP_ROW.format(removed_outliers.value_counts()[0], round(
-                    removed_outliers.value_counts()[0] * 100 / len(database), 2)))
+        rows_lost = int(remove_mask.sum())
+        percent_lost = round(rows_lost * 100 / rows_before, 2) if rows_before else 0.0
 
-            if drop_row == 'y':
-                index_names = database[~removed_outliers].index
-                database.drop(index_names, inplace=True)
+        executed = policy.approve(constance_object.DROP_ROW.format(rows_lost, percent_lost),
+                                  rows_lost=rows_lost, percent_lost=percent_lost)
 
-        except TypeError:
-            print(constance_object.TYPE_ERROR)
+        if executed:
+            remove_rows_by_mask(database, remove_mask)
+
+        details = {"boundaries": {column: (low, high) for column, low, high in zip(columns, *boundaries.tolist())},
+                   "rows_lost_per_column": dict(zip(columns, outliers.sum(axis=0).tolist()))}
+        return ActionReport("remove_outliers_by_boundaries", executed, rows_before, rows_affected=rows_lost,
+                            elapsed_seconds=timer.elapsed, details=details)
 
     @staticmethod
     @_InputCheckContinuous._remove_and_get_num_outliers_by_value_checker
@@ -174,6 +309,8 @@ class NBcontinuous(object):
         The values in the 'filter_dict_down' dictionary.
         The dictionary keys are the column names while the values are the top/ bottom boundaries.
         Will not conduct the action on all columns - only on columns in keys.
+        Every comparison is evaluated once on a 2-D NumPy block of the filtered columns, and a row that is
+        an outlier in several columns is counted once in the total.
 
         Parameters
         ----------
@@ -190,7 +327,10 @@ class NBcontinuous(object):
 
         Returns
         -------
-        None
+        dictionary with:
+            'per_column' - data frame with the number of outliers 'above', 'under' and 'total' of every column
+            'union' - the exact number of rows that are outliers in at least one column
+            'overlap' - data frame (columns x columns) with the number of rows that are outliers in both columns
         print the number of indexes that will be lost using the top and bottom boundaries
 
         Raises
@@ -198,34 +338,47 @@ class NBcontinuous(object):
         ValueError : If input value not as mentioned above.
         """
         try:
-            sum_row = 0
-            if filter_dict_up:
-                print(constance_object.OUTLIERS_ABOVE)
-                for col, outlier_value in filter_dict_up.items():
-                    print(constance_object.SUM_OUTLIERS_ABOVE.format(col,(database[col] > outlier_value).sum()))
-                    sum_row += (database[col] > outlier_value).sum()
-
-            if filter_dict_down:
-                print(constance_object.OUTLIERS_UNDER)
-                for col, outlier_value in filter_dict_down.items():
-                    print(constance_object.SUM_OUTLIERS_UNDER.format(col,(database[col] < outlier_value).sum()))
-                    sum_row += (database[col] < outlier_value).sum()
-            print(constance_object.SUM_OUTLIERS_TOT.format(sum_row,round((sum_row * 100) / len(database), 2)))
-
+            columns, above, under = outliers_by_value(database, filter_dict_up, filter_dict_down)
         except KeyError:
             print(constance_object.KEY_ERROR)
-        except TypeError:
+            return
+        except ValueError:
             print(constance_object.TYPE_ERROR)
+            return
+
+        outliers = above | under
+        per_column = pd.DataFrame({"above": above.sum(axis=0), "under": under.sum(axis=0),
+                                   "total": outliers.sum(axis=0)}, index=columns)
+        union = int(outliers.any(axis=1).sum())
+
+        if filter_dict_up:
+            print(constance_object.OUTLIERS_ABOVE)
+            for col in filter_dict_up:
+                print(constance_object.SUM_OUTLIERS_ABOVE.format(col, per_column.at[col, "above"]))
+
+        if filter_dict_down:
+            print(constance_object.OUTLIERS_UNDER)
+            for col in filter_dict_down:
+                print(constance_object.SUM_OUTLIERS_UNDER.format(col, per_column.at[col, "under"]))
+        print(constance_object.SUM_OUTLIERS_TOT.format(union, round((union * 100) / len(database), 2)
+                                                       if len(database) else 0.0))
+
+        return {"per_column": per_column, "union": union,
+                "overlap": pd.DataFrame(overlap_matrix(outliers), index=columns, columns=columns)}
 
     @staticmethod
-    @_InputCheckContinuous._remove_and_get_num_outliers_by_value_checker
-    def remove_outliers_by_value(database, filter_dict_up=None, filter_dict_down=None):
+    @_InputCheckContinuous._remove_outliers_by_value_checker
+    def remove_outliers_by_value(database, filter_dict_up=None, filter_dict_down=None, policy=None):
         """
         remove all indexes that are above the values in the 'filter_dict_up' dictionary and indexes that are below
         The values in the 'filter_dict_down' dictionary.
         The dictionary keys are the column names while the values are the top/ bottom boundaries.
         Will not conduct the action on all columns - only on columns in keys.
 
+        Before removing the indexes will consult the execution policy with the number of indexes that
+        will be remove and the percent of the database that will be lost.
+        In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+
         Parameters
         ----------
         :param database: pandas Data Frame
@@ -239,36 +392,498 @@ class NBcontinuous(object):
         dictionary with features as keys and values to filter from then and down as values.
         the column value type must be numeric.
 
+        :param policy: ExecutionPolicy or string - 'prompt', 'confirm', 'reject' or 'threshold'
+        The policy that approves the action. If None the package execution policy will be used.
+
         Returns
         -------
-        None
+        ActionReport
+        The number of rows that were (or would have been) removed and rather the action was executed.
         remove indexes by top and bottom boundaries in the database inplace
-        print the data shape before after conduction the action, and the percent of the data that was lost
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
         """
 
+        timer = Timer()
         try:
-            print(constance_object.SHAPE_BEFORE.format(database.shape))
-            before = database.shape[0]
+            policy = resolve_policy(policy)
+            rows_before = len(database)
+            # outliers that crates head tail and back tail are removed in a single removal
+            remove_mask = outliers_mask_by_value(database, filter_dict_up, filter_dict_down)
+            rows_lost = int(remove_mask.sum())
+            percent_lost = round(rows_lost * 100 / rows_before, 2) if rows_before else 0.0
 
-            # delete outliers that crates head tail
-            if filter_dict_up:
-                for col, outlier_value in filter_dict_up.items():
-                    database.drop(database.loc[database[col] > outlier_value].index, inplace=True)
+            executed = policy.approve(constance_object.DROP_ROW.format(rows_lost, percent_lost),
+                                      rows_lost=rows_lost, percent_lost=percent_lost)
 
-            # delete outliers that crates back tail
-            if filter_dict_down:
-                for col, outlier_value in filter_dict_down.items():
-                    database.drop(database.loc[database[col] < outlier_value].index, inplace=True)
+            if executed:
+                remove_rows_by_mask(database, remove_mask)
 
-            print(constance_object.SHAPE_AFTER.format(database.shape))
-            after = database.shape[0]
-            print(constance_object.DATA_LOST.format(before - after,round((before - after) * 100 / before, 2)))
+            return ActionReport("remove_outliers_by_value", executed, rows_before, rows_affected=rows_lost,
+                                elapsed_seconds=timer.elapsed)
 
         except KeyError:
             print(constance_object.KEY_ERROR)
-        except TypeError:
+        except (TypeError, ValueError):
             print(constance_object.TYPE_ERROR)
+
+    @staticmethod
+    @_InputCheckContinuous._quantile_sketches_checker
+    def quantile_sketches(source, column_name=None, k=200, chunksize=100000, random_state=None):
+        """
+        General Information
+        ----------
+        Build a mergeable quantile sketch (KLL) of one, many or all numeric columns of data that does not
+        fit in memory by reading it chunk by chunk - the first streaming pass of out-of-core outlier removal.
+        Only O(k) values of every column are kept in memory. The sketches of different files or worker
+        processes can be merged with 'sketch.merge(other)' and pickled between processes.
+
+        Accuracy: the rank error of a quantile of the sketch is O(1 / k) of the number of values with high
+        probability - for the default k=200 the true rank is within ~1.5% of the requested quantile.
+
+        Parameters
+        ----------
+        :param source: string path, pandas Data Frame or iterable of pandas Data Frames
+        Path to a CSV file or a Parquet file ('.parquet' / '.pq', requires pyarrow), a data frame
+        or an iterable of data frames (e.g. pd.read_csv(path, chunksize=...)).
+
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to sketch, or a list of columns.
+        If None will sketch all the numeric columns of the first chunk.
+        the data type must be numeric
+
+        :param k: int, k >= 8
+        Size parameter of the sketches, a higher k is more accurate and uses more memory.
+
+        :param chunksize: int
+        Number of rows to read in every chunk of a file or a data frame.
+
+        :param random_state: int, numpy Generator or None
+        Seed of the random compaction of the sketches.
+
+        Returns
+        -------
+        dictionary - {column name : QuantileSketch}
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
+        NameError : If a column is not in a chunk.
+        """
+
+        random_generator = get_random_generator(random_state)
+        sketches = {}
+        columns = None
+        # only the sketched columns are read from a file, all the columns if None (their type is not known yet)
+        read_columns = None if column_name is None else to_column_list(column_name)
+        for chunk in iter_chunks(source, chunksize, read_columns):
+            if columns is None:
+                columns = numeric_columns(chunk, column_name)
+                sketches = {column: QuantileSketch(k, random_generator) for column in columns}
+            _CheckInput._check_column_names_in_database(columns, chunk)
+            block = numeric_block(chunk, columns)
+            for position, column in enumerate(columns):
+                sketches[column].update(block[:, position])
+        return sketches
+
+    @staticmethod
+    @_InputCheckContinuous._remove_outliers_by_sketches_checker
+    def remove_outliers_by_sketches(source, sketches, bot_qu, top_qu, chunksize=100000):
+        """
+        General Information
+        ----------
+        Second streaming pass of out-of-core outlier removal - yields the chunks of the source without the rows
+        that are below the 'bot_qu' quantile or above the 'top_qu' quantile of the sketch of at least one column.
+        The boundaries are computed once from the (merged) sketches of 'quantile_sketches'.
+        Missing values are not outliers.
+
+        Parameters
+        ----------
+        :param source: string path, pandas Data Frame or iterable of pandas Data Frames
+        The same source that was sketched, as in 'quantile_sketches'.
+
+        :param sketches: dictionary - {column name : QuantileSketch}
+        The sketches of the columns to filter by.
+
+        :param bot_qu: float, 0 < bot_qu < 1
+         bottom boundary to remove outliers from - percent in fraction
+
+        :param top_qu: float, 0 < top_qu < 1
+         upper boundary to remove outliers from - percent in fraction
+
+        :param chunksize: int
+        Number of rows to read in every chunk of a file or a data frame.
+
+        Returns
+        -------
+        generator of pandas Data Frames - the chunks without the outliers.
+
+        for exemple:
+        sketches = NBcontinuous.quantile_sketches("data.csv", ["price", "km"])
+        for chunk in NBcontinuous.remove_outliers_by_sketches("data.csv", sketches, 0.01, 0.99):
+            chunk.to_csv("clean.csv", mode="a", header=False)
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
+        """
+
+        filter_dict_up, filter_dict_down = sketch_boundaries(sketches, bot_qu, top_qu)
+        for chunk in iter_chunks(source, chunksize):
+            yield chunk[~outliers_mask_by_value(chunk, filter_dict_up, filter_dict_down)]
+
+    @staticmethod
+    @_InputCheckContinuous._remove_outliers_by_method_checker
+    def remove_outliers_by_method(database, column_name=None, method="iqr", threshold=None, policy=None,
+                                  detector=None):
+        """
+        General Information
+        ----------
+        Remove outliers from one, many or all numeric columns by a robust statistical method:
+            'iqr' - Tukey fences: below Q1 - threshold * IQR or above Q3 + threshold * IQR (default threshold 1.5).
+            'mad' - modified z-score: |x - median| * 0.6745 / MAD above threshold (default threshold 3.5).
+            'zscore' - |x - mean| / std above threshold (default threshold 3).
+        The statistics of all the columns are computed in one vectorized pass, a row is an outlier if it is
+        outside the boundaries of at least one column, and all the outliers are removed at once.
+        Missing values are not outliers.
+
+        Before removing the indexes will consult the execution policy with the number of indexes that
+        will be remove and the percent of the database that will be lost.
+        In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+        data set to remove outliers from.
+
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to preform the check, or a list of columns.
+        If None will check all the numeric columns in the database.
+        the data type must be numeric
+
+        :param method: string - 'iqr', 'mad' or 'zscore'
+        The statistic the boundaries are computed by.
+
+        :param threshold: positive float or None
+        If None the default threshold of the method is used.
+
+        :param policy: ExecutionPolicy or string - 'prompt', 'confirm', 'reject' or 'threshold'
+        The policy that approves the action. If None the package execution policy will be used.
+
+        :param detector: fitted OutlierDetector or None
+        If given its boundaries are used (e.g. the boundaries of the train set on the test set)
+        and column_name, method and threshold are ignored.
+
+        Returns
+        -------
+        ActionReport
+        The number of rows that were (or would have been) removed and rather the action was executed.
+        'report.details' holds the 'boundaries' {column name: (bottom, top)}, the 'rows_lost_per_column'
+        and the fitted 'detector'.
+        preform the action on the database inplace
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
+        """
+
+        timer = Timer()
+        policy = resolve_policy(policy)
+        rows_before = len(database)
+        if detector is None:
+            detector = OutlierDetector(method, threshold).fit(database, column_name)
+
+        outliers = detector.outliers(database)
+        remove_mask = outliers.to_numpy().any(axis=1)
+        rows_lost = int(remove_mask.sum())
+        percent_lost = round(rows_lost * 100 / rows_before, 2) if rows_before else 0.0
+
+        executed = policy.approve(constance_object.DROP_ROW.format(rows_lost, percent_lost),
+                                  rows_lost=rows_lost, percent_lost=percent_lost)
+
+        if executed:
+            remove_rows_by_mask(database, remove_mask)
+
+        details = {"boundaries": dict(detector.boundaries_),
+                   "rows_lost_per_column": outliers.sum(axis=0).to_dict(),
+                   "detector": detector}
+        return ActionReport("remove_outliers_by_method", executed, rows_before, rows_affected=rows_lost,
+                            elapsed_seconds=timer.elapsed, details=details)
+
+    @staticmethod
+    @_InputCheckContinuous._remove_and_get_num_outliers_by_value_checker
+    def clip_outliers_by_value(database, filter_dict_up=None, filter_dict_down=None):
+        """
+        General Information
+        ----------
+        Cap (winsorize) inplace all the values that are above the values in the 'filter_dict_up' dictionary
+        at them and all the values that are below the values in the 'filter_dict_down' dictionary at them.
+        A copy free alternative to 'remove_outliers_by_value' - no row is lost and the frame is not reallocated,
+        every NumPy dtype column is clipped with np.clip on its underlying array (a column of an extension dtype
+        or under pandas copy on write is replaced by its clipped copy).
+        The dictionary keys are the column names while the values are the top/ bottom boundaries.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+        data set to clip outliers in.
+
+        :param filter_dict_up: dictionary - {column name : top boundary}
+        the column value type must be numeric.
+
+        :param filter_dict_down: dictionary - {column name : bottom boundary}
+        the column value type must be numeric.
+
+        Returns
+        -------
+        OutlierClipper
+        The fitted clipper with the 'boundaries_', call 'clipper.transform(X_test)' to clip the test set
+        preform the action on the database inplace
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
+        NameError : If a column is not in the database.
+        """
+
+        clipper = OutlierClipper().fit_values(filter_dict_up, filter_dict_down)
+        clipper.transform(database)
+        return clipper
+
+    @staticmethod
+    @_InputCheckContinuous._clip_outliers_by_boundaries_checker
+    def clip_outliers_by_boundaries(database, column_name, bot_qu, top_qu):
+        """
+        General Information
+        ----------
+        Cap (winsorize) inplace the values of one, many or all numeric columns at their 'bot_qu' and 'top_qu'
+        quantiles. A copy free alternative to 'remove_outliers_by_boundaries' - no row is lost and the frame
+        is not reallocated (a column of an extension dtype or under pandas copy on write is replaced by its
+        clipped copy). The quantiles of all the columns are computed in one vectorized call.
+        The boundaries of an integer column are rounded inwards to keep its dtype. Missing values are kept.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+        data set to clip outliers in.
+
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to clip, or a list of columns.
+        If None will clip all the numeric columns in the database.
+        the data type must be numeric
+
+        :param bot_qu: float, 0 < bot_qu < 1
+         bottom quantile to clip the values at - percent in fraction
+
+        :param top_qu: float, 0 < top_qu < 1
+         upper quantile to clip the values at - percent in fraction
+
+        Returns
+        -------
+        OutlierClipper
+        The fitted clipper with the 'boundaries_', call 'clipper.transform(X_test)' to clip the test set
+        by the quantiles of the train set
+        preform the action on the database inplace
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
+        """
+
+        clipper = OutlierClipper().fit_quantiles(database, column_name, bot_qu, top_qu)
+        clipper.transform(database)
+        return clipper
+
+    @staticmethod
+    @_InputCheckContinuous._extract_datetime_features_checker
+    def extract_datetime_features(database, column_name, features=None, reference=None):
+        """
+        General Information
+        ----------
+        Expand one or many time-date columns into date-time features in one pass.
+        The features are computed with integer arithmetic on the int64 view of the column (the wall time
+        of a tz-aware column) instead of one '.dt' accessor call per feature, and are added to the database
+        as the columns '<column>_<feature>'.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+        data set to add the features to.
+
+        :param column_name: string or list/tuple of strings
+        The name of the column to expand, or a list of columns.
+        This column must be a time-date column
+
+        :param features: list/tuple of strings or None
+        The features to add, if None all of them:
+            'year' - int16
+            'month', 'day', 'dayofweek' (Monday is 0), 'hour', 'minute' - int8
+            'is_weekend' - bool
+            'elapsed_seconds' - int64, whole seconds since 'reference'
+        If the column has missing values the features get the nullable dtypes (Int8, Int16, boolean, Int64).
+
+        :param reference: string, pandas Timestamp or None
+        The time the 'elapsed_seconds' are counted from. If None the Unix epoch (1970-01-01).
+
+        Returns
+        -------
+        list of the names of the added columns
+        preform the action on the database inplace
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column type is not date-time
+        """
+
+        features = DATETIME_FEATURES if features is None else features
+        added_columns = []
+        for column in to_column_list(column_name):
+            for feature, values in datetime_features(database[column], features, reference).items():
+                feature_name = "{}_{}".format(column, feature)
+                database[feature_name] = values
+                added_columns.append(feature_name)
+        return added_columns
+
+    @staticmethod
+    @_InputCheckContinuous._discretize_checker
+    def discretize(database, column_name=None, n_bins=5, strategy="quantile"):
+        """
+        General Information
+        ----------
+        Replace inplace one, many or all numeric columns with their bin codes.
+        The bin edges of all the columns are learned in one vectorized quantile (or min/max) call and the values
+        are binned with np.searchsorted - no Interval objects as in pd.qcut. The codes are emitted in the smallest
+        sufficient integer dtype (int8 for up to 127 bins), missing values get the code -1.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+        data set to discretize.
+
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to discretize, or a list of columns.
+        If None will discretize all the numeric columns in the database.
+        the data type must be numeric
+
+        :param n_bins: int, n_bins >= 2
+        The number of bins of every column. Equal quantile edges are merged.
+
+        :param strategy: string - 'quantile' or 'uniform'
+        'quantile' - every bin holds the same number of values (as pd.qcut).
+        'uniform' - all the bins have the same width (as pd.cut).
+
+        Returns
+        -------
+        Discretizer
+        The fitted discretizer with the 'bin_edges_', call 'discretizer.transform(X_test)' to bin the test set
+        preform the action on the database inplace
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
+        """
+
+        return Discretizer(n_bins, strategy).fit_transform(database, column_name)
+
+    @staticmethod
+    @_InputCheckContinuous._scale_checker
+    def scale(database, column_name=None, method="standard", dtype=None):
+        """
+        General Information
+        ----------
+        Scale inplace one, many or all numeric columns to (x - center) / scale.
+        The parameters of all the columns are computed in one NaN-aware vectorized pass, and every float column
+        is scaled in its own array of the frame (no float64 copy of the database as in sklearn scalers).
+        With dtype='float32' the scaled columns take half of the memory.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+        data set to scale.
+
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to scale, or a list of columns.
+        If None will scale all the numeric columns in the database.
+        the data type must be numeric
+
+        :param method: string - 'standard', 'minmax' or 'robust'
+        'standard' - (x - mean) / standard deviation.
+        'minmax' - (x - minimum) / (maximum - minimum).
+        'robust' - (x - median) / interquartile range.
+
+        :param dtype: string, numpy float dtype or None
+        The dtype of the scaled columns, e.g. 'float32'. If None float columns keep their dtype
+        and integer columns are scaled to float64.
+
+        Returns
+        -------
+        Scaler
+        The fitted scaler, call 'scaler.transform(X_test)' to scale the test set and 'scaler.to_dict()'
+        to serialize its parameters
+        preform the action on the database inplace
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
+        """
+
+        return Scaler(method, dtype).fit_transform(database, column_name)
+
+    @staticmethod
+    @_InputCheckContinuous._correct_skewness_checker
+    def correct_skewness(database, column_name=None, method="auto", threshold=0.5, n_jobs=None):
+        """
+        General Information
+        ----------
+        Measure the skewness of one, many or all numeric columns in one vectorized NaN-aware pass, and transform
+        inplace only the columns with an absolute skewness above 'threshold' by a power transform.
+        The lambdas of all the Box-Cox / Yeo-Johnson columns are estimated together by a vectorized maximum
+        likelihood search (and chunks of columns in parallel with 'n_jobs'), thus a 500 columns frame is
+        corrected in seconds.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+        data set to correct.
+
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to check, or a list of columns.
+        If None will check all the numeric columns in the database.
+        the data type must be numeric
+
+        :param method: string - 'auto', 'log1p', 'boxcox' or 'yeo-johnson'
+        The transform of the skewed columns.
+        'auto' - Box-Cox for a column with positive values only, otherwise Yeo-Johnson.
+
+        :param threshold: float, threshold >= 0
+        Only columns with an absolute skewness above the threshold are transformed.
+
+        :param n_jobs: int or None
+        Number of threads to estimate and transform chunks of columns with. -1 for all the cpus.
+
+        Returns
+        -------
+        SkewCorrector
+        The fitted corrector with the 'skewness_' of all the checked columns and the 'transforms_'
+        (transform name, lambda) of the transformed columns, call 'corrector.transform(X_test)' for the test set
+        preform the action on the database inplace
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        ValueError : If the column value type is not numeric.
+        ValueError : If a skewed column is not in the domain of the requested transform.
+        """
+
+        return SkewCorrector(method, threshold, n_jobs).fit_transform(database, column_name)
+
@@ -2,28 +2,72 @@
 Generic functions to manipulate continuous features in pandas data frame.
 
 This library include the functions:
-    1. fill_na_timedate(database, column_name):
-        Fill all the missing values in a time-date column with the mean time of the column.
+    1. fill_na_timedate(database, column_name, strategy="midpoint", by=None):
+        Fill all the missing values in one or many time-date columns by the midpoint, the median, forward/backward
+        fill or linear interpolation of the time, computed on the int64 view of the column.
+        With 'by' every group is filled by its own values.
 
-    2. remove_outliers_by_boundaries(database, column_name, bot_qu, top_qu):
-        Remove outliers values from column by top and bottom boundaries.
-        Before removing the indexes will print a message to the user with the number of indexes that
+    2. remove_outliers_by_boundaries(database, column_name, bot_qu, top_qu, policy=None):
+        Remove outliers values from one, many or all numeric columns by top and bottom quantile boundaries.
+        Before removing the indexes will consult the execution policy with the number of indexes that
         will be remove and the percent of the database that will be lost.
-        the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
-        If the user choose 'yes' the method will continue to drop the indexes and will
-        plot the new database shape.
+        In the default 'prompt' policy the user will input 'y'(yes) to pressed and 'n'(no) to cancel the action.
+        Returns an ActionReport with the outcome of the action.
 
     3. get_num_outliers_by_value(database, filter_dict_up, filter_dict_down):
         Prints how many indexes are above the values in the 'filter_dict_up' dictionary and how many indexes are below
         The values in the 'filter_dict_down' dictionary.
         The dictionary keys are the column names while the values are the top/ bottom boundaries.
         Will not conduct the action on all columns - only on columns in keys.
+        Returns the outliers of every column, the exact number of rows that are outliers in at least one column
+        and the overlap matrix between the columns.
 
-    4. remove_outliers_by_value(database, filter_dict_up, filter_dict_down):
+    4. remove_outliers_by_value(database, filter_dict_up, filter_dict_down, policy=None):
         remove all indexes that are above the values in the 'filter_dict_up' dictionary and indexes that are below
         The values in the 'filter_dict_down' dictionary.
         The dictionary keys are the column names while the values are the top/ bottom boundaries.
         Will not conduct the action on all columns - only on columns in keys.
+        Before removing the indexes will consult the execution policy, returns an ActionReport.
+
+    5. quantile_sketches(source, column_name=None, k=200, chunksize=100000, random_state=None):
+        Build a mergeable quantile sketch of one, many or all numeric columns of data that does not fit in memory
+        (a CSV/Parquet file or an iterable of data frames) by reading it chunk by chunk.
+        Sketches of different files or worker processes can be merged and used to get approximate quantiles.
+
+    6. remove_outliers_by_sketches(source, sketches, bot_qu, top_qu, chunksize=100000):
+        Second streaming pass - yields the chunks of the source without the rows that are outside the
+        bottom and top quantile boundaries of the column sketches.
+
+    7. remove_outliers_by_method(database, column_name=None, method='iqr', threshold=None, policy=None, detector=None):
+        Remove outliers from one, many or all numeric columns by the IQR fences, the median absolute deviation
+        or the z-score, computed for all the columns in one vectorized pass.
+        Before removing the indexes will consult the execution policy.
+        Returns an ActionReport with the boundaries and the fitted OutlierDetector that can be reused on new data.
+
+    8. clip_outliers_by_value(database, filter_dict_up=None, filter_dict_down=None):
+        Cap inplace the values above the 'filter_dict_up' values and below the 'filter_dict_down' values
+        instead of removing the rows. Returns the fitted OutlierClipper to reapply on the test set.
+
+    9. clip_outliers_by_boundaries(database, column_name, bot_qu, top_qu):
+        Cap inplace the values of one, many or all numeric columns at their bottom and top quantiles
+        instead of removing the rows. Returns the fitted OutlierClipper to reapply on the test set.
+
+    10. extract_datetime_features(database, column_name, features=None, reference=None):
+        Add the year, month, day, day of week, hour, minute, is-weekend and elapsed-seconds features of one or
+        many time-date columns in one pass of integer arithmetic on the int64 view, with compact int8/int16 dtypes.
+
+    11. discretize(database, column_name=None, n_bins=5, strategy='quantile'):
+        Replace inplace one, many or all numeric columns with their quantile or uniform bin codes.
+        Returns the fitted Discretizer to bin the test set and streaming batches by the same edges.
+
+    12. scale(database, column_name=None, method='standard', dtype=None):
+        Scale inplace one, many or all numeric columns by the standard, min-max or robust method,
+        optionally downcast to float32. Returns the fitted Scaler to scale the test set and to serialize.
+
+    13. correct_skewness(database, column_name=None, method='auto', threshold=0.5, n_jobs=None):
+        Measure the skewness of one, many or all numeric columns in one vectorized pass and transform inplace
+        the skewed columns by log1p, Box-Cox or Yeo-Johnson with lambdas estimated for all the columns together.
+        Returns the fitted SkewCorrector to transform the test set.
 
 
 Created by: Nir Barazida
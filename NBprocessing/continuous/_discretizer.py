@@ -0,0 +1,121 @@
+"""
+Fitted binning (discretization) of continuous features.
+
+The discretizer learns the bin edges of all the columns in one vectorized quantile (or min/max) call and
+bins every later data set - the train set, the test set and streaming batches - with np.searchsorted on the
+inner edges (O(n log bins), no Interval objects). The codes are emitted in the smallest sufficient integer dtype.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import warnings
+
+import numpy as np
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src._general_functions import smallest_int_dtype
+from NBprocessing.continuous._general_functions_continuous import numeric_columns, numeric_block, nan_quantiles
+
+
+class Discretizer(object):
+    """
+    Bin numeric columns to integer codes by quantile or uniform bin edges.
+
+    Parameters
+    ----------
+    :param n_bins: int, n_bins >= 2
+    The number of bins of every column. Quantile edges that are equal are merged, thus a column with
+    few unique values can get less bins.
+
+    :param strategy: string - 'quantile' or 'uniform'
+    'quantile' - every bin holds the same number of values (as pd.qcut).
+    'uniform' - all the bins have the same width between the minimum and the maximum (as pd.cut).
+
+    Attributes
+    ----------
+    bin_edges_: dictionary - {column name : NumPy array of the bin edges}
+    dtypes_: dictionary - {column name : numpy integer dtype of the codes}
+
+    The bins are right closed as in pd.qcut / pd.cut, values below the first edge get the first bin,
+    values above the last edge get the last bin, missing values get the code -1.
+
+    for exemple:
+    discretizer = Discretizer(10).fit(X_train, ["price", "km"])
+    discretizer.transform(X_train)
+    discretizer.transform(X_test)
+    """
+
+    QUANTILE = "quantile"
+    UNIFORM = "uniform"
+    MISSING_CODE = -1
+
+    def __init__(self, n_bins=5, strategy=QUANTILE):
+        if type(n_bins) != int or n_bins < 2:
+            raise ValueError(constance_object.CHECK_N_BINS)
+        if strategy not in (self.QUANTILE, self.UNIFORM):
+            raise ValueError(constance_object.CHECK_BIN_STRATEGY)
+        self.n_bins = n_bins
+        self.strategy = strategy
+        self.bin_edges_ = {}
+        self.dtypes_ = {}
+
+    def fit(self, database, columns=None):
+        """
+        Learn the bin edges of every column in 'columns' (a column name or a list/tuple of names),
+        if None of all the numeric columns. Returns the fitted discretizer.
+        """
+
+        _CheckInput._check_database_input(database)
+        if columns is not None:
+            _CheckInput._check_column_names_in_database(columns, database)
+
+        columns = numeric_columns(database, columns)
+        block = numeric_block(database, columns)
+        if self.strategy == self.QUANTILE:
+            edges = nan_quantiles(block, np.linspace(0, 1, self.n_bins + 1))
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                edges = np.linspace(np.nanmin(block, axis=0), np.nanmax(block, axis=0), self.n_bins + 1)
+
+        self.bin_edges_ = {}
+        self.dtypes_ = {}
+        for position, column_name in enumerate(columns):
+            column_edges = np.unique(edges[:, position][~np.isnan(edges[:, position])])
+            self.bin_edges_[column_name] = column_edges
+            self.dtypes_[column_name] = smallest_int_dtype(max(len(column_edges) - 2, 0), self.MISSING_CODE)
+        return self
+
+    def transform(self, database):
+        """
+        Replace inplace all the fitted columns in the given database with their bin codes.
+        """
+
+        _CheckInput._check_database_input(database)
+        if not self.bin_edges_:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
+        columns = list(self.bin_edges_)
+        _CheckInput._check_column_names_in_database(columns, database)
+
+        block = numeric_block(database, columns)
+        for position, column_name in enumerate(columns):
+            database[column_name] = self._codes(block[:, position], self.bin_edges_[column_name],
+                                                self.dtypes_[column_name])
+
+    def fit_transform(self, database, columns=None):
+        """
+        Fit the discretizer on 'columns' and replace them inplace with their bin codes.
+        Returns the fitted discretizer.
+        """
+
+        self.fit(database, columns)
+        self.transform(database)
+        return self
+
+    def _codes(self, values, edges, dtype):
+        # the inner edges only - the values outside the fitted range fall in the first / last bin
+        codes = np.searchsorted(edges[1:-1], values, side="left")
+        codes[np.isnan(values)] = self.MISSING_CODE
+        return codes.astype(dtype)
@@ -0,0 +1,462 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_integer_dtype, is_numeric_dtype
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._general_functions import to_column_list
+
+DATETIME_FILL_STRATEGIES = ("midpoint", "median", "ffill", "bfill", "interpolate")
+DATETIME_FEATURES = ("year", "month", "day", "dayofweek", "hour", "minute", "is_weekend", "elapsed_seconds")
+
+SECONDS_IN_DAY = 86400
+GOLDEN_RATIO = (np.sqrt(5) - 1) / 2
+
+
+def outliers_by_value(database, filter_dict_up=None, filter_dict_down=None):
+    """
+    Compare every filtered column once on a single 2-D NumPy block.
+    Returns the list of filtered columns (a column can be in both dictionaries) and two boolean matrices
+    (rows x columns) that are True where the value is above the 'filter_dict_up' value of its column
+    and where the value is below the 'filter_dict_down' value of its column.
+    Missing values are never outliers.
+    """
+
+    filter_dict_up = filter_dict_up or {}
+    filter_dict_down = filter_dict_down or {}
+    columns = list(dict.fromkeys(list(filter_dict_up) + list(filter_dict_down)))
+    block = numeric_block(database, columns)
+
+    top = np.array([filter_dict_up.get(column, np.inf) for column in columns], dtype=float)
+    bottom = np.array([filter_dict_down.get(column, -np.inf) for column in columns], dtype=float)
+    return columns, block > top, block < bottom
+
+
+def outliers_mask_by_value(database, filter_dict_up=None, filter_dict_down=None):
+    """
+    Returns a boolean array that is True for every row that is above one of the values in 'filter_dict_up'
+    or below one of the values in 'filter_dict_down'.
+    """
+
+    _, above, under = outliers_by_value(database, filter_dict_up, filter_dict_down)
+    return (above | under).any(axis=1)
+
+
+def overlap_matrix(outliers, chunk_size=2 ** 20):
+    """
+    Returns a (columns x columns) int matrix with the number of rows that are outliers in both columns.
+    The diagonal is the number of outliers of every column. Computed by chunks of rows to bound the memory.
+    """
+
+    overlap = np.zeros((outliers.shape[1], outliers.shape[1]), dtype=np.int64)
+    for start in range(0, len(outliers), chunk_size):
+        chunk = outliers[start:start + chunk_size].astype(np.float64)
+        overlap += np.rint(chunk.T @ chunk).astype(np.int64)
+    return overlap
+
+
+def numeric_columns(database, columns=None):
+    """
+    Returns the given column name or list of column names as a list, or all the numeric columns if None.
+    """
+
+    if columns is None:
+        return list(database._get_numeric_data().columns)
+    return to_column_list(columns)
+
+
+def numeric_block(database, columns):
+    """
+    Returns the columns as a single 2-D float NumPy block (rows x columns), missing values are NaN.
+    Raises ValueError if one of the columns is not numeric.
+    """
+
+    try:
+        return database[columns].to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError(constance_object.TYPE_ERROR)
+
+
+def nan_quantiles(block, quantiles):
+    """
+    Returns the quantiles of every column of the block in one vectorized call (quantiles x columns).
+    Missing values are ignored, a column without any value gets NaN quantiles.
+    """
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanquantile(block, quantiles, axis=0)
+
+
+def sketch_boundaries(sketches, bot_qu, top_qu):
+    """
+    Returns the 'filter_dict_up' and 'filter_dict_down' dictionaries {column name : boundary} of the top and
+    bottom quantiles of every column sketch, as used by 'remove_outliers_by_value'.
+    """
+
+    filter_dict_up = {column: sketch.quantile(top_qu) for column, sketch in sketches.items()}
+    filter_dict_down = {column: sketch.quantile(bot_qu) for column, sketch in sketches.items()}
+    return filter_dict_up, filter_dict_down
+
+
+def writable_values(database, column_name, dtype=None):
+    """
+    Returns the NumPy array of the column that is written inplace into the frame, or None if the column
+    has to be replaced by an assignment - an extension dtype, a dtype other than 'dtype' (if given), or copy on
+    write (the copy on write mode is on or the array pandas exposes is read-only).
+    Only public pandas API is used. Without copy on write a database that was sliced from another data frame
+    shares its arrays with it, thus as with any inplace pandas method the values of both frames are written.
+    """
+
+    column = database[column_name]
+    if not isinstance(column.dtype, np.dtype) or (dtype is not None and column.dtype != dtype) \
+            or copy_on_write():
+        return None
+    values = column.to_numpy()
+    return values if values.flags.writeable else None
+
+
+def copy_on_write():
+    """
+    Returns True if the pandas copy on write mode is on (or 'warn'), True if the option no longer exists
+    (pandas 3 - copy on write is always on).
+    """
+
+    return bool(getattr(pd.options.mode, "copy_on_write", True))
+
+
+def clip_columns(database, boundaries):
+    """
+    Cap inplace every column in 'boundaries' {column name : (bottom, top)} at its bottom and top boundary,
+    a None or NaN boundary is not applied. Missing values are kept.
+    Columns of NumPy dtype are clipped with np.clip into their own array (no reallocation of the frame),
+    a column of 'writable_values' None (extension dtypes, copy on write) gets the column replaced by its
+    clipped copy.
+    The boundaries of an integer column are rounded inwards (ceil / floor) to keep the integer dtype.
+    Raises ValueError if one of the columns is not numeric.
+    """
+
+    for column_name, (bottom, top) in boundaries.items():
+        column = database[column_name]
+        if not is_numeric_dtype(column):
+            raise ValueError(constance_object.TYPE_ERROR)
+
+        bottom = -np.inf if bottom is None or np.isnan(bottom) else bottom
+        top = np.inf if top is None or np.isnan(top) else top
+        if is_integer_dtype(column):
+            info = np.iinfo(column.dtype) if isinstance(column.dtype, np.dtype) else np.iinfo(np.int64)
+            bottom = int(np.clip(np.ceil(bottom), info.min, info.max))
+            top = int(np.clip(np.floor(top), info.min, info.max))
+
+        values = writable_values(database, column_name)
+        if values is not None:
+            np.clip(values, bottom, top, out=values)
+        else:
+            database[column_name] = column.clip(bottom, top)
+
+
+def fill_datetime_column(database, column_name, strategy, group_codes):
+    """
+    Fill inplace the missing values of a single date-time column by the given strategy within every group.
+    'group_codes' is an integer array with the group of every row (from groupby().ngroup()).
+    All the computations are done on the int64 view of the column (nanoseconds or the unit of the column)
+    as a nullable integer series with one groupby-transform / ffill / bfill - no Python loop over the groups.
+    The 'median' strategy is exact on the int64 values - the midpoint of the two middle values of the group,
+    floored to the unit of the column (no float conversion, that loses precision above 2^53 nanoseconds).
+    The 'interpolate' strategy is linear in the row order between the previous and the next known value
+    of the group, the missing values before the first / after the last known value get the nearest known value.
+    A group without any known value is left missing.
+    """
+
+    column = database[column_name]
+    missing = column.isna().to_numpy()
+    if not missing.any():
+        return
+
+    int_view = column.array.asi8
+    known_values = pd.Series(pd.arrays.IntegerArray(int_view.copy(), missing))
+    groups = known_values.groupby(group_codes, sort=False)
+
+    if strategy == "midpoint":
+        low, high = groups.transform("min"), groups.transform("max")
+        fill = low + (high - low) // 2
+    elif strategy == "median":
+        fill = _group_medians(int_view, missing, group_codes)
+    elif strategy == "ffill":
+        fill = groups.ffill()
+    elif strategy == "bfill":
+        fill = groups.bfill()
+    else:
+        fill = _interpolate_groups(known_values, group_codes)
+
+    fill_values = fill.to_numpy(dtype=np.int64, na_value=int_view[missing][0])
+    filled = int_view.copy()
+    filled[missing] = fill_values[missing]
+
+    result = pd.Series(filled.view("datetime64[{}]".format(column.dt.unit)))
+    if column.dt.tz is not None:
+        result = result.dt.tz_localize("UTC").dt.tz_convert(column.dt.tz)
+    database[column_name] = result.array
+
+
+def _group_medians(int_view, missing, group_codes):
+    # the known values sorted by group and value - the middle values of every group are taken by position
+    known_codes, known_values = group_codes[~missing], int_view[~missing]
+    order = np.lexsort((known_values, known_codes))
+    sorted_values = known_values[order]
+
+    n_groups = int(group_codes.max()) + 1
+    counts = np.bincount(known_codes, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    known_groups = counts > 0
+    lower = sorted_values[(starts + (counts - 1) // 2)[known_groups]]
+    upper = sorted_values[(starts + counts // 2)[known_groups]]
+
+    medians = np.zeros(n_groups, dtype=np.int64)
+    # the floored midpoint without overflow of lower + upper
+    medians[known_groups] = lower // 2 + upper // 2 + (lower % 2 + upper % 2) // 2
+    return pd.Series(pd.arrays.IntegerArray(medians[group_codes], ~known_groups[group_codes]))
+
+
+def _interpolate_groups(known_values, group_codes):
+    positions = pd.Series(pd.arrays.IntegerArray(np.arange(len(known_values), dtype=np.int64),
+                                                 known_values.isna().to_numpy()))
+    frame = pd.DataFrame({"value": known_values, "position": positions})
+    previous = frame.groupby(group_codes, sort=False).ffill()
+    following = frame.groupby(group_codes, sort=False).bfill()
+
+    # the nearest known value where only one side is known
+    fill = previous["value"].fillna(following["value"])
+    both_sides = (previous["value"].notna() & following["value"].notna()).to_numpy()
+
+    previous_value = previous["value"].to_numpy(dtype=np.int64, na_value=0)[both_sides]
+    following_value = following["value"].to_numpy(dtype=np.int64, na_value=0)[both_sides]
+    previous_position = previous["position"].to_numpy(dtype=np.int64, na_value=0)[both_sides]
+    following_position = following["position"].to_numpy(dtype=np.int64, na_value=0)[both_sides]
+
+    # the step is computed on the (small) differences to keep the int64 precision of the values
+    span = np.maximum(following_position - previous_position, 1)
+    step = np.rint((following_value - previous_value) *
+                   ((np.flatnonzero(both_sides) - previous_position) / span)).astype(np.int64)
+    fill[both_sides] = previous_value + step
+    return fill
+
+
+def datetime_features(column, features, reference=None):
+    """
+    Returns a dictionary {feature : array} of the given date-time features of a date-time column, computed in
+    one pass with integer arithmetic on the int64 view of the column (the wall time for a tz-aware column).
+    The calendar date is converted from the days since 1970-01-01 by the proleptic Gregorian
+    'civil from days' algorithm. The features are int8 (int16 for the year, bool for 'is_weekend',
+    int64 for 'elapsed_seconds' since 'reference' - the Unix epoch if None), or their nullable
+    pandas dtypes if the column has missing values.
+    """
+
+    if column.dt.tz is not None:
+        if reference is not None and pd.Timestamp(reference).tz is not None:
+            reference = pd.Timestamp(reference).tz_convert(column.dt.tz).tz_localize(None)
+        column = column.dt.tz_localize(None)
+
+    missing = column.isna().to_numpy()
+    unit_per_second = np.timedelta64(1, "s") // np.timedelta64(1, column.dt.unit)
+    seconds = np.where(missing, 0, column.array.asi8) // unit_per_second
+    days, seconds_of_day = np.divmod(seconds, SECONDS_IN_DAY)
+
+    values = {}
+    if {"year", "month", "day"} & set(features):
+        # shift the epoch to 0000-03-01 so the leap day is the last day of the (march based) year
+        days_from_march = days + 719468
+        era = days_from_march // 146097
+        day_of_era = days_from_march - era * 146097
+        year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+        day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+        month_from_march = (5 * day_of_year + 2) // 153
+        month = np.where(month_from_march < 10, month_from_march + 3, month_from_march - 9)
+        values["year"] = (year_of_era + era * 400 + (month <= 2)).astype(np.int16)
+        values["month"] = month.astype(np.int8)
+        values["day"] = (day_of_year - (153 * month_from_march + 2) // 5 + 1).astype(np.int8)
+
+    # 1970-01-01 was a Thursday, Monday is 0
+    day_of_week = ((days + 3) % 7).astype(np.int8)
+    values["dayofweek"] = day_of_week
+    values["is_weekend"] = day_of_week >= 5
+    values["hour"] = (seconds_of_day // 3600).astype(np.int8)
+    values["minute"] = (seconds_of_day % 3600 // 60).astype(np.int8)
+    if "elapsed_seconds" in features:
+        reference_seconds = 0 if reference is None else pd.Timestamp(reference).value // 10 ** 9
+        values["elapsed_seconds"] = seconds - reference_seconds
+
+    values = {feature: values[feature] for feature in features}
+    if missing.any():
+        values = {feature: pd.array(feature_values, dtype=_NULLABLE_DTYPES[feature_values.dtype])
+                  for feature, feature_values in values.items()}
+        for feature_values in values.values():
+            feature_values[missing] = pd.NA
+    return values
+
+
+_NULLABLE_DTYPES = {np.dtype(np.int8): "Int8", np.dtype(np.int16): "Int16", np.dtype(np.int64): "Int64",
+                    np.dtype(bool): "boolean"}
+
+
+def scale_columns(database, center, scale, dtype=None, inverse=False):
+    """
+    Scale inplace every column in 'center' / 'scale' {column name : float} to (x - center) / scale,
+    or back to x * scale + center if 'inverse'.
+    A float column that keeps its dtype (dtype None or its own dtype) is scaled in its own array without
+    any allocation, as in 'clip_columns'. Any other column (integer column, float32 downcasting, extension dtype,
+    copy on write - 'writable_values' None) is written once to a new array of the output dtype and assigned,
+    no float64 intermediate is created.
+    Raises ValueError if one of the columns is not numeric.
+    """
+
+    for column_name, column_center in center.items():
+        column = database[column_name]
+        if not is_numeric_dtype(column):
+            raise ValueError(constance_object.TYPE_ERROR)
+
+        numpy_dtype = isinstance(column.dtype, np.dtype)
+        if dtype is not None:
+            output_dtype = np.dtype(dtype)
+        else:
+            output_dtype = column.dtype if numpy_dtype and column.dtype.kind == "f" else np.dtype(np.float64)
+
+        values = writable_values(database, column_name, output_dtype)
+        if values is None:
+            values = np.empty(len(column), dtype=output_dtype)
+            np.copyto(values, column.to_numpy() if numpy_dtype else column.to_numpy(np.float64, na_value=np.nan),
+                      casting="unsafe")
+            _apply_scale(values, column_center, scale[column_name], inverse)
+            database[column_name] = values
+        else:
+            _apply_scale(values, column_center, scale[column_name], inverse)
+
+
+def _apply_scale(values, center, scale, inverse):
+    if inverse:
+        values *= scale
+        values += center
+    else:
+        values -= center
+        values /= scale
+
+
+def write_column_inplace(database, column_name, values):
+    """
+    Write the float values to the column inplace - into the own array of a float64 column of the frame,
+    otherwise (other dtype, extension dtype or copy on write - 'writable_values' None) the column is replaced
+    by the values.
+    """
+
+    column_values = writable_values(database, column_name, values.dtype)
+    if column_values is not None:
+        column_values[:] = values
+    else:
+        database[column_name] = values
+
+
+def nan_skew(block):
+    """
+    Returns the (population) skewness of every column of the block in one vectorized pass of moments,
+    missing values are ignored. A constant column gets NaN.
+    """
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        deviations = block - np.nanmean(block, axis=0)
+        second_moment = np.nanmean(deviations ** 2, axis=0)
+        third_moment = np.nanmean(deviations ** 3, axis=0)
+        return np.where(second_moment > 0, third_moment / second_moment ** 1.5, np.nan)
+
+
+def power_transform(values, transform_name, transform_lambda=None):
+    """
+    Returns the 'log1p', 'boxcox' or 'yeo-johnson' transform of the values of a single column with the given
+    lambda, missing values are kept.
+    """
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if transform_name == "log1p":
+            return np.log1p(values)
+
+        if transform_name == "boxcox":
+            if abs(transform_lambda) < 1e-12:
+                return np.log(values)
+            return np.expm1(transform_lambda * np.log(values)) / transform_lambda
+
+        # Yeo-Johnson - Box-Cox of (x + 1) for x >= 0 and of (1 - x) with 2 - lambda for x < 0
+        result = np.full_like(values, np.nan)
+        positive, negative = values >= 0, values < 0
+        if abs(transform_lambda) < 1e-12:
+            result[positive] = np.log1p(values[positive])
+        else:
+            result[positive] = np.expm1(transform_lambda * np.log1p(values[positive])) / transform_lambda
+        if abs(transform_lambda - 2) < 1e-12:
+            result[negative] = -np.log1p(-values[negative])
+        else:
+            result[negative] = -np.expm1((2 - transform_lambda) * np.log1p(-values[negative])) / \
+                               (2 - transform_lambda)
+        return result
+
+
+def fit_power_lambdas(block, transform_name, bounds=(-5.0, 5.0), tolerance=1e-3):
+    """
+    Returns the maximum likelihood lambda of the 'boxcox' or 'yeo-johnson' transform of every column of the block.
+    The lambdas of all the columns are found together by a vectorized golden section search of the profile
+    log-likelihood, every step evaluates the likelihood of all the columns in a few NumPy calls:
+        boxcox: (lambda - 1) * sum(log x) - n / 2 * log(var(transformed x))
+        yeo-johnson: (lambda - 1) * sum(sign(x) * log(1 + |x|)) - n / 2 * log(var(transformed x))
+    Missing values are ignored. The result agrees with scipy's boxcox_normmax / yeojohnson_normmax
+    to the given tolerance inside the bounds.
+    """
+
+    valid = ~np.isnan(block)
+    counts = valid.sum(axis=0)
+    with np.errstate(all="ignore"):
+        if transform_name == "boxcox":
+            signs = None
+            log_values = np.log(np.where(valid, block, 1.0))
+            sum_log = log_values.sum(axis=0)
+        else:
+            signs = np.where(block < 0, -1.0, 1.0)
+            log_values = np.log1p(np.abs(np.where(valid, block, 0.0)))
+            sum_log = (signs * log_values).sum(axis=0)
+
+    def log_likelihood(lambdas):
+        # keep away from the removable singularities of the transforms at lambda 0 and 2
+        lambdas = np.where(np.abs(lambdas) < 1e-8, 1e-8, lambdas)
+        lambdas = np.where(np.abs(lambdas - 2) < 1e-8, 2 + 1e-8, lambdas)
+        with np.errstate(all="ignore"):
+            if signs is None:
+                transformed = np.expm1(lambdas * log_values)
+                transformed /= lambdas
+            else:
+                # lambda for the non negative values and 2 - lambda for the negative values
+                exponent = (lambdas - 1) * signs
+                exponent += 1
+                transformed = np.expm1(exponent * log_values)
+                transformed /= exponent
+                transformed *= signs
+            transformed[~valid] = 0
+            transformed -= transformed.sum(axis=0) / counts
+            transformed[~valid] = 0
+            variance = np.einsum("ij,ij->j", transformed, transformed) / counts
+            result = (lambdas - 1) * sum_log - counts / 2 * np.log(variance)
+        return np.where(np.isfinite(result), result, -np.inf)
+
+    low, high = np.full(block.shape[1], bounds[0]), np.full(block.shape[1], bounds[1])
+    left_point, right_point = high - GOLDEN_RATIO * (high - low), low + GOLDEN_RATIO * (high - low)
+    left_value, right_value = log_likelihood(left_point), log_likelihood(right_point)
+    while (high - low).max() > tolerance:
+        # the maximum is in [low, right_point] if the left point is higher, otherwise in [left_point, high]
+        in_left = left_value > right_value
+        high = np.where(in_left, right_point, high)
+        low = np.where(in_left, low, left_point)
+        new_point = np.where(in_left, high - GOLDEN_RATIO * (high - low), low + GOLDEN_RATIO * (high - low))
+        new_value = log_likelihood(new_point)
+        left_point, right_point = np.where(in_left, new_point, right_point), np.where(in_left, left_point, new_point)
+        left_value, right_value = np.where(in_left, new_value, right_value), np.where(in_left, left_value, new_value)
+    return (low + high) / 2
+
@@ -10,7 +10,14 @@ Good luck
 
 
 from functools import wraps
+from NBprocessing.src import constance_object
 from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.continuous._quantile_sketch import QuantileSketch
+from NBprocessing.continuous._outlier_detector import OutlierDetector
+from NBprocessing.continuous._discretizer import Discretizer
+from NBprocessing.continuous._general_functions_continuous import DATETIME_FILL_STRATEGIES, DATETIME_FEATURES
+
+import pandas as pd
 
 class _InputCheckContinuous(object):
     """
@@ -28,12 +35,16 @@ class _InputCheckContinuous(object):
         """
 
         @wraps(func)
-        def wrapper_checker(database, column_name):
+        def wrapper_checker(database, column_name, strategy="midpoint", by=None):
             _CheckInput._check_database_input(database)
-            _CheckInput._check_column_name(column_name)
-            _CheckInput._check_type_date_time(database,column_name)
-            _CheckInput._check_column_in_database(column_name, database)
-            return func(database, column_name)
+            _CheckInput._check_column_names_in_database(column_name, database)
+            for column in column_name if type(column_name) in (list, tuple) else [column_name]:
+                _CheckInput._check_type_date_time(database, column)
+            if strategy not in DATETIME_FILL_STRATEGIES:
+                raise ValueError(constance_object.CHECK_FILL_STRATEGY)
+            if by is not None:
+                _CheckInput._check_column_names_in_database(by, database)
+            return func(database, column_name, strategy, by)
         return wrapper_checker
 
     @staticmethod
@@ -44,19 +55,20 @@ class _InputCheckContinuous(object):
         """
 
         @wraps(func)
-        def wrapper_checker(database, column_name, bot_qu, top_qu):
+        def wrapper_checker(database, column_name, bot_qu, top_qu, policy=None):
             _CheckInput._check_database_input(database)
-            _CheckInput._check_column_name(column_name)
-            _CheckInput._check_column_in_database(column_name, database)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, database)
             _CheckInput._check_boundaries(top_qu)
             _CheckInput._check_boundaries(bot_qu)
-            return func(database, column_name, bot_qu, top_qu)
+            _CheckInput._check_policy(policy)
+            return func(database, column_name, bot_qu, top_qu, policy)
         return wrapper_checker
 
     @staticmethod
     def _remove_and_get_num_outliers_by_value_checker(func):
         """
-        Wrapper function to validate the input for methods 'get_num_outliers_by_value' and 'remove_outliers_by_value'
+        Wrapper function to validate the input for methods 'get_num_outliers_by_value' and 'clip_outliers_by_value'
         Will raise Exception if input incorrect or data type not date time.
         """
 
@@ -66,4 +78,172 @@ class _InputCheckContinuous(object):
             _CheckInput._check_dict(filter_dict_up)
             _CheckInput._check_dict(filter_dict_down)
             return func(database, filter_dict_up, filter_dict_down)
-        return wrapper_checker
\ No newline at end of file
+        return wrapper_checker
+
+    @staticmethod
+    def _remove_outliers_by_value_checker(func):
+        """
+        Wrapper function to validate the input for method 'remove_outliers_by_value'
+        Will raise Exception if input incorrect.
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, filter_dict_up=None, filter_dict_down=None, policy=None):
+            _CheckInput._check_database_input(database)
+            _CheckInput._check_dict(filter_dict_up)
+            _CheckInput._check_dict(filter_dict_down)
+            _CheckInput._check_policy(policy)
+            return func(database, filter_dict_up, filter_dict_down, policy)
+        return wrapper_checker
+
+    @staticmethod
+    def _quantile_sketches_checker(func):
+        """
+        Wrapper function to validate the input for method 'quantile_sketches'
+        Will raise Exception if input incorrect.
+        """
+
+        @wraps(func)
+        def wrapper_checker(source, column_name=None, k=200, chunksize=100000, random_state=None):
+            _CheckInput._check_source(source)
+            if column_name is not None:
+                for column in column_name if type(column_name) in (list, tuple) else [column_name]:
+                    _CheckInput._check_column_name(column)
+            if type(k) != int or k < 8:
+                raise ValueError(constance_object.CHECK_SKETCH_K)
+            _CheckInput._check_chunksize(chunksize)
+            _CheckInput._check_random_state(random_state)
+            return func(source, column_name, k, chunksize, random_state)
+        return wrapper_checker
+
+    @staticmethod
+    def _remove_outliers_by_sketches_checker(func):
+        """
+        Wrapper function to validate the input for method 'remove_outliers_by_sketches'
+        Will raise Exception if input incorrect.
+        """
+
+        @wraps(func)
+        def wrapper_checker(source, sketches, bot_qu, top_qu, chunksize=100000):
+            _CheckInput._check_source(source)
+            if type(sketches) != dict or not all(isinstance(sketch, QuantileSketch) for sketch in sketches.values()):
+                raise ValueError(constance_object.CHECK_SKETCHES)
+            _CheckInput._check_boundaries(bot_qu)
+            _CheckInput._check_boundaries(top_qu)
+            _CheckInput._check_chunksize(chunksize)
+            return func(source, sketches, bot_qu, top_qu, chunksize)
+        return wrapper_checker
+
+    @staticmethod
+    def _remove_outliers_by_method_checker(func):
+        """
+        Wrapper function to validate the input for method 'remove_outliers_by_method'
+        Will raise Exception if input incorrect.
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name=None, method="iqr", threshold=None, policy=None, detector=None):
+            _CheckInput._check_database_input(database)
+            _CheckInput._check_policy(policy)
+            if detector is None:
+                if column_name is not None:
+                    _CheckInput._check_column_names_in_database(column_name, database)
+                if method not in OutlierDetector.DEFAULT_THRESHOLDS:
+                    raise ValueError(constance_object.CHECK_DETECTOR_METHOD)
+                if threshold is not None and ((type(threshold) != float and type(threshold) != int) or threshold <= 0):
+                    raise ValueError(constance_object.CHECK_DETECTOR_THRESHOLD)
+            elif not isinstance(detector, OutlierDetector) or not detector.boundaries_:
+                raise ValueError(constance_object.CHECK_DETECTOR)
+            return func(database, column_name, method, threshold, policy, detector)
+        return wrapper_checker
+
+    @staticmethod
+    def _clip_outliers_by_boundaries_checker(func):
+        """
+        Wrapper function to validate the input for method 'clip_outliers_by_boundaries'
+        Will raise Exception if input incorrect.
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name, bot_qu, top_qu):
+            _CheckInput._check_database_input(database)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, database)
+            _CheckInput._check_boundaries(top_qu)
+            _CheckInput._check_boundaries(bot_qu)
+            return func(database, column_name, bot_qu, top_qu)
+        return wrapper_checker
+
+    @staticmethod
+    def _extract_datetime_features_checker(func):
+        """
+        Wrapper function to validate the input for method 'extract_datetime_features'
+        Will raise Exception if input incorrect or data type not date time.
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name, features=None, reference=None):
+            _CheckInput._check_database_input(database)
+            _CheckInput._check_column_names_in_database(column_name, database)
+            for column in column_name if type(column_name) in (list, tuple) else [column_name]:
+                _CheckInput._check_type_date_time(database, column)
+            _CheckInput._check_list_tuple_None(features)
+            if features is not None and (not features or not set(features) <= set(DATETIME_FEATURES)):
+                raise ValueError(constance_object.CHECK_DATETIME_FEATURES)
+            if reference is not None:
+                try:
+                    pd.Timestamp(reference)
+                except (TypeError, ValueError):
+                    raise ValueError(constance_object.CHECK_REFERENCE)
+            return func(database, column_name, features, reference)
+        return wrapper_checker
+
+    @staticmethod
+    def _discretize_checker(func):
+        """
+        Wrapper function to validate the input for method 'discretize'
+        Will raise Exception if input incorrect.
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name=None, n_bins=5, strategy="quantile"):
+            _CheckInput._check_database_input(database)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, database)
+            if type(n_bins) != int or n_bins < 2:
+                raise ValueError(constance_object.CHECK_N_BINS)
+            if strategy not in (Discretizer.QUANTILE, Discretizer.UNIFORM):
+                raise ValueError(constance_object.CHECK_BIN_STRATEGY)
+            return func(database, column_name, n_bins, strategy)
+        return wrapper_checker
+
+    @staticmethod
+    def _scale_checker(func):
+        """
+        Wrapper function to validate the input for method 'scale'
+        Will raise Exception if input incorrect.
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name=None, method="standard", dtype=None):
+            _CheckInput._check_database_input(database)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, database)
+            return func(database, column_name, method, dtype)
+        return wrapper_checker
+
+    @staticmethod
+    def _correct_skewness_checker(func):
+        """
+        Wrapper function to validate the input for method 'correct_skewness'
+        Will raise Exception if input incorrect.
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name=None, method="auto", threshold=0.5, n_jobs=None):
+            _CheckInput._check_database_input(database)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, database)
+            _CheckInput._check_n_jobs(n_jobs)
+            return func(database, column_name, method, threshold, n_jobs)
+        return wrapper_checker
@@ -0,0 +1,78 @@
+"""
+Fitted clipper (winsorizer) of numeric features - a copy free alternative to dropping outlier rows.
+
+The clipper stores the bottom and top boundaries of every column, learned from value dictionaries or
+from quantiles of the train set, and caps the values of the train set, the test set and every later batch
+of data at them inplace. No row is lost and the frame is not reallocated.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.continuous._general_functions_continuous import numeric_columns, numeric_block, nan_quantiles, \
+    clip_columns
+
+
+class OutlierClipper(object):
+    """
+    Cap the values of numeric columns at fitted bottom and top boundaries.
+
+    Attributes
+    ----------
+    boundaries_: dictionary - {column name : (bottom boundary, top boundary)}, a None boundary is not applied
+
+    for exemple:
+    clipper = OutlierClipper().fit_quantiles(X_train, ["price", "km"], 0.01, 0.99)
+    clipper.transform(X_train)
+    clipper.transform(X_test)
+    """
+
+    def __init__(self):
+        self.boundaries_ = {}
+
+    def fit_values(self, filter_dict_up=None, filter_dict_down=None):
+        """
+        Learn the boundaries from 'filter_dict_up' {column name : top boundary} and
+        'filter_dict_down' {column name : bottom boundary}. Returns the fitted clipper.
+        """
+
+        _CheckInput._check_dict(filter_dict_up)
+        _CheckInput._check_dict(filter_dict_down)
+        filter_dict_up = filter_dict_up or {}
+        filter_dict_down = filter_dict_down or {}
+
+        columns = dict.fromkeys(list(filter_dict_up) + list(filter_dict_down))
+        self.boundaries_ = {column: (filter_dict_down.get(column), filter_dict_up.get(column)) for column in columns}
+        return self
+
+    def fit_quantiles(self, database, columns, bot_qu, top_qu):
+        """
+        Learn the boundaries of every column in 'columns' (a column name, a list/tuple of names or None for all the
+        numeric columns) as its 'bot_qu' and 'top_qu' quantiles, computed in one vectorized call.
+        Returns the fitted clipper.
+        """
+
+        _CheckInput._check_database_input(database)
+        if columns is not None:
+            _CheckInput._check_column_names_in_database(columns, database)
+        _CheckInput._check_boundaries(bot_qu)
+        _CheckInput._check_boundaries(top_qu)
+
+        columns = numeric_columns(database, columns)
+        bottom, top = nan_quantiles(numeric_block(database, columns), [bot_qu, top_qu])
+        self.boundaries_ = {column: (low, high) for column, low, high in zip(columns, bottom.tolist(), top.tolist())}
+        return self
+
+    def transform(self, database):
+        """
+        Cap inplace the fitted columns of the given database at their boundaries.
+        The boundaries of an integer column are rounded inwards to keep its dtype. Missing values are kept.
+        """
+
+        _CheckInput._check_database_input(database)
+        if not self.boundaries_:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
+        _CheckInput._check_column_names_in_database(list(self.boundaries_), database)
+        clip_columns(database, self.boundaries_)
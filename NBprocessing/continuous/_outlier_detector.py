@@ -0,0 +1,157 @@
+"""
+Fitted statistical outlier detector of numeric features.
+
+The detector computes the statistics of all the numeric columns in one vectorized pass over a 2-D NumPy block
+and stores the bottom and top boundaries of every column, thus the same boundaries can be applied to new data.
+The methods:
+    1. 'iqr' - Tukey fences: below Q1 - threshold * IQR or above Q3 + threshold * IQR (default threshold 1.5).
+    2. 'mad' - modified z-score: |x - median| * 0.6745 / MAD above threshold (default threshold 3.5).
+    3. 'zscore' - |x - mean| / std above threshold (default threshold 3).
+Missing values are never outliers.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.continuous._general_functions_continuous import numeric_columns, numeric_block, nan_quantiles, \
+    clip_columns
+
+
+class OutlierDetector(object):
+    """
+    Detect outliers in all the numeric columns by the IQR fences, the median absolute deviation or the z-score.
+
+    Parameters
+    ----------
+    :param method: string - 'iqr', 'mad' or 'zscore'
+    The statistic the boundaries are computed by.
+
+    :param threshold: positive float or None
+    The number of IQRs / modified z-scores / standard deviations from the center a value is an outlier at.
+    If None the default threshold of the method is used (1.5, 3.5 and 3).
+
+    Attributes
+    ----------
+    boundaries_: dictionary - {column name : (bottom boundary, top boundary)}
+
+    for exemple:
+    detector = OutlierDetector("mad").fit(X_train)
+    outliers = detector.outliers(X_test)  # boolean data frame (rows x columns)
+    NBcontinuous.remove_outliers_by_value(X_test, *detector.filter_dicts())
+    detector.clip(X_test)  # cap the outliers instead of removing them
+    """
+
+    IQR = "iqr"
+    MAD = "mad"
+    ZSCORE = "zscore"
+    DEFAULT_THRESHOLDS = {IQR: 1.5, MAD: 3.5, ZSCORE: 3}
+
+    # MAD of the standard normal distribution - the modified z-score is comparable to a z-score
+    MAD_NORMAL_CONSISTENCY = 0.6745
+
+    def __init__(self, method=IQR, threshold=None):
+        if method not in self.DEFAULT_THRESHOLDS:
+            raise ValueError(constance_object.CHECK_DETECTOR_METHOD)
+        if threshold is not None and ((type(threshold) != float and type(threshold) != int) or threshold <= 0):
+            raise ValueError(constance_object.CHECK_DETECTOR_THRESHOLD)
+        self.method = method
+        self.threshold = threshold if threshold is not None else self.DEFAULT_THRESHOLDS[method]
+        self.boundaries_ = {}
+
+    def fit(self, database, columns=None):
+        """
+        Compute the boundaries of every column in 'columns' (a column name or a list/tuple of names),
+        if None of all the numeric columns. Returns the fitted detector.
+        """
+
+        _CheckInput._check_database_input(database)
+        if columns is not None:
+            _CheckInput._check_column_names_in_database(columns, database)
+
+        columns = numeric_columns(database, columns)
+        bottom, top = self._boundaries(numeric_block(database, columns))
+        self.boundaries_ = {column: (low, high) for column, low, high in zip(columns, bottom.tolist(), top.tolist())}
+        return self
+
+    def outliers(self, database):
+        """
+        Returns a boolean data frame (rows x fitted columns) with the index of the database that is True
+        where the value is outside the boundaries of its column.
+        """
+
+        columns, outliers = self._outliers_block(database)
+        return pd.DataFrame(outliers, index=database.index, columns=columns)
+
+    def fit_outliers(self, database, columns=None):
+        """
+        Fit the detector on 'columns' and return the boolean outlier data frame of the database.
+        """
+
+        return self.fit(database, columns).outliers(database)
+
+    def outliers_mask(self, database):
+        """
+        Returns a boolean array that is True for every row that is an outlier in at least one fitted column.
+        """
+
+        return self._outliers_block(database)[1].any(axis=1)
+
+    def filter_dicts(self):
+        """
+        Returns the 'filter_dict_up' and 'filter_dict_down' dictionaries {column name : boundary}
+        of the fitted boundaries, as used by 'remove_outliers_by_value' and 'get_num_outliers_by_value'.
+        """
+
+        self._check_fitted()
+        return ({column: high for column, (low, high) in self.boundaries_.items()},
+                {column: low for column, (low, high) in self.boundaries_.items()})
+
+    def clip(self, database):
+        """
+        Cap inplace the fitted columns of the given database at the fitted boundaries instead of removing
+        the outlier rows. The boundaries of an integer column are rounded inwards to keep its dtype.
+        """
+
+        _CheckInput._check_database_input(database)
+        self._check_fitted()
+        _CheckInput._check_column_names_in_database(list(self.boundaries_), database)
+        clip_columns(database, self.boundaries_)
+
+    def _boundaries(self, block):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if self.method == self.IQR:
+                first_quartile, third_quartile = nan_quantiles(block, [0.25, 0.75])
+                spread = self.threshold * (third_quartile - first_quartile)
+                return first_quartile - spread, third_quartile + spread
+
+            if self.method == self.MAD:
+                median = np.nanmedian(block, axis=0)
+                mad = np.nanmedian(np.abs(block - median), axis=0)
+                spread = self.threshold * mad / self.MAD_NORMAL_CONSISTENCY
+                return median - spread, median + spread
+
+            mean = np.nanmean(block, axis=0)
+            spread = self.threshold * np.nanstd(block, axis=0, ddof=1)
+            return mean - spread, mean + spread
+
+    def _outliers_block(self, database):
+        _CheckInput._check_database_input(database)
+        self._check_fitted()
+        columns = list(self.boundaries_)
+        _CheckInput._check_column_names_in_database(columns, database)
+
+        block = numeric_block(database, columns)
+        bottom, top = np.array(list(self.boundaries_.values()), dtype=float).reshape(-1, 2).T
+        return columns, (block < bottom) | (block > top)
+
+    def _check_fitted(self):
+        if not self.boundaries_:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
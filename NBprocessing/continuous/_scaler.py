@@ -0,0 +1,146 @@
+"""
+Fitted scaling (normalization) of numeric features.
+
+The scaler computes the center and the scale of all the numeric columns in one NaN-aware vectorized pass and
+applies (x - center) / scale inplace on the arrays of the frame - a float column is scaled in its own array,
+optionally downcast to float32 to halve the memory. The fitted parameters are plain floats that can be
+serialized to a dictionary (e.g. JSON) and loaded back when serving a model.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import warnings
+
+import numpy as np
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.continuous._general_functions_continuous import numeric_columns, numeric_block, nan_quantiles, \
+    scale_columns
+
+
+class Scaler(object):
+    """
+    Scale numeric columns by the standard, min-max or robust method.
+
+    Parameters
+    ----------
+    :param method: string - 'standard', 'minmax' or 'robust'
+    'standard' - center is the mean and scale is the standard deviation.
+    'minmax' - center is the minimum and scale is the range (maximum - minimum), the values are in [0, 1].
+    'robust' - center is the median and scale is the interquartile range.
+    A zero (or missing) scale is replaced by 1. Missing values are ignored in fit and kept in transform.
+
+    :param dtype: string, numpy float dtype or None
+    The dtype of the scaled columns, e.g. 'float32' to halve the memory.
+    If None a float column keeps its dtype and an integer column is scaled to float64.
+
+    Attributes
+    ----------
+    center_: dictionary - {column name : float}
+    scale_: dictionary - {column name : float}
+
+    for exemple:
+    scaler = Scaler("robust", "float32").fit(X_train)
+    scaler.transform(X_train)
+    scaler.transform(X_test)
+    json.dump(scaler.to_dict(), file)
+    """
+
+    STANDARD = "standard"
+    MINMAX = "minmax"
+    ROBUST = "robust"
+    METHODS = (STANDARD, MINMAX, ROBUST)
+
+    def __init__(self, method=STANDARD, dtype=None):
+        if method not in self.METHODS:
+            raise ValueError(constance_object.CHECK_SCALER_METHOD)
+        if dtype is not None:
+            try:
+                if np.dtype(dtype).kind != "f":
+                    raise TypeError
+            except TypeError:
+                raise ValueError(constance_object.CHECK_SCALER_DTYPE)
+        self.method = method
+        self.dtype = None if dtype is None else np.dtype(dtype).name
+        self.center_ = {}
+        self.scale_ = {}
+
+    def fit(self, database, columns=None):
+        """
+        Compute the center and the scale of every column in 'columns' (a column name or a list/tuple of names),
+        if None of all the numeric columns. Returns the fitted scaler.
+        """
+
+        _CheckInput._check_database_input(database)
+        if columns is not None:
+            _CheckInput._check_column_names_in_database(columns, database)
+
+        columns = numeric_columns(database, columns)
+        block = numeric_block(database, columns)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if self.method == self.STANDARD:
+                center, scale = np.nanmean(block, axis=0), np.nanstd(block, axis=0)
+            elif self.method == self.MINMAX:
+                center = np.nanmin(block, axis=0)
+                scale = np.nanmax(block, axis=0) - center
+            else:
+                first_quartile, center, third_quartile = nan_quantiles(block, [0.25, 0.5, 0.75])
+                scale = third_quartile - first_quartile
+
+        scale[(scale == 0) | np.isnan(scale)] = 1.0
+        self.center_ = dict(zip(columns, center.tolist()))
+        self.scale_ = dict(zip(columns, scale.tolist()))
+        return self
+
+    def transform(self, database):
+        """
+        Scale inplace all the fitted columns in the given database to (x - center) / scale.
+        """
+
+        self._check_fitted(database)
+        scale_columns(database, self.center_, self.scale_, self.dtype)
+
+    def fit_transform(self, database, columns=None):
+        """
+        Fit the scaler on 'columns' and scale them inplace in the given database.
+        Returns the fitted scaler.
+        """
+
+        self.fit(database, columns)
+        self.transform(database)
+        return self
+
+    def inverse_transform(self, database):
+        """
+        Scale inplace all the fitted columns in the given database back to x * scale + center.
+        """
+
+        self._check_fitted(database)
+        scale_columns(database, self.center_, self.scale_, self.dtype, inverse=True)
+
+    def to_dict(self):
+        """
+        Returns the method, the dtype and the fitted parameters as a JSON serializable dictionary.
+        """
+
+        return {"method": self.method, "dtype": self.dtype, "center": dict(self.center_), "scale": dict(self.scale_)}
+
+    @classmethod
+    def from_dict(cls, parameters):
+        """
+        Returns a fitted scaler from a dictionary of 'to_dict'.
+        """
+
+        scaler = cls(parameters["method"], parameters["dtype"])
+        scaler.center_ = dict(parameters["center"])
+        scaler.scale_ = dict(parameters["scale"])
+        return scaler
+
+    def _check_fitted(self, database):
+        _CheckInput._check_database_input(database)
+        if not self.center_:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
+        _CheckInput._check_column_names_in_database(list(self.center_), database)
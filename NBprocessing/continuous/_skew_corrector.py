@@ -0,0 +1,149 @@
+"""
+Fitted skewness correction of numeric features by power transforms.
+
+The corrector measures the skewness of all the numeric columns in one vectorized NaN-aware pass of moments,
+and fits a power transform only to the columns whose absolute skewness is above a threshold:
+    1. 'log1p' - log(1 + x), for values above -1.
+    2. 'boxcox' - Box-Cox transform, for positive values.
+    3. 'yeo-johnson' - Yeo-Johnson transform, for any values.
+    4. 'auto' - Box-Cox for a column with positive values only, otherwise Yeo-Johnson.
+The lambdas of all the columns are estimated together by a vectorized maximum likelihood search,
+chunks of columns are estimated in parallel by a thread pool.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import warnings
+
+import numpy as np
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src._parallel import parallel_map
+from NBprocessing.continuous._general_functions_continuous import numeric_columns, numeric_block, nan_skew, \
+    power_transform, fit_power_lambdas, write_column_inplace
+
+
+class SkewCorrector(object):
+    """
+    Correct the skewness of numeric columns by log1p, Box-Cox or Yeo-Johnson transforms.
+
+    Parameters
+    ----------
+    :param method: string - 'auto', 'log1p', 'boxcox' or 'yeo-johnson'
+    The transform of the skewed columns, 'auto' picks Box-Cox for positive columns and Yeo-Johnson otherwise.
+
+    :param threshold: float, threshold >= 0
+    Only columns with an absolute skewness above the threshold are transformed.
+
+    :param n_jobs: int or None
+    Number of threads to estimate and transform chunks of columns with. -1 for all the cpus.
+
+    Attributes
+    ----------
+    skewness_: dictionary - {column name : skewness in fit} of all the checked columns
+    transforms_: dictionary - {column name : (transform name, lambda)} of the transformed columns,
+                 the lambda of 'log1p' is None
+
+    for exemple:
+    corrector = SkewCorrector(threshold=1).fit(X_train)
+    corrector.transform(X_train)
+    corrector.transform(X_test)
+    """
+
+    AUTO = "auto"
+    LOG1P = "log1p"
+    BOXCOX = "boxcox"
+    YEO_JOHNSON = "yeo-johnson"
+    METHODS = (AUTO, LOG1P, BOXCOX, YEO_JOHNSON)
+
+    # number of values of a chunk of columns that is estimated at once, bounds the memory of the search
+    CHUNK_VALUES = 2 ** 22
+
+    def __init__(self, method=AUTO, threshold=0.5, n_jobs=None):
+        if method not in self.METHODS:
+            raise ValueError(constance_object.CHECK_SKEW_METHOD)
+        if (type(threshold) != float and type(threshold) != int) or threshold < 0:
+            raise ValueError(constance_object.CHECK_SKEW_THRESHOLD)
+        _CheckInput._check_n_jobs(n_jobs)
+        self.method = method
+        self.threshold = threshold
+        self.n_jobs = n_jobs
+        self.skewness_ = {}
+        self.transforms_ = {}
+
+    def fit(self, database, columns=None):
+        """
+        Measure the skewness of every column in 'columns' (a column name or a list/tuple of names),
+        if None of all the numeric columns, and fit a transform to the skewed columns. Returns the fitted corrector.
+        """
+
+        _CheckInput._check_database_input(database)
+        if columns is not None:
+            _CheckInput._check_column_names_in_database(columns, database)
+
+        columns = numeric_columns(database, columns)
+        block = numeric_block(database, columns)
+        skewness = nan_skew(block)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            minimum = np.nanmin(block, axis=0)
+
+        transform_names = {}
+        for position, column_name in enumerate(columns):
+            if np.isnan(skewness[position]) or abs(skewness[position]) <= self.threshold:
+                continue
+            transform_names[column_name] = self._transform_name(column_name, minimum[position])
+
+        lambdas = {}
+        for transform_name in (self.BOXCOX, self.YEO_JOHNSON):
+            positions = [position for position, column_name in enumerate(columns)
+                         if transform_names.get(column_name) == transform_name]
+            chunk_size = max(1, self.CHUNK_VALUES // max(len(block), 1))
+            chunks = [positions[start:start + chunk_size] for start in range(0, len(positions), chunk_size)]
+            chunk_lambdas = parallel_map(lambda chunk: fit_power_lambdas(block[:, chunk], transform_name),
+                                         chunks, self.n_jobs)
+            for chunk, values in zip(chunks, chunk_lambdas):
+                lambdas.update({columns[position]: float(value) for position, value in zip(chunk, values)})
+
+        self.skewness_ = dict(zip(columns, skewness.tolist()))
+        self.transforms_ = {column_name: (transform_name, lambdas.get(column_name))
+                            for column_name, transform_name in transform_names.items()}
+        return self
+
+    def transform(self, database):
+        """
+        Transform inplace all the fitted skewed columns in the given database. Missing values are kept.
+        """
+
+        _CheckInput._check_database_input(database)
+        if not self.skewness_:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
+        _CheckInput._check_column_names_in_database(list(self.transforms_), database)
+
+        columns = list(self.transforms_)
+        block = numeric_block(database, columns)
+        transformed = parallel_map(lambda position: power_transform(block[:, position],
+                                                                    *self.transforms_[columns[position]]),
+                                   range(len(columns)), self.n_jobs)
+        for column_name, values in zip(columns, transformed):
+            write_column_inplace(database, column_name, values)
+
+    def fit_transform(self, database, columns=None):
+        """
+        Fit the corrector on 'columns' and transform the skewed columns inplace. Returns the fitted corrector.
+        """
+
+        self.fit(database, columns)
+        self.transform(database)
+        return self
+
+    def _transform_name(self, column_name, minimum):
+        if self.method == self.AUTO:
+            return self.BOXCOX if minimum > 0 else self.YEO_JOHNSON
+        if self.method == self.BOXCOX and not minimum > 0:
+            raise ValueError(constance_object.SKEW_NOT_POSITIVE.format(column_name))
+        if self.method == self.LOG1P and not minimum > -1:
+            raise ValueError(constance_object.SKEW_NOT_ABOVE_MINUS_ONE.format(column_name))
+        return self.method
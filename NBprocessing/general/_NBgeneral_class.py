@@ -2,34 +2,119 @@
 Generic functions to manipulate features in pandas data frame.
 
 This library include the functions:
-    1. missing_values(database):
+    1. missing_values(database, profile=None):
         prints a data frame with all columns that have missing values.
         for every column will print the number of missing values and the present of it out of total index in the column
+        The missing values are counted in one pass over bounded blocks of the data frame,
+        or read from a DatasetProfile of the database.
+
+    2. missing_values_by_chunks(source, column_name=None, chunksize=100000):
+        The out-of-core version of 'missing_values' for a CSV/Parquet file or an iterable of data frames
+        that does not fit in memory - the missing values are summed chunk by chunk.
+
+    3. split_and_check(database, column_name, test_size=0.3, method="random", by=None, random_state=42,
+                       return_indices=False):
+        Gets a database and target column, split and return:
+            2 different data sets splitted by the ratio defined in 'test_size' variable
+            etch data set will be split to main data and target column
+            total 4 variables
+        Will also print the shape of every data set.
+        The split is random, stratified, by groups or by time, and can return the positional indexes
+        of the train and the test rows instead of copies of the data sets.
+
+    4. k_fold_split(database, column_name, n_splits=5, method="random", by=None, random_state=42,
+                    return_indices=False):
+        Yields the data sets (or the positional indexes) of every fold of a random, stratified,
+        grouped or time-ordered K-fold split.
+
+    5. profile(database, num_categories=5, n_jobs=None):
+        Profile all the columns in a single scan of every column - missing values, cardinality, top
+        categories, mean, std, min, quartiles, max and IQR outliers. Returns a DatasetProfile that
+        'missing_values' and 'category_ratio' can consume instead of scanning the database again.
+
+    6. reduce_memory(database, column_name=None, category_threshold=0.5, arrow_strings=False):
+        Reduce inplace the memory of the database without changing any value - downcast integers and floats
+        to the smallest safe dtype and convert strings with few unique values to 'category' (or to Arrow
+        strings). Prints the memory usage before and after.
+
+    7. get_num_duplicates(database, column_name=None):
+        Prints how many rows are duplicates of earlier rows in all or some of the columns, from a single
+        vectorized 64-bit hash of every row. Rows with equal hashes are verified to be equal.
+
+    8. remove_duplicates(database, column_name=None, keep="first", policy=None):
+        Remove inplace the duplicated rows by the verified row hashes and a single positional drop.
+        Before removing the rows will consult the execution policy. Returns an ActionReport.
+
+    9. remove_duplicates_by_chunks(source, column_name=None, chunksize=100000):
+        The out-of-core version of 'remove_duplicates' - yields the chunks of one or many CSV/Parquet files or
+        iterables of data frames without the rows that are duplicates of rows in any earlier chunk or file.
 
 Created by: Nir Barazida
 Good luck!
 """
 
+import numpy as np
 import pandas as pd
 from NBprocessing.general._input_check_general import _InputCheckGeneral
-from sklearn.model_selection import train_test_split
+from NBprocessing.general._dataset_profile import DatasetProfile
+from NBprocessing.general._general_functions_general import null_counts, missing_values_frame, split_positions, \
+    fold_positions, take_split, reduced_dtype, row_hashes, duplicated_mask, seen_hashes_mask, add_seen_hashes
+from NBprocessing.src._execution_policy import ActionReport, Timer, resolve_policy
 from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src._general_functions import iter_chunks, to_column_list, remove_rows_by_mask
 
 class NBgeneral(object):
     """
     Generic functions to manipulate features in pandas data frame.
 
     This library include the functions:
-        1. missing_values(database):
+        1. missing_values(database, profile=None):
             prints a data frame with all columns that have missing values.
             for every column will print the number of missing values and the present of it out of total index in the column
+            The missing values are counted in one pass over bounded blocks of the data frame,
+            or read from a DatasetProfile of the database.
+
+        2. missing_values_by_chunks(source, column_name=None, chunksize=100000):
+            The out-of-core version of 'missing_values' for a CSV/Parquet file or an iterable of data frames
+            that does not fit in memory - the missing values are summed chunk by chunk.
 
-        2. split_and_check(database, column_name, test_size=0.3):
+        3. split_and_check(database, column_name, test_size=0.3, method="random", by=None, random_state=42,
+                           return_indices=False):
             Gets a database and target column, split and return:
                 2 different data sets splitted by the ratio defined in 'test_size' variable
                 etch data set will be split to main data and target column
                 total 4 variables
             Will also print the shape of every data set.
+            The split is random, stratified, by groups or by time, and can return the positional indexes
+            of the train and the test rows instead of copies of the data sets.
+
+        4. k_fold_split(database, column_name, n_splits=5, method="random", by=None, random_state=42,
+                        return_indices=False):
+            Yields the data sets (or the positional indexes) of every fold of a random, stratified,
+            grouped or time-ordered K-fold split.
+
+        5. profile(database, num_categories=5, n_jobs=None):
+            Profile all the columns in a single scan of every column - missing values, cardinality, top
+            categories, mean, std, min, quartiles, max and IQR outliers. Returns a DatasetProfile that
+            'missing_values' and 'category_ratio' can consume instead of scanning the database again.
+
+        6. reduce_memory(database, column_name=None, category_threshold=0.5, arrow_strings=False):
+            Reduce inplace the memory of the database without changing any value - downcast integers and floats
+            to the smallest safe dtype and convert strings with few unique values to 'category' (or to Arrow
+            strings). Prints the memory usage before and after.
+
+        7. get_num_duplicates(database, column_name=None):
+            Prints how many rows are duplicates of earlier rows in all or some of the columns, from a single
+            vectorized 64-bit hash of every row. Rows with equal hashes are verified to be equal.
+
+        8. remove_duplicates(database, column_name=None, keep="first", policy=None):
+            Remove inplace the duplicated rows by the verified row hashes and a single positional drop.
+            Before removing the rows will consult the execution policy. Returns an ActionReport.
+
+        9. remove_duplicates_by_chunks(source, column_name=None, chunksize=100000):
+            The out-of-core version of 'remove_duplicates' - yields the chunks of one or many CSV/Parquet files or
+            iterables of data frames without the rows that are duplicates of rows in any earlier chunk or file.
 
     Created by: Nir Barazida
     Good luck!
@@ -37,7 +122,7 @@ class NBgeneral(object):
 
     @staticmethod
     @_InputCheckGeneral._missing_values_checker
-    def missing_values(database):
+    def missing_values(database, profile=None):
         """
         General Information
         ----------
@@ -49,6 +134,10 @@ class NBgeneral(object):
         :param database: pandas Data Frame
         data set to fill missing values in.
 
+        :param profile: DatasetProfile or None
+        A profile of the database (see 'profile') - the missing values are read from it instead of
+        scanning the database again.
+
         Returns
         -------
         None.
@@ -59,15 +148,312 @@ class NBgeneral(object):
         ValueError : If input value not as mentioned above.
         """
 
-        columns_missing_values = (database.count() / len(database)) < 1
-        missing_values = database.loc[:, columns_missing_values].isnull().sum().sort_values(ascending=False)
-        missing_value_df = pd.concat([missing_values, 100 * round(missing_values / len(database), 3)],
-                                     axis=1, keys=["#Missing_values", "%Missing_values"])
-        return missing_value_df
+        if profile is not None:
+            return profile.missing_values()
+        return missing_values_frame(null_counts(database), len(database))
+
+    @staticmethod
+    @_InputCheckGeneral._profile_checker
+    def profile(database, num_categories=5, n_jobs=None):
+        """
+        General Information
+        ----------
+        Profile all the columns of the database in a single scan of every column:
+        the number and the percent of missing values, the number of unique values, the top categories and
+        for numeric columns the mean, the standard deviation, the minimum, the quartiles, the maximum and the
+        number of values outside the 1.5 IQR fences.
+        The columns are profiled in parallel. The returned profile can be passed to 'missing_values' and to
+        'NBcategorical.category_ratio' instead of scanning the database again.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+
+        :param num_categories: int
+        The number of top categories kept for every column.
+
+        :param n_jobs: int or None
+        Number of threads that profile the columns in parallel. None for one thread, -1 for all the cpus.
+
+        Returns
+        -------
+        DatasetProfile - 'summary_' is a data frame with a row of statistics per column and 'top_categories_'
+        is the long format data frame of 'category_ratio' of all the columns.
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        """
+
+        return DatasetProfile(num_categories, n_jobs).fit(database)
+
+    @staticmethod
+    @_InputCheckGeneral._reduce_memory_checker
+    def reduce_memory(database, column_name=None, category_threshold=0.5, arrow_strings=False):
+        """
+        General Information
+        ----------
+        Reduce inplace the memory of the database without changing any value:
+            integers are downcast to the smallest integer dtype between their minimum and maximum,
+            floats are downcast to float32 only if every value is exactly representable in float32,
+            strings with few unique values are converted to 'category' and,
+            with 'arrow_strings', the other string columns are converted to Arrow-backed strings.
+        Every column is inspected once. Booleans, time-dates and categories are kept.
+        Will also print the memory usage (memory_usage(deep=True)) before and after.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to reduce, or a list of columns. If None will reduce all the columns.
+
+        :param category_threshold: float range 0<=x<=1
+        A string column is converted to 'category' if the number of its unique values is at most
+        this ratio of its values. 0 to never convert to 'category'.
+
+        :param arrow_strings: bool
+        If True the string columns that are not converted to 'category' are converted to 'string[pyarrow]'
+        (requires pyarrow). The missing values of these columns become pd.NA.
+
+        Returns
+        -------
+        pandas Data Frame - a row per reduced column with the dtype and the memory (bytes) before and after.
+        prints the memory usage of the database before and after.
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        NameError : If a column is not in the database.
+        ImportError : If 'arrow_strings' and pyarrow is not installed.
+        """
+
+        if arrow_strings:
+            try:
+                import pyarrow
+            except ImportError:
+                raise ImportError(constance_object.PYARROW_MISSING)
+
+        columns = list(database.columns) if column_name is None else to_column_list(column_name)
+        memory_before = database.memory_usage(index=False, deep=True)
+        reduced_dtypes = {}
+        for column in columns:
+            dtype = reduced_dtype(database[column], category_threshold, arrow_strings)
+            if dtype is not None:
+                reduced_dtypes[column] = (database[column].dtype, dtype)
+                database[column] = database[column].astype(dtype)
+        memory_after = database.memory_usage(index=False, deep=True)
+
+        total_before, total_after = memory_before.sum(), memory_after.sum()
+        print(constance_object.MEMORY_USAGE.format(round(total_before / 2 ** 20, 2), round(total_after / 2 ** 20, 2),
+                                                   round(100 * (1 - total_after / total_before), 2)
+                                                   if total_before else 0.0))
+        reduced_columns = list(reduced_dtypes)
+        return pd.DataFrame({"dtype_before": [str(reduced_dtypes[column][0]) for column in reduced_columns],
+                             "dtype_after": [str(database[column].dtype) for column in reduced_columns],
+                             "memory_before": memory_before[reduced_columns].to_numpy(),
+                             "memory_after": memory_after[reduced_columns].to_numpy()},
+                            index=pd.Index(reduced_columns))
+
+    @staticmethod
+    @_InputCheckGeneral._get_num_duplicates_checker
+    def get_num_duplicates(database, column_name=None):
+        """
+        General Information
+        ----------
+        Prints how many rows are duplicates of earlier rows, in all the columns or in a subset of the columns.
+        Every row is hashed once - every column is hashed by a vectorized hash and the column hashes are
+        combined into a 64-bit row hash. The rows with equal hashes are verified to be equal,
+        thus a hash collision never counts as a duplicate.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+
+        :param column_name: string or list/tuple of strings or None
+        The columns that are compared, if None all the columns.
+
+        Returns
+        -------
+        dictionary with:
+            'duplicates' - the number of rows that are duplicates of earlier rows
+            'duplicated_groups' - the number of distinct rows that have duplicates
+            'collisions' - the number of hash collisions that were resolved by an exact comparison
+        print the number of duplicates and the percent of the database they are.
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        NameError : If a column is not in the database.
+        """
+
+        columns = None if column_name is None else to_column_list(column_name)
+        hashes = row_hashes(database, columns)
+        duplicates_mask, collisions = duplicated_mask(database, columns, "first", hashes)
+        duplicates = int(duplicates_mask.sum())
+        if collisions:
+            duplicated_groups = int(duplicated_mask(database, columns, False, hashes)[0].sum()) - duplicates
+        else:
+            duplicated_groups = len(np.unique(hashes[duplicates_mask]))
+        print(constance_object.NUM_DUPLICATES.format(duplicates, round(duplicates * 100 / len(database), 2)
+                                                     if len(database) else 0.0, duplicated_groups))
+        return {"duplicates": duplicates, "duplicated_groups": duplicated_groups, "collisions": collisions}
+
+    @staticmethod
+    @_InputCheckGeneral._remove_duplicates_checker
+    def remove_duplicates(database, column_name=None, keep="first", policy=None):
+        """
+        General Information
+        ----------
+        Remove inplace the duplicated rows, in all the columns or in a subset of the columns, by the verified
+        64-bit row hashes of 'get_num_duplicates' and a single positional drop.
+        Before removing the rows will consult the execution policy with the number of rows that
+        will be removed and the percent of the database that will be lost.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+
+        :param column_name: string or list/tuple of strings or None
+        The columns that are compared, if None all the columns.
+
+        :param keep: 'first', 'last' or False
+        Which copy of a duplicated row is kept (as DataFrame.drop_duplicates), False to remove all the copies.
+
+        :param policy: ExecutionPolicy, string or None
+        How the removal is approved. If None the package execution policy is used (default 'prompt').
+
+        Returns
+        -------
+        ActionReport
+        The number of rows that were (or would have been) removed and rather the action was executed.
+        'report.details' holds the number of hash 'collisions' that were resolved by an exact comparison.
+        preform the action on the database inplace
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        NameError : If a column is not in the database.
+        """
+
+        timer = Timer()
+        policy = resolve_policy(policy)
+        rows_before = len(database)
+        columns = None if column_name is None else to_column_list(column_name)
+        remove_mask, collisions = duplicated_mask(database, columns, keep)
+        rows_lost = int(remove_mask.sum())
+        percent_lost = round(rows_lost * 100 / rows_before, 2) if rows_before else 0.0
+
+        executed = policy.approve(constance_object.DROP_ROW.format(rows_lost, percent_lost),
+                                  rows_lost=rows_lost, percent_lost=percent_lost)
+
+        if executed:
+            remove_rows_by_mask(database, remove_mask)
+
+        return ActionReport("remove_duplicates", executed, rows_before, rows_affected=rows_lost,
+                            elapsed_seconds=timer.elapsed, details={"collisions": collisions})
+
+    @staticmethod
+    @_InputCheckGeneral._remove_duplicates_by_chunks_checker
+    def remove_duplicates_by_chunks(source, column_name=None, chunksize=100000):
+        """
+        General Information
+        ----------
+        The out-of-core version of 'remove_duplicates' - yields the chunks of one or many sources without
+        the rows that are duplicates of earlier rows, in the same chunk or in any earlier chunk or file,
+        thus files that do not fit in memory can be deduplicated across each other.
+        Only the 64-bit hashes of the kept rows are kept in memory (8 bytes a row, in sorted runs).
+        The duplicates within a chunk are verified to be equal. The duplicates across chunks are NOT verified -
+        the earlier rows are not kept, thus a row is dropped when its hash is equal to the hash of a kept row
+        of an earlier chunk. Numeric values are hashed exactly (integers as integers), thus only a true 64-bit
+        hash collision drops a distinct row - the probability in n rows is about n^2 / 2^65
+        (~3e-4 for 100 million rows). Use 'remove_duplicates' for a verified removal of data that fits in memory.
+
+        Parameters
+        ----------
+        :param source: string path, pandas Data Frame, iterable of pandas Data Frames, or a list/tuple of them
+        Path to a CSV file or a Parquet file ('.parquet' / '.pq', requires pyarrow), a data frame
+        or an iterable of data frames (e.g. pd.read_csv(path, chunksize=...)).
+        A list or tuple of sources is deduplicated across all of them, in order.
+
+        :param column_name: string or list/tuple of strings or None
+        The columns that are compared, if None all the columns.
+
+        :param chunksize: int
+        Number of rows to read in every chunk of a file or a data frame.
+
+        Returns
+        -------
+        generator of pandas Data Frames - the chunks without the duplicated rows (the first copy is kept).
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        NameError : If a column is not in a chunk.
+        """
+
+        columns = None if column_name is None else to_column_list(column_name)
+        seen_runs = []
+        for single_source in source if isinstance(source, (list, tuple)) else [source]:
+            for chunk in iter_chunks(single_source, chunksize):
+                if columns is not None:
+                    _CheckInput._check_column_names_in_database(columns, chunk)
+                hashes = row_hashes(chunk, columns)
+                remove_mask, _ = duplicated_mask(chunk, columns, "first", hashes)
+                remove_mask |= seen_hashes_mask(seen_runs, hashes)
+                add_seen_hashes(seen_runs, hashes[~remove_mask])
+                yield chunk[~remove_mask]
+
+    @staticmethod
+    @_InputCheckGeneral._missing_values_by_chunks_checker
+    def missing_values_by_chunks(source, column_name=None, chunksize=100000):
+        """
+        General Information
+        ----------
+        The out-of-core version of 'missing_values' - reads data that does not fit in memory chunk by chunk
+        and sums the missing values of every column over the chunks, thus only one chunk is in memory at a time.
+        Returns the same data frame as 'missing_values' for the whole data.
+
+        Parameters
+        ----------
+        :param source: string path, pandas Data Frame or iterable of pandas Data Frames
+        Path to a CSV file or a Parquet file ('.parquet' / '.pq', requires pyarrow), a data frame
+        or an iterable of data frames (e.g. pd.read_csv(path, chunksize=...)).
+
+        :param column_name: string or list/tuple of strings or None
+        The name of the column to check, or a list of columns - only these columns are read from a file.
+        If None will check all the columns.
+
+        :param chunksize: int
+        Number of rows to read in every chunk of a file or a data frame.
+
+        Returns
+        -------
+        pandas Data Frame with all columns that have missing values.
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        NameError : If a column is not in a chunk.
+        """
+
+        columns = None if column_name is None else to_column_list(column_name)
+        total_counts = {}
+        n_rows = 0
+        for chunk in iter_chunks(source, chunksize, columns):
+            counts = null_counts(chunk)
+            if columns is not None:
+                _CheckInput._check_column_names_in_database(columns, chunk)
+                counts = counts[columns]
+            for column, count in counts.items():
+                total_counts[column] = total_counts.get(column, 0) + int(count)
+            n_rows += len(chunk)
+        return missing_values_frame(pd.Series(total_counts, dtype="int64"), n_rows)
 
     @staticmethod
     @_InputCheckGeneral._split_and_check_checker
-    def split_and_check(database, column_name, test_size=0.3):
+    def split_and_check(database, column_name, test_size=0.3, method="random", by=None, random_state=42,
+                        return_indices=False):
         """
         General Information
         ----------
@@ -76,6 +462,8 @@ class NBgeneral(object):
             etch data set will be split to main data and target column
             total 4 variables
         Will also print the shape of every data set.
+        Every data set is copied once from the database. With 'return_indices' only the positional indexes
+        of the train and the test rows are returned, thus splitting a large database does not copy it.
 
         Parameters
         ----------
@@ -88,23 +476,92 @@ class NBgeneral(object):
         :param test_size: float range 0<x<1
         the ratio that the data set will be split by
 
+        :param method: string - 'random', 'stratified', 'group' or 'time'
+        'random' - the rows are shuffled.
+        'stratified' - the rows are shuffled and the ratio of the classes of 'by' (the target column if None)
+                       is kept in both data sets.
+        'group' - all the rows of a group of the 'by' column are in the same data set,
+                  'test_size' is the ratio of the groups.
+        'time' - the test set is the last rows in the order of the 'by' column (the order of the rows if None),
+                 no row of the train set comes after the test set.
+
+        :param by: string or None
+        the name of the column to stratify, group or order the rows by.
+
+        :param random_state: int or None
+        Seed of the shuffle of the 'random', 'stratified' and 'group' methods.
+
+        :param return_indices: bool
+        If True returns the positional indexes of the train and the test rows (to use with database.iloc)
+        instead of the data sets.
 
         Returns
         -------
         X_train, X_test, y_train, y_test
+        or train_indices, test_indices - NumPy int arrays if 'return_indices'
         print the shape of every data set.
 
         Raises
         ------
         ValueError : If input value not as mentioned above.
+        NameError : If a column is not in the database.
         """
 
-        X = database.drop(column_name, axis=1)
-        y = database[column_name]
-        X_train, X_test, y_train, y_test = train_test_split(X, y,
-                                            test_size=test_size, random_state=42)
-        print(constance_object.SPLIT_AND_CHECK.format(X_train.shape,y_train.shape,
-                                                      X_test.shape,y_test.shape))
-        return X_train, X_test, y_train, y_test
+        train, test = split_positions(database, column_name, test_size, method, by, random_state)
+        n_features = database.shape[1] - 1
+        print(constance_object.SPLIT_AND_CHECK.format((len(train), n_features), (len(train),),
+                                                      (len(test), n_features), (len(test),)))
+        if return_indices:
+            return train, test
+        return take_split(database, column_name, train, test)
 
+    @staticmethod
+    @_InputCheckGeneral._k_fold_split_checker
+    def k_fold_split(database, column_name, n_splits=5, method="random", by=None, random_state=42,
+                     return_indices=False):
+        """
+        General Information
+        ----------
+        The K-fold version of 'split_and_check' - yields the data sets of every fold by the same split methods,
+        every row is in the test set of one fold (except in the 'time' method).
+        The data sets of a fold are copied only when the fold is reached.
+
+        Parameters
+        ----------
+        :param database: pandas Data Frame
+
+        :param column_name: string
+        the name of the target column
+
+        :param n_splits: int, n_splits >= 2
+        the number of folds
+
+        :param method: string - 'random', 'stratified', 'group' or 'time'
+        As in 'split_and_check'. The 'group' folds are not shuffled, the 'time' folds are expanding windows -
+        the train set of a fold is all the rows before its test set.
+
+        :param by: string or None
+        the name of the column to stratify, group or order the rows by.
+
+        :param random_state: int or None
+        Seed of the shuffle of the 'random' and 'stratified' methods.
+
+        :param return_indices: bool
+        If True yields the positional indexes of the train and the test rows instead of the data sets.
+
+        Returns
+        -------
+        generator of X_train, X_test, y_train, y_test of every fold
+        or of train_indices, test_indices - NumPy int arrays if 'return_indices'
+
+        Raises
+        ------
+        ValueError : If input value not as mentioned above.
+        NameError : If a column is not in the database.
+        """
 
+        for train, test in fold_positions(database, column_name, n_splits, method, by, random_state):
+            if return_indices:
+                yield train, test
+            else:
+                yield take_split(database, column_name, train, test)
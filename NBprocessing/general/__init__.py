@@ -2,9 +2,52 @@
 Generic functions to manipulate features in pandas data frame.
 
 This library include the functions:
-    1. missing_values(database):
+    1. missing_values(database, profile=None):
         prints a data frame with all columns that have missing values.
         for every column will print the number of missing values and the present of it out of total index in the column
+        The missing values are counted in one pass over bounded blocks of the data frame,
+        or read from a DatasetProfile of the database.
+
+    2. missing_values_by_chunks(source, column_name=None, chunksize=100000):
+        The out-of-core version of 'missing_values' for a CSV/Parquet file or an iterable of data frames
+        that does not fit in memory - the missing values are summed chunk by chunk.
+
+    3. split_and_check(database, column_name, test_size=0.3, method="random", by=None, random_state=42,
+                       return_indices=False):
+        Gets a database and target column, split and return:
+            2 different data sets splitted by the ratio defined in 'test_size' variable
+            etch data set will be split to main data and target column
+            total 4 variables
+        Will also print the shape of every data set.
+        The split is random, stratified, by groups or by time, and can return the positional indexes
+        of the train and the test rows instead of copies of the data sets.
+
+    4. k_fold_split(database, column_name, n_splits=5, method="random", by=None, random_state=42,
+                    return_indices=False):
+        Yields the data sets (or the positional indexes) of every fold of a random, stratified,
+        grouped or time-ordered K-fold split.
+
+    5. profile(database, num_categories=5, n_jobs=None):
+        Profile all the columns in a single scan of every column - missing values, cardinality, top
+        categories, mean, std, min, quartiles, max and IQR outliers. Returns a DatasetProfile that
+        'missing_values' and 'category_ratio' can consume instead of scanning the database again.
+
+    6. reduce_memory(database, column_name=None, category_threshold=0.5, arrow_strings=False):
+        Reduce inplace the memory of the database without changing any value - downcast integers and floats
+        to the smallest safe dtype and convert strings with few unique values to 'category' (or to Arrow
+        strings). Prints the memory usage before and after.
+
+    7. get_num_duplicates(database, column_name=None):
+        Prints how many rows are duplicates of earlier rows in all or some of the columns, from a single
+        vectorized 64-bit hash of every row. Rows with equal hashes are verified to be equal.
+
+    8. remove_duplicates(database, column_name=None, keep="first", policy=None):
+        Remove inplace the duplicated rows by the verified row hashes and a single positional drop.
+        Before removing the rows will consult the execution policy. Returns an ActionReport.
+
+    9. remove_duplicates_by_chunks(source, column_name=None, chunksize=100000):
+        The out-of-core version of 'remove_duplicates' - yields the chunks of one or many CSV/Parquet files or
+        iterables of data frames without the rows that are duplicates of rows in any earlier chunk or file.
 
 Created by: Nir Barazida
 Good luck!
@@ -0,0 +1,116 @@
+"""
+One-pass profiling report of a data frame.
+
+The profile scans every column once - a single value_counts - and derives from the table of the unique values
+and their counts the number of missing values, the cardinality, the top categories and, for a numeric column,
+the mean, the standard deviation, the minimum, the maximum, the quartiles and the number of IQR outliers.
+The columns are profiled in parallel by a thread pool. The report can be passed to 'missing_values' and
+'category_ratio' instead of scanning the database again.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import pandas as pd
+
+from NBprocessing.src import constance_object
+from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src._general_functions import to_column_list
+from NBprocessing.src._parallel import parallel_map
+from NBprocessing.general._general_functions_general import column_profile, missing_values_frame
+
+
+class DatasetProfile(object):
+    """
+    Profile of all the columns of a database - null counts, cardinality, top categories and numeric statistics.
+
+    Parameters
+    ----------
+    :param num_categories: int
+    The number of top categories kept for every column.
+
+    :param n_jobs: int or None
+    Number of threads that profile the columns in parallel. -1 for all the cpus.
+
+    Attributes
+    ----------
+    n_rows_: int - the number of rows of the profiled database
+    summary_: pandas Data Frame - a row per column with the dtype, the number of missing values ('missing'),
+              the number of unique values ('unique') and for numeric columns 'mean', 'std', 'min', '25%', '50%',
+              '75%', 'max' and the number of values outside the 1.5 IQR fences ('outliers')
+    top_categories_: pandas Data Frame - the long format data frame of 'category_ratio' of all the columns
+
+    for exemple:
+    profile = NBgeneral.profile(database, n_jobs=-1)
+    profile.summary_
+    NBgeneral.missing_values(database, profile=profile)
+    NBcategorical.category_ratio(database, ["fuel"], profile=profile)
+    """
+
+    SUMMARY_COLUMNS = ["dtype", "missing", "unique", "mean", "std", "min", "25%", "50%", "75%", "max", "outliers"]
+
+    def __init__(self, num_categories=5, n_jobs=None):
+        _CheckInput._check_num_categories(num_categories)
+        _CheckInput._check_n_jobs(n_jobs)
+        self.num_categories = num_categories
+        self.n_jobs = n_jobs
+        self.n_rows_ = None
+        self.summary_ = None
+        self.top_categories_ = None
+
+    def fit(self, database, columns=None):
+        """
+        Profile every column in 'columns' (a column name or a list/tuple of names), if None all the columns.
+        Returns the fitted profile.
+        """
+
+        _CheckInput._check_database_input(database)
+        if columns is not None:
+            _CheckInput._check_column_names_in_database(columns, database)
+
+        columns = list(database.columns) if columns is None else to_column_list(columns)
+        profiles = parallel_map(lambda column_name: column_profile(database[column_name], self.num_categories),
+                                columns, self.n_jobs)
+
+        self.n_rows_ = len(database)
+        self.summary_ = pd.DataFrame([statistics for statistics, _ in profiles], index=pd.Index(columns),
+                                     columns=self.SUMMARY_COLUMNS)
+        self.summary_.insert(2, "%missing", 100 * round(self.summary_["missing"] / self.n_rows_, 3)
+                             if self.n_rows_ else 0.0)
+        self.top_categories_ = pd.concat([top_categories for _, top_categories in profiles], ignore_index=True)
+        return self
+
+    def missing_values(self):
+        """
+        Returns the data frame of 'missing_values' - all the columns with missing values.
+        """
+
+        self._check_fitted()
+        return missing_values_frame(self.summary_["missing"], self.n_rows_)
+
+    def category_ratio(self, columns_to_check=None, num_categories=None):
+        """
+        Returns the long format data frame of 'category_ratio' of the columns in 'columns_to_check'
+        (all the profiled columns if None) with the top 'num_categories' categories of every column
+        (all the profiled top categories if None).
+        """
+
+        self._check_fitted()
+        num_categories = self.num_categories if num_categories is None else num_categories
+        if num_categories > self.num_categories:
+            raise ValueError(constance_object.PROFILE_NUM_CATEGORIES.format(self.num_categories))
+        columns_to_check = list(self.summary_.index) if columns_to_check is None else to_column_list(columns_to_check)
+        missing_columns = set(columns_to_check) - set(self.summary_.index)
+        if missing_columns:
+            raise NameError(constance_object.PROFILE_COLUMNS.format(sorted(missing_columns, key=str)))
+
+        top_categories = self.top_categories_[self.top_categories_["rank"] <= num_categories]
+        column_order = top_categories["column"].map({column: position for position, column
+                                                     in enumerate(columns_to_check)})
+        top_categories = top_categories[column_order.notna()]
+        return top_categories.iloc[column_order[column_order.notna()].argsort(kind="stable")] \
+            .reset_index(drop=True)
+
+    def _check_fitted(self):
+        if self.summary_ is None:
+            raise ValueError(constance_object.NOT_FITTED.format(type(self).__name__))
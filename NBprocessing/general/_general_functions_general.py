@@ -0,0 +1,368 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_integer_dtype, is_float_dtype, \
+    is_unsigned_integer_dtype, infer_dtype
+
+from NBprocessing.src._general_functions import smallest_int_dtype
+
+SPLIT_METHODS = ("random", "stratified", "group", "time")
+PROFILE_QUANTILES = (0.25, 0.5, 0.75)
+PROFILE_IQR_THRESHOLD = 1.5
+
+ARROW_STRING_DTYPE = "string[pyarrow]"
+DUPLICATES_KEEP = ("first", "last", False)
+
+# FNV-1a constants - the column hashes are combined in order into a single 64-bit row hash
+ROW_HASH_OFFSET = np.uint64(14695981039346656037)
+ROW_HASH_PRIME = np.uint64(1099511628211)
+# the key of a missing numeric value - the bits of the float64 NaN
+MISSING_VALUE_KEY = np.array(np.nan).view(np.uint64)[()]
+
+# number of cells of a block of the data frame that is checked for missing values at once
+NULL_COUNT_BLOCK_VALUES = 2 ** 22
+# from this number of rows a column is counted on its own array, the per column overhead is negligible
+LONG_COLUMN_ROWS = 2 ** 16
+
+
+def null_counts(database, block_values=NULL_COUNT_BLOCK_VALUES):
+    """
+    Count the missing values of every column in a single pass over blocks of at most 'block_values' cells,
+    thus the full rows x columns boolean frame of 'database.isnull()' is never materialized.
+    A long column is counted on its own array slice by slice, a short data frame is counted
+    in blocks of many columns to save the per column overhead.
+    Returns a pandas Series {column name : number of missing values} in the order of the columns.
+    """
+
+    n_rows, n_columns = database.shape
+    counts = np.zeros(n_columns, dtype=np.int64)
+    if n_rows >= LONG_COLUMN_ROWS or n_rows > block_values // 2:
+        for position in range(n_columns):
+            values = database.iloc[:, position].array
+            for start in range(0, n_rows, block_values):
+                counts[position] += np.count_nonzero(pd.isna(values[start:start + block_values]))
+    else:
+        columns_step = block_values // max(n_rows, 1)
+        for start in range(0, n_columns, columns_step):
+            counts[start:start + columns_step] = database.iloc[:, start:start + columns_step].isna().sum().to_numpy()
+    return pd.Series(counts, index=database.columns)
+
+
+def missing_values_frame(counts, n_rows):
+    """
+    Returns the data frame of 'missing_values' from the missing values of every column (pandas Series)
+    and the total number of rows - only the columns with missing values, sorted by the number of
+    missing values, with the number and the percent of missing values.
+    """
+
+    missing_values = counts[counts > 0].sort_values(ascending=False)
+    return pd.concat([missing_values, 100 * round(missing_values / n_rows, 3)],
+                     axis=1, keys=["#Missing_values", "%Missing_values"])
+
+
+def split_positions(database, column_name, test_size, method, by=None, random_state=None):
+    """
+    Returns the positional indexes (NumPy int arrays) of the train rows and of the test rows of the database.
+    'random' - shuffled rows. 'stratified' - shuffled rows with the ratio of the classes of 'by'
+    (the target column if None) kept in both sets. 'group' - all the rows of a group of 'by' are in the same set,
+    'test_size' is the ratio of the groups. 'time' - the last 'test_size' rows in the order of 'by'
+    (the order of the rows if None) are the test set.
+    """
+
+    positions = np.arange(len(database))
+    if method == "time":
+        order = time_order(database, by)
+        n_train = len(order) - int(np.ceil(test_size * len(order)))
+        return order[:n_train], order[n_train:]
+
+    from sklearn.model_selection import train_test_split, GroupShuffleSplit
+
+    if method == "group":
+        splitter = GroupShuffleSplit(n_splits=1, test_size=test_size, random_state=random_state)
+        return next(splitter.split(positions, groups=database[by].to_numpy()))
+    stratify = database[column_name if by is None else by].to_numpy() if method == "stratified" else None
+    train, test = train_test_split(positions, test_size=test_size, random_state=random_state, stratify=stratify)
+    return train, test
+
+
+def fold_positions(database, column_name, n_splits, method, by=None, random_state=None):
+    """
+    Yields the positional indexes (NumPy int arrays) of the train rows and of the test rows of every fold
+    of a K-fold split by the same methods as 'split_positions'. The 'group' folds are not shuffled and the
+    'time' folds are expanding windows - every test fold comes after its train rows.
+    """
+
+    from sklearn.model_selection import KFold, StratifiedKFold, GroupKFold, TimeSeriesSplit
+
+    positions = np.arange(len(database))
+    if method == "time":
+        order = time_order(database, by)
+        for train, test in TimeSeriesSplit(n_splits).split(order):
+            yield order[train], order[test]
+    elif method == "group":
+        yield from GroupKFold(n_splits).split(positions, groups=database[by].to_numpy())
+    elif method == "stratified":
+        stratify = database[column_name if by is None else by].to_numpy()
+        yield from StratifiedKFold(n_splits, shuffle=True, random_state=random_state).split(positions, stratify)
+    else:
+        yield from KFold(n_splits, shuffle=True, random_state=random_state).split(positions)
+
+
+def time_order(database, by=None):
+    """
+    Returns the positions of the rows sorted by the column 'by' (stable, missing values last),
+    if None the order of the rows.
+    """
+
+    if by is None:
+        return np.arange(len(database))
+    return database[by].array.argsort(kind="stable")
+
+
+def take_split(database, column_name, train, test):
+    """
+    Returns X_train, X_test, y_train, y_test of the positional indexes of the train and the test rows.
+    Every set is copied once - the rows are taken and then the target column is popped without a copy.
+    """
+
+    X_train, X_test = database.take(train), database.take(test)
+    y_train, y_test = X_train.pop(column_name), X_test.pop(column_name)
+    return X_train, X_test, y_train, y_test
+
+
+def column_profile(column, num_categories):
+    """
+    Profile a single column from one value_counts pass - the only scan of the column.
+    The number of missing values, the cardinality and the top categories are read from the table of
+    the unique values and their counts. For a numeric column the mean, the standard deviation, the minimum,
+    the maximum, the quantiles (linear interpolation as np.nanquantile) and the number of IQR outliers
+    are computed from the sorted table as well.
+    Returns a dictionary of the statistics and a long format data frame of the top 'num_categories' categories
+    (as 'category_ratio').
+    """
+
+    counts = column.value_counts()
+    n_values = int(counts.sum())
+    statistics = {"dtype": str(column.dtype), "missing": len(column) - n_values, "unique": int((counts > 0).sum())}
+
+    top_counts = counts.iloc[:num_categories]
+    top_categories = pd.DataFrame({"column": [column.name] * len(top_counts),
+                                   "category": top_counts.index.to_numpy(dtype=object),
+                                   "ratio": top_counts.to_numpy() / n_values if n_values else np.nan,
+                                   "rank": np.arange(1, len(top_counts) + 1)})
+
+    if is_numeric_dtype(column.dtype) and not is_bool_dtype(column.dtype):
+        statistics.update(numeric_profile(counts.index.to_numpy(dtype=float), counts.to_numpy(dtype=np.int64)))
+    return statistics, top_categories
+
+
+def numeric_profile(values, counts):
+    """
+    Returns the numeric statistics of a column from its unique values and their counts.
+    """
+
+    statistics = dict.fromkeys(["mean", "std", "min"] + ["{:.0%}".format(q) for q in PROFILE_QUANTILES]
+                               + ["max", "outliers"], np.nan)
+    order = np.argsort(values)
+    values, counts = values[order], counts[order]
+    cumulative_counts = np.cumsum(counts)
+    n_values = cumulative_counts[-1] if len(counts) else 0
+    if not n_values:
+        return statistics
+
+    mean = float((values * counts).sum() / n_values)
+    variance = float((counts * (values - mean) ** 2).sum() / (n_values - 1)) if n_values > 1 else np.nan
+    # the value at a 0-based rank is the first unique value whose cumulative count is above the rank
+    ranks = (n_values - 1) * np.asarray(PROFILE_QUANTILES)
+    lower = values[np.searchsorted(cumulative_counts, np.floor(ranks), side="right")]
+    upper = values[np.searchsorted(cumulative_counts, np.ceil(ranks), side="right")]
+    quantiles = lower + (ranks - np.floor(ranks)) * (upper - lower)
+
+    interquartile_range = quantiles[-1] - quantiles[0]
+    outliers = (values < quantiles[0] - PROFILE_IQR_THRESHOLD * interquartile_range) | \
+               (values > quantiles[-1] + PROFILE_IQR_THRESHOLD * interquartile_range)
+    statistics.update({"mean": mean, "std": np.sqrt(variance), "min": float(values[0]), "max": float(values[-1]),
+                       "outliers": int(counts[outliers].sum())})
+    statistics.update({"{:.0%}".format(q): float(value) for q, value in zip(PROFILE_QUANTILES, quantiles)})
+    return statistics
+
+
+def reduced_dtype(column, category_threshold, arrow_strings=False):
+    """
+    Returns the smallest dtype that holds every value of the column unchanged, or None if the dtype can not
+    be reduced:
+        integers - the smallest signed integer dtype between the minimum and the maximum
+                   (nullable integers stay nullable).
+        floats - float32 only if every value survives the round trip float64 -> float32 -> float64.
+        strings - 'category' if the number of unique values is at most 'category_threshold' of the values,
+                  otherwise Arrow-backed strings if 'arrow_strings' and all the values are strings.
+    Booleans, time-dates and categories are not changed.
+    """
+
+    dtype = column.dtype
+    numpy_dtype = isinstance(dtype, np.dtype)
+    if is_bool_dtype(dtype):
+        return None
+
+    if is_integer_dtype(dtype):
+        minimum, maximum = column.min(), column.max()
+        if pd.isna(minimum):
+            return None
+        reduced = smallest_int_dtype(int(maximum), int(minimum))
+        if reduced.itemsize >= dtype.itemsize:
+            return None
+        return reduced if numpy_dtype else pd.api.types.pandas_dtype("Int{}".format(8 * reduced.itemsize))
+
+    if is_float_dtype(dtype):
+        if dtype.itemsize <= 4:
+            return None
+        values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(over="ignore"):
+            round_trip = values.astype(np.float32).astype(np.float64)
+        if not np.array_equal(round_trip, values, equal_nan=True):
+            return None
+        return np.dtype(np.float32) if numpy_dtype else pd.Float32Dtype()
+
+    if dtype == object or isinstance(dtype, pd.StringDtype):
+        n_values = column.count()
+        if not n_values:
+            return None
+        if column.nunique() <= category_threshold * n_values:
+            return "category"
+        if arrow_strings and str(dtype) != ARROW_STRING_DTYPE and infer_dtype(column, skipna=True) == "string":
+            return ARROW_STRING_DTYPE
+    return None
+
+
+def numeric_values(column):
+    """
+    Returns the exact values of a numeric column as a NumPy array - int64 (uint64 for unsigned 64-bit
+    integers) for an integer column and float64 for a float column - and the boolean mask of its missing values.
+    Integers are never converted to float64, thus integers above 2^53 stay distinct.
+    """
+
+    missing = column.isna().to_numpy()
+    if is_integer_dtype(column.dtype):
+        dtype = np.uint64 if is_unsigned_integer_dtype(column.dtype) and column.dtype.itemsize == 8 else np.int64
+        return column.to_numpy(dtype=dtype, na_value=0), missing
+    return column.to_numpy(dtype=np.float64, na_value=np.nan), missing
+
+
+def numeric_keys(column):
+    """
+    Returns a 64-bit key of every value of a numeric column - the bits of the exact integer of an integer value
+    (of an integer column, or an integral float) and the float64 bits of any other float value.
+    Thus the same value in an integer and a float column (e.g. in two chunks of a CSV file, one with
+    missing values) gets the same key, and distinct integers get distinct keys. Missing values get the same key.
+    """
+
+    values, missing = numeric_values(column)
+    values = np.ascontiguousarray(values)
+    if values.dtype == np.float64:
+        # a float that is not an integer (or a NaN, or out of the int64 range) does not survive the round trip
+        with np.errstate(invalid="ignore"):
+            integers = values.astype(np.int64)
+        keys = np.where(integers == values, integers.view(np.uint64), values.view(np.uint64))
+    else:
+        keys = values.view(np.uint64)
+    return np.where(missing, MISSING_VALUE_KEY, keys) if missing.any() else keys
+
+
+def row_hashes(database, columns=None):
+    """
+    Returns a 64-bit hash of every row of the columns (all the columns if None) - every column is hashed once
+    by a vectorized hash and the column hashes are combined in order.
+    Numeric columns are hashed by their exact 'numeric_keys'. Missing values hash equally.
+    """
+
+    columns = list(database.columns) if columns is None else columns
+    hashes = np.full(len(database), ROW_HASH_OFFSET, dtype=np.uint64)
+    for column_name in columns:
+        column = database[column_name]
+        if is_numeric_dtype(column.dtype) and not is_bool_dtype(column.dtype):
+            column_hashes = pd.util.hash_array(numeric_keys(column))
+        else:
+            column_hashes = pd.util.hash_pandas_object(column, index=False).to_numpy()
+        hashes = (hashes ^ column_hashes) * ROW_HASH_PRIME
+    return hashes
+
+
+def rows_equal(database, columns, left, right):
+    """
+    Returns a boolean array that is True where the row at the position 'left' is equal to the row at the
+    position 'right' in all the columns. Numeric values are compared exactly (integers as integers).
+    Missing values are equal to each other.
+    """
+
+    equal = np.ones(len(left), dtype=bool)
+    for column_name in columns:
+        column = database[column_name]
+        if is_numeric_dtype(column.dtype) and not is_bool_dtype(column.dtype):
+            values, missing = numeric_values(column)
+            left_missing, right_missing = missing[left], missing[right]
+            equal &= ((values[left] == values[right]) & ~left_missing & ~right_missing) | \
+                     (left_missing & right_missing)
+            continue
+
+        left_values = np.asarray(column.array.take(left), dtype=object)
+        right_values = np.asarray(column.array.take(right), dtype=object)
+        try:
+            same = np.asarray(left_values == right_values, dtype=bool)
+        except TypeError:
+            # pd.NA can not be compared - compare only the values that are not missing
+            same = np.zeros(len(left), dtype=bool)
+            comparable = ~pd.isna(left_values) & ~pd.isna(right_values)
+            same[comparable] = left_values[comparable] == right_values[comparable]
+        # only the unequal values (usually none of a duplicated row) can be missing in both rows
+        unequal = np.flatnonzero(~same)
+        same[unequal] = pd.isna(left_values[unequal]) & pd.isna(right_values[unequal])
+        equal &= same
+    return equal
+
+
+def duplicated_mask(database, columns=None, keep="first", hashes=None):
+    """
+    Returns the boolean mask of the duplicated rows (as DataFrame.duplicated) from the row hashes
+    (computed if None), and the number of hash collisions. Every row with the hash of an earlier row is verified
+    to be equal to the first row of its hash, the rows of a hash that collided are resolved by an exact comparison.
+    """
+
+    columns = list(database.columns) if columns is None else columns
+    hashes = row_hashes(database, columns) if hashes is None else hashes
+    hash_series = pd.Series(hashes)
+
+    later_rows = hash_series.duplicated(keep="first").to_numpy()
+    candidates, first_rows = np.flatnonzero(later_rows), np.flatnonzero(~later_rows)
+    representatives = first_rows[pd.Index(hashes[first_rows]).get_indexer(hashes[candidates])]
+    collided_hashes = np.unique(hashes[candidates[~rows_equal(database, columns, candidates, representatives)]])
+
+    mask = hash_series.duplicated(keep=keep).to_numpy()
+    if len(collided_hashes):
+        collided_rows = np.flatnonzero(np.isin(hashes, collided_hashes))
+        mask[collided_rows] = database.iloc[collided_rows][columns].duplicated(keep=keep).to_numpy()
+    return mask, len(collided_hashes)
+
+
+def seen_hashes_mask(seen_runs, hashes):
+    """
+    Returns a boolean array that is True where the hash is in one of the sorted runs of seen hashes.
+    """
+
+    seen = np.zeros(len(hashes), dtype=bool)
+    for run in seen_runs:
+        positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+        seen |= run[positions] == hashes
+    return seen
+
+
+def add_seen_hashes(seen_runs, hashes):
+    """
+    Add inplace the unique hashes as a new sorted run of the seen hashes. Runs of similar sizes are merged,
+    thus there are O(log n) runs of n seen hashes in total and a hash is added in amortized O(log n).
+    """
+
+    if not len(hashes):
+        return
+    run = np.unique(hashes)
+    while seen_runs and len(seen_runs[-1]) <= 2 * len(run):
+        run = np.union1d(seen_runs.pop(), run)
+    seen_runs.append(run)
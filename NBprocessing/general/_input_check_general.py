@@ -10,6 +10,8 @@ Good luck
 
 from functools import wraps
 from NBprocessing.src._check_input import _CheckInput
+from NBprocessing.src import constance_object
+from NBprocessing.general._general_functions_general import SPLIT_METHODS, DUPLICATES_KEEP
 
 class _InputCheckGeneral(object):
     """
@@ -27,9 +29,111 @@ class _InputCheckGeneral(object):
         """
 
         @wraps(func)
-        def wrapper_checker(database):
+        def wrapper_checker(database, profile=None):
             _CheckInput._check_database_input(database)
-            return func(database)
+            _CheckInput._check_profile(profile)
+            return func(database, profile)
+        return wrapper_checker
+
+    @staticmethod
+    def _profile_checker(func):
+        """
+        Wrapper function to validate the input for method 'profile'
+        Will raise Exception if input incorrect
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, num_categories=5, n_jobs=None):
+            _CheckInput._check_database_input(database)
+            _CheckInput._check_num_categories(num_categories)
+            _CheckInput._check_n_jobs(n_jobs)
+            return func(database, num_categories, n_jobs)
+        return wrapper_checker
+
+    @staticmethod
+    def _reduce_memory_checker(func):
+        """
+        Wrapper function to validate the input for method 'reduce_memory'
+        Will raise Exception if input incorrect
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name=None, category_threshold=0.5, arrow_strings=False):
+            _CheckInput._check_database_input(database)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, database)
+            _CheckInput._check_threshold(category_threshold)
+            if type(arrow_strings) != bool:
+                raise ValueError(constance_object.CHECK_ARROW_STRINGS)
+            return func(database, column_name, category_threshold, arrow_strings)
+        return wrapper_checker
+
+    @staticmethod
+    def _get_num_duplicates_checker(func):
+        """
+        Wrapper function to validate the input for method 'get_num_duplicates'
+        Will raise Exception if input incorrect
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name=None):
+            _CheckInput._check_database_input(database)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, database)
+            return func(database, column_name)
+        return wrapper_checker
+
+    @staticmethod
+    def _remove_duplicates_checker(func):
+        """
+        Wrapper function to validate the input for method 'remove_duplicates'
+        Will raise Exception if input incorrect
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name=None, keep="first", policy=None):
+            _CheckInput._check_database_input(database)
+            if column_name is not None:
+                _CheckInput._check_column_names_in_database(column_name, database)
+            if keep not in DUPLICATES_KEEP or type(keep) not in (str, bool):
+                raise ValueError(constance_object.CHECK_KEEP)
+            _CheckInput._check_policy(policy)
+            return func(database, column_name, keep, policy)
+        return wrapper_checker
+
+    @staticmethod
+    def _remove_duplicates_by_chunks_checker(func):
+        """
+        Wrapper function to validate the input for method 'remove_duplicates_by_chunks'
+        Will raise Exception if input incorrect
+        """
+
+        @wraps(func)
+        def wrapper_checker(source, column_name=None, chunksize=100000):
+            for single_source in source if type(source) in (list, tuple) else [source]:
+                _CheckInput._check_source(single_source)
+            if column_name is not None:
+                for column in column_name if type(column_name) in (list, tuple) else [column_name]:
+                    _CheckInput._check_column_name(column)
+            _CheckInput._check_chunksize(chunksize)
+            return func(source, column_name, chunksize)
+        return wrapper_checker
+
+    @staticmethod
+    def _missing_values_by_chunks_checker(func):
+        """
+        Wrapper function to validate the input for method 'missing_values_by_chunks'
+        Will raise Exception if input incorrect
+        """
+
+        @wraps(func)
+        def wrapper_checker(source, column_name=None, chunksize=100000):
+            _CheckInput._check_source(source)
+            if column_name is not None:
+                for column in column_name if type(column_name) in (list, tuple) else [column_name]:
+                    _CheckInput._check_column_name(column)
+            _CheckInput._check_chunksize(chunksize)
+            return func(source, column_name, chunksize)
         return wrapper_checker
 
     @staticmethod
@@ -40,9 +144,40 @@ class _InputCheckGeneral(object):
         """
 
         @wraps(func)
-        def wrapper_checker(database, column_name, test_size=0.3):
-            _CheckInput._check_database_input(database)
-            _CheckInput._check_column_in_database(column_name, database)
+        def wrapper_checker(database, column_name, test_size=0.3, method="random", by=None, random_state=42,
+                            return_indices=False):
+            _InputCheckGeneral._check_split_input(database, column_name, method, by, random_state, return_indices)
             _CheckInput._check_threshold(test_size)
-            return func(database, column_name, test_size=0.3)
-        return wrapper_checker
\ No newline at end of file
+            return func(database, column_name, test_size, method, by, random_state, return_indices)
+        return wrapper_checker
+
+    @staticmethod
+    def _k_fold_split_checker(func):
+        """
+        Wrapper function to validate the input for method 'k_fold_split'
+        Will raise Exception if input incorrect
+        """
+
+        @wraps(func)
+        def wrapper_checker(database, column_name, n_splits=5, method="random", by=None, random_state=42,
+                            return_indices=False):
+            _InputCheckGeneral._check_split_input(database, column_name, method, by, random_state, return_indices)
+            if type(n_splits) != int or n_splits < 2:
+                raise ValueError(constance_object.CHECK_N_SPLITS)
+            return func(database, column_name, n_splits, method, by, random_state, return_indices)
+        return wrapper_checker
+
+    @staticmethod
+    def _check_split_input(database, column_name, method, by, random_state, return_indices):
+        _CheckInput._check_database_input(database)
+        _CheckInput._check_column_in_database(column_name, database)
+        if method not in SPLIT_METHODS:
+            raise ValueError(constance_object.CHECK_SPLIT_METHOD)
+        if by is not None:
+            _CheckInput._check_column_in_database(by, database)
+        elif method == "group":
+            raise ValueError(constance_object.CHECK_SPLIT_BY)
+        if type(random_state) != int and random_state is not None:
+            raise ValueError(constance_object.CHECK_SPLIT_RANDOM_STATE)
+        if type(return_indices) != bool:
+            raise ValueError(constance_object.CHECK_RETURN_INDICES)
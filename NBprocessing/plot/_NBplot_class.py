@@ -31,10 +31,8 @@ from NBprocessing.plot._input_check_plot import _check_plot_input
 from NBprocessing.src import constance_object
 
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
-import plotly.graph_objs as go
-from plotly.offline import iplot
+
+# seaborn, matplotlib and plotly are imported inside the methods, thus they are loaded only when plotting
 
 
 class NBplot(object):
@@ -94,6 +92,9 @@ class NBplot(object):
         ValueError : If input value not as mentioned above.
         """
 
+        import seaborn as sns
+        import matplotlib.pyplot as plt
+
         sns.set(font_scale=1.2)
         plt.subplots(figsize=(12, 5))
 
@@ -132,6 +133,9 @@ class NBplot(object):
         ValueError : If input value not as mentioned above.
         """
 
+        import seaborn as sns
+        import matplotlib.pyplot as plt
+
         sns.set(font_scale=1)
         plt.subplots(figsize=(20, 6))
 
@@ -172,6 +176,9 @@ class NBplot(object):
         if not column_list:
             column_list = [col for col in database if col not in list(database._get_numeric_data().columns)]
 
+        import seaborn as sns
+        import matplotlib.pyplot as plt
+
         sns.set(font_scale=1)
         for col in column_list:
             sns.set_style("whitegrid")
@@ -213,6 +220,9 @@ class NBplot(object):
         if not column_list:
             column_list = list(database._get_numeric_data().columns)
 
+        import seaborn as sns
+        import matplotlib.pyplot as plt
+
         sns.set(font_scale=1.4)
         for col in column_list:
             sns.set_style("whitegrid")
@@ -258,6 +268,9 @@ class NBplot(object):
         ValueError : If input value not as mentioned above.
         """
 
+        import plotly.graph_objs as go
+        from plotly.offline import iplot
+
         data = dict(type='choropleth',
                     locations=database[locations_column],  # series / list with country names that we have data about
                     z=database[feature],  # information to plot
@@ -1,7 +1,11 @@
+import os
+
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_datetime64_any_dtype as is_datetime
 
 from NBprocessing.src import constance_object
+from NBprocessing.src._execution_policy import ExecutionPolicy
 
 class _CheckInput(object):
 
@@ -55,3 +59,46 @@ class _CheckInput(object):
         if type(title) != str and type(title) != int and type(title) != float and title != None:
             raise ValueError(constance_object.CHECK_TITLE)
 
+    @staticmethod
+    def _check_policy(policy):
+        if not isinstance(policy, ExecutionPolicy) and policy not in ExecutionPolicy.MODES and policy is not None:
+            raise ValueError(constance_object.CHECK_POLICY)
+        if policy == ExecutionPolicy.THRESHOLD:
+            raise ValueError(constance_object.CHECK_POLICY_LIMITS)
+
+    @staticmethod
+    def _check_profile(profile):
+        # a fitted DatasetProfile - checked by its fitted attributes, thus the check does not import the general package
+        if profile is not None and (not isinstance(getattr(profile, "summary_", None), pd.DataFrame) or
+                                    not isinstance(getattr(profile, "top_categories_", None), pd.DataFrame)):
+            raise ValueError(constance_object.CHECK_PROFILE)
+
+    @staticmethod
+    def _check_random_state(random_state):
+        if type(random_state) != int and not isinstance(random_state, np.random.Generator) and random_state is not None:
+            raise ValueError(constance_object.CHECK_RANDOM_STATE)
+
+    @staticmethod
+    def _check_column_names_in_database(columns, database):
+        if type(columns) == list or type(columns) == tuple:
+            for column_name in columns:
+                _CheckInput._check_column_name(column_name)
+                _CheckInput._check_column_in_database(column_name, database)
+        else:
+            _CheckInput._check_column_name(columns)
+            _CheckInput._check_column_in_database(columns, database)
+
+    @staticmethod
+    def _check_n_jobs(n_jobs):
+        if (type(n_jobs) != int or n_jobs == 0 or n_jobs < -1) and n_jobs is not None:
+            raise ValueError(constance_object.CHECK_N_JOBS)
+
+    @staticmethod
+    def _check_source(source):
+        if not isinstance(source, (str, os.PathLike, pd.DataFrame)) and not hasattr(source, "__iter__"):
+            raise ValueError(constance_object.CHECK_SOURCE)
+
+    @staticmethod
+    def _check_chunksize(chunksize):
+        if type(chunksize) != int or chunksize < 1:
+            raise ValueError(constance_object.CHECK_CHUNKSIZE)
@@ -19,6 +19,14 @@ class Const(object):
         self.CHECK_DICT = data["CHECK_INPUT"]["CHECK_DICT"]
         self.CHECK_NUM_CATEGORIES = data["CHECK_INPUT"]["CHECK_NUM_CATEGORIES"]
         self.CHECK_TITLE = data["CHECK_INPUT"]["CHECK_TITLE"]
+        self.CHECK_POLICY = data["CHECK_INPUT"]["CHECK_POLICY"]
+        self.CHECK_POLICY_LIMITS = data["CHECK_INPUT"]["CHECK_POLICY_LIMITS"]
+        self.CHECK_RANDOM_STATE = data["CHECK_INPUT"]["CHECK_RANDOM_STATE"]
+        self.NOT_FITTED = data["CHECK_INPUT"]["NOT_FITTED"]
+        self.CHECK_N_JOBS = data["CHECK_INPUT"]["CHECK_N_JOBS"]
+        self.CHECK_SOURCE = data["CHECK_INPUT"]["CHECK_SOURCE"]
+        self.CHECK_CHUNKSIZE = data["CHECK_INPUT"]["CHECK_CHUNKSIZE"]
+        self.PYARROW_MISSING = data["CHECK_INPUT"]["PYARROW_MISSING"]
 
         # categorical
         self.RED = data["CATEGORICAL"]["GENERAL_FUNCTIONS_CATEGORICAL"]["RED"]
@@ -26,10 +34,18 @@ class Const(object):
         self.OUTPUT = data["CATEGORICAL"]["GENERAL_FUNCTIONS_CATEGORICAL"]["OUTPUT"]
         self.USER_INPUT = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["REMOVE_CATEGORIES"]["USER_INPUT"]
         self.DATABASE_SHAPE = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["REMOVE_CATEGORIES"]["DATABASE_SHAPE"]
-        self.FIRST = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["CATEGORIES_NOT_IN_COMMON"]["FIRST"]
-        self.SECOND = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["CATEGORIES_NOT_IN_COMMON"]["SECOND"]
+        self.OHE_USER_INPUT = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["OHE"]["USER_INPUT"]
+        self.OHE_NUMERIC_FEATURES = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["OHE"]["NUMERIC_FEATURES"]
+        self.CHECK_HANDLE_UNKNOWN = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["OHE"]["CHECK_HANDLE_UNKNOWN"]
+        self.CHECK_OHE_OUTPUT = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["OHE"]["CHECK_OUTPUT"]
+        self.CHECK_OHE_ENCODER = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["OHE"]["CHECK_ENCODER"]
+        self.CHECK_RETURN_REPORT = data["CATEGORICAL"]["NBCATEGORICAL_CLASS"]["OHE"]["CHECK_RETURN_REPORT"]
 
         # continues
+        self.CHECK_FILL_STRATEGY = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["FILL_NA_TIMEDATE"]["CHECK_STRATEGY"]
+        self.CHECK_DATETIME_FEATURES = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["EXTRACT_DATETIME_FEATURES"] \
+            ["CHECK_FEATURES"]
+        self.CHECK_REFERENCE = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["EXTRACT_DATETIME_FEATURES"]["CHECK_REFERENCE"]
         self.DROP_ROW = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["REMOVE_OUTLIERS_BY_BOUNDARIES"]["DROP_ROW"]
         self.TYPE_ERROR = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["REMOVE_OUTLIERS_BY_BOUNDARIES"]["TYPE_ERROR"]
         self.OUTLIERS_ABOVE = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["GET_NUM_OUTLIERS_BY_VALUE"]["OUTLIERS_ABOVE"]
@@ -42,9 +58,20 @@ class Const(object):
         self.SUM_OUTLIERS_TOT = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["GET_NUM_OUTLIERS_BY_VALUE"] \
             ["SUM_OUTLIERS_TOT"]
         self.KEY_ERROR = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["GET_NUM_OUTLIERS_BY_VALUE"]["KEY_ERROR"]
-        self.SHAPE_BEFORE = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["REMOVE_OUTLIERS_BY_VALUE"]["SHAPE_BEFORE"]
-        self.SHAPE_AFTER = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["REMOVE_OUTLIERS_BY_VALUE"]["SHAPE_AFTER"]
-        self.DATA_LOST = data["CONTINUOUS"]["NBCONTINUOUS_CLASS"]["REMOVE_OUTLIERS_BY_VALUE"]["DATA_LOST"]
+        self.CHECK_SKETCH_K = data["CONTINUOUS"]["QUANTILE_SKETCH"]["CHECK_K"]
+        self.CHECK_SKETCH = data["CONTINUOUS"]["QUANTILE_SKETCH"]["CHECK_SKETCH"]
+        self.CHECK_SKETCHES = data["CONTINUOUS"]["QUANTILE_SKETCH"]["CHECK_SKETCHES"]
+        self.CHECK_DETECTOR_METHOD = data["CONTINUOUS"]["OUTLIER_DETECTOR"]["CHECK_METHOD"]
+        self.CHECK_DETECTOR_THRESHOLD = data["CONTINUOUS"]["OUTLIER_DETECTOR"]["CHECK_THRESHOLD"]
+        self.CHECK_DETECTOR = data["CONTINUOUS"]["OUTLIER_DETECTOR"]["CHECK_DETECTOR"]
+        self.CHECK_N_BINS = data["CONTINUOUS"]["DISCRETIZER"]["CHECK_N_BINS"]
+        self.CHECK_BIN_STRATEGY = data["CONTINUOUS"]["DISCRETIZER"]["CHECK_STRATEGY"]
+        self.CHECK_SCALER_METHOD = data["CONTINUOUS"]["SCALER"]["CHECK_METHOD"]
+        self.CHECK_SCALER_DTYPE = data["CONTINUOUS"]["SCALER"]["CHECK_DTYPE"]
+        self.CHECK_SKEW_METHOD = data["CONTINUOUS"]["SKEW_CORRECTOR"]["CHECK_METHOD"]
+        self.CHECK_SKEW_THRESHOLD = data["CONTINUOUS"]["SKEW_CORRECTOR"]["CHECK_THRESHOLD"]
+        self.SKEW_NOT_POSITIVE = data["CONTINUOUS"]["SKEW_CORRECTOR"]["NOT_POSITIVE"]
+        self.SKEW_NOT_ABOVE_MINUS_ONE = data["CONTINUOUS"]["SKEW_CORRECTOR"]["NOT_ABOVE_MINUS_ONE"]
 
         # plot
         self.NULL_HEAT_MAP_TITLE = data["PLOT"]["NBPLOT_CLASS"]["NULL_HEAT_MAP_TITLE"]
@@ -52,3 +79,15 @@ class Const(object):
 
         #general
         self.SPLIT_AND_CHECK = data["GENERAL"]["SPLIT_AND_CHECK"]
+        self.CHECK_SPLIT_METHOD = data["GENERAL"]["CHECK_SPLIT_METHOD"]
+        self.CHECK_SPLIT_BY = data["GENERAL"]["CHECK_SPLIT_BY"]
+        self.CHECK_SPLIT_RANDOM_STATE = data["GENERAL"]["CHECK_SPLIT_RANDOM_STATE"]
+        self.CHECK_RETURN_INDICES = data["GENERAL"]["CHECK_RETURN_INDICES"]
+        self.CHECK_N_SPLITS = data["GENERAL"]["CHECK_N_SPLITS"]
+        self.CHECK_PROFILE = data["GENERAL"]["DATASET_PROFILE"]["CHECK_PROFILE"]
+        self.PROFILE_NUM_CATEGORIES = data["GENERAL"]["DATASET_PROFILE"]["NUM_CATEGORIES"]
+        self.PROFILE_COLUMNS = data["GENERAL"]["DATASET_PROFILE"]["COLUMNS"]
+        self.MEMORY_USAGE = data["GENERAL"]["REDUCE_MEMORY"]["MEMORY_USAGE"]
+        self.CHECK_ARROW_STRINGS = data["GENERAL"]["REDUCE_MEMORY"]["CHECK_ARROW_STRINGS"]
+        self.NUM_DUPLICATES = data["GENERAL"]["DUPLICATES"]["NUM_DUPLICATES"]
+        self.CHECK_KEEP = data["GENERAL"]["DUPLICATES"]["CHECK_KEEP"]
@@ -10,7 +10,18 @@ data['CHECK_INPUT'] = {
     'CHECK_BOUNDARIES': "boundary input is not valid - Please enter a float in range 0-1",
     'CHECK_DICT': "filter dictionary input is not valid - Please enter a dictionary",
     'CHECK_NUM_CATEGORIES': "num_categories input is not valid - Please enter a int higher than 1",
-    'CHECK_TITLE': "Title input is not valid"
+    'CHECK_TITLE': "Title input is not valid",
+    'CHECK_POLICY': "policy input is not valid - Please enter an ExecutionPolicy or one of"
+                    " 'prompt', 'confirm', 'reject', 'threshold'",
+    'CHECK_POLICY_LIMITS': "'threshold' policy input is not valid - Please enter an ExecutionPolicy('threshold', ...)"
+                           " with at least one of max_rows_lost, max_percent_lost, max_features_added",
+    'CHECK_RANDOM_STATE': "random_state input is not valid - Please enter an int, a numpy Generator or None",
+    'NOT_FITTED': "This {} instance is not fitted yet - Please call 'fit' first",
+    'CHECK_N_JOBS': "n_jobs input is not valid - Please enter a positive int, -1 for all cpus or None",
+    'CHECK_SOURCE': "source input is not valid - Please enter a path to a CSV/Parquet file, a dataframe"
+                    " or an iterable of dataframes",
+    'CHECK_CHUNKSIZE': "chunksize input is not valid - Please enter a positive int",
+    'PYARROW_MISSING': "Reading Parquet files requires pyarrow - Please install it with 'pip install pyarrow'"
 }
 data["CATEGORICAL"] = {
 
@@ -22,14 +33,31 @@ data["CATEGORICAL"] = {
                               "DATABASE_SHAPE": "the new database shape is{}"
                               },
 
-        "CATEGORIES_NOT_IN_COMMON": {"FIRST": "values existing only in the first data-set {}",
-                                     "SECOND": "values existing only in the second data-set {}"
-                                     }
+        "OHE": {"USER_INPUT": "By OHE you will add {} features to the database ({} MB dense, {} MB sparse)."
+                              " Do you wish to continue[y/n]:",
+                "NUMERIC_FEATURES": "features list contains numeric features please check again",
+                "CHECK_HANDLE_UNKNOWN": "handle_unknown input is not valid - Please enter 'ignore' or 'bucket'",
+                "CHECK_OUTPUT": "output input is not valid - Please enter 'sparse', 'pandas' or 'dense'",
+                "CHECK_ENCODER": "encoder input is not valid - Please enter a fitted CategoryOneHotEncoder or None",
+                "CHECK_RETURN_REPORT": "return_report input is not valid - Please enter True or False"
+                }
         }
 }
 
 data["CONTINUOUS"] = {
-    "NBCONTINUOUS_CLASS": {"REMOVE_OUTLIERS_BY_BOUNDARIES": {"DROP_ROW": "Do you wish to drop {} rows"
+    "NBCONTINUOUS_CLASS": {"FILL_NA_TIMEDATE": {"CHECK_STRATEGY": "strategy input is not valid - Please enter"
+                                                                  " 'midpoint', 'median', 'ffill', 'bfill' or"
+                                                                  " 'interpolate'"
+                                                },
+                           "EXTRACT_DATETIME_FEATURES": {"CHECK_FEATURES": "features input is not valid - Please"
+                                                                           " enter a list of 'year', 'month', 'day',"
+                                                                           " 'dayofweek', 'hour', 'minute',"
+                                                                           " 'is_weekend', 'elapsed_seconds' or None",
+                                                         "CHECK_REFERENCE": "reference input is not valid - Please"
+                                                                            " enter a time-date string, a Timestamp"
+                                                                            " or None"
+                                                         },
+                           "REMOVE_OUTLIERS_BY_BOUNDARIES": {"DROP_ROW": "Do you wish to drop {} rows"
                                                                          " ({}% of the database)? [y/n]",
                                                              "TYPE_ERROR": "Error - the column value type must be numeric"
                                                              },
@@ -42,11 +70,31 @@ data["CONTINUOUS"] = {
                                                          "KEY_ERROR": "Error one or more of the column names is not in "
                                                                       "the data base. "
                                                          },
-                           "REMOVE_OUTLIERS_BY_VALUE": {"SHAPE_BEFORE": "\nShape before removing outliers: {}",
-                                                        "SHAPE_AFTER": "\nshape after removing outliers: {}",
-                                                        "DATA_LOST": "\nDroped {} rows that are {} % of the database"
-                                                        },
-                           }
+                           },
+    "QUANTILE_SKETCH": {"CHECK_K": "k input is not valid - Please enter an int of at least 8",
+                        "CHECK_SKETCH": "sketch input is not valid - Please enter a QuantileSketch",
+                        "CHECK_SKETCHES": "sketches input is not valid - Please enter a dictionary"
+                                          " {column name : QuantileSketch}"
+                        },
+    "OUTLIER_DETECTOR": {"CHECK_METHOD": "method input is not valid - Please enter 'iqr', 'mad' or 'zscore'",
+                         "CHECK_THRESHOLD": "threshold input is not valid - Please enter a positive float or None",
+                         "CHECK_DETECTOR": "detector input is not valid - Please enter a fitted OutlierDetector"
+                                           " or None"
+                         },
+    "DISCRETIZER": {"CHECK_N_BINS": "n_bins input is not valid - Please enter an int of at least 2",
+                    "CHECK_STRATEGY": "strategy input is not valid - Please enter 'quantile' or 'uniform'"
+                    },
+    "SCALER": {"CHECK_METHOD": "method input is not valid - Please enter 'standard', 'minmax' or 'robust'",
+               "CHECK_DTYPE": "dtype input is not valid - Please enter a float dtype such as 'float32' or None"
+               },
+    "SKEW_CORRECTOR": {"CHECK_METHOD": "method input is not valid - Please enter 'auto', 'log1p', 'boxcox'"
+                                       " or 'yeo-johnson'",
+                       "CHECK_THRESHOLD": "threshold input is not valid - Please enter a non negative float",
+                       "NOT_POSITIVE": "The column {} has values that are not positive - Box-Cox needs positive"
+                                       " values, please use 'yeo-johnson' or 'auto'",
+                       "NOT_ABOVE_MINUS_ONE": "The column {} has values that are not above -1 - log1p needs values"
+                                              " above -1, please use 'yeo-johnson' or 'auto'"
+                       }
 }
 data["PLOT"] = {
                "NBPLOT_CLASS": {"NULL_HEAT_MAP_TITLE": "Nulls Heatmap",
@@ -57,5 +105,26 @@ data["PLOT"] = {
 data["GENERAL"] = {
                     "SPLIT_AND_CHECK": "X_train shape: {}, y_train shape:"
                                        " {}, X_test shape: {}"
-                                       ", y_test shape: {}"
+                                       ", y_test shape: {}",
+                    "CHECK_SPLIT_METHOD": "method input is not valid - Please enter 'random', 'stratified', 'group'"
+                                          " or 'time'",
+                    "CHECK_SPLIT_BY": "by input is not valid - the 'group' method needs the name of the group column",
+                    "CHECK_SPLIT_RANDOM_STATE": "random_state input is not valid - Please enter an int or None",
+                    "CHECK_RETURN_INDICES": "return_indices input is not valid - Please enter True or False",
+                    "CHECK_N_SPLITS": "n_splits input is not valid - Please enter an int of at least 2",
+                    "DATASET_PROFILE": {"CHECK_PROFILE": "profile input is not valid - Please enter a fitted"
+                                                         " DatasetProfile of the database or None",
+                                        "NUM_CATEGORIES": "The profile has only the top {} categories of every"
+                                                          " column - Please enter a lower num_categories or"
+                                                          " profile again",
+                                        "COLUMNS": "The columns {} are not in the profile"
+                                        },
+                    "REDUCE_MEMORY": {"MEMORY_USAGE": "Memory usage: {} MB before, {} MB after ({}% less)",
+                                      "CHECK_ARROW_STRINGS": "arrow_strings input is not valid - Please enter"
+                                                             " True or False"
+                                      },
+                    "DUPLICATES": {"NUM_DUPLICATES": "{} rows are duplicates of earlier rows ({} % of the database),"
+                                                     " {} distinct rows have duplicates",
+                                   "CHECK_KEEP": "keep input is not valid - Please enter 'first', 'last' or False"
+                                   }
                   }
\ No newline at end of file
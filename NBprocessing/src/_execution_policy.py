@@ -0,0 +1,198 @@
+"""
+Execution policy and action report of the destructive methods in the package.
+
+Methods that remove rows or add features (remove_categories, remove_outliers_by_boundaries, OHE etc.)
+used to block on input() until the user typed 'y' or 'n'. Instead, they now consult an ExecutionPolicy:
+    1. 'prompt' - ask the user as before (the default).
+    2. 'confirm' - always execute the action.
+    3. 'reject' - never execute the action, only report what would have happened.
+    4. 'threshold' - execute the action only if it does not exceed the given limits
+       (max_rows_lost, max_percent_lost, max_features_added), at least one limit must be given.
+
+The policy can be set for the whole package with 'set_execution_policy' or passed to every
+method call with the 'policy' argument.
+Every method that consults the policy returns an ActionReport with the outcome of the action.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import time
+
+from NBprocessing.src import constance_object
+
+
+class ExecutionPolicy(object):
+    """
+    Decide rather a destructive action will be executed without asking the user.
+
+    Parameters
+    ----------
+    :param mode: string - 'prompt', 'confirm', 'reject' or 'threshold'
+    The way the action is approved. Default is 'prompt' - ask the user.
+
+    :param max_rows_lost: int
+    Only in 'threshold' mode - the maximal number of rows the action can remove.
+
+    :param max_percent_lost: float 0-100
+    Only in 'threshold' mode - the maximal percent of the database the action can remove.
+
+    :param max_features_added: int
+    Only in 'threshold' mode - the maximal number of features the action can add.
+
+    A 'threshold' policy without any limit raises ValueError - it would approve every action.
+    """
+
+    PROMPT = "prompt"
+    CONFIRM = "confirm"
+    REJECT = "reject"
+    THRESHOLD = "threshold"
+    MODES = (PROMPT, CONFIRM, REJECT, THRESHOLD)
+
+    def __init__(self, mode=PROMPT, max_rows_lost=None, max_percent_lost=None, max_features_added=None):
+        if mode not in self.MODES:
+            raise ValueError(constance_object.CHECK_POLICY)
+        if mode == self.THRESHOLD and max_rows_lost is None and max_percent_lost is None \
+                and max_features_added is None:
+            raise ValueError(constance_object.CHECK_POLICY_LIMITS)
+        self.mode = mode
+        self.max_rows_lost = max_rows_lost
+        self.max_percent_lost = max_percent_lost
+        self.max_features_added = max_features_added
+
+    @property
+    def is_interactive(self):
+        return self.mode == self.PROMPT
+
+    def approve(self, message, rows_lost=0, percent_lost=0.0, features_added=0):
+        """
+        Returns True if the action should be executed.
+        In 'prompt' mode will ask the user with the given message until the answer is 'y' or 'n'.
+        """
+
+        if self.mode == self.PROMPT:
+            user_input = input(message)
+            while user_input != 'y' and user_input != 'n':
+                user_input = input(message)
+            return user_input == 'y'
+
+        if self.mode == self.CONFIRM:
+            return True
+
+        if self.mode == self.REJECT:
+            return False
+
+        if self.max_rows_lost is not None and rows_lost > self.max_rows_lost:
+            return False
+        if self.max_percent_lost is not None and percent_lost > self.max_percent_lost:
+            return False
+        if self.max_features_added is not None and features_added > self.max_features_added:
+            return False
+        return True
+
+    def __repr__(self):
+        return "ExecutionPolicy(mode={!r}, max_rows_lost={!r}, max_percent_lost={!r}, max_features_added={!r})" \
+            .format(self.mode, self.max_rows_lost, self.max_percent_lost, self.max_features_added)
+
+
+class ActionReport(object):
+    """
+    The outcome of a destructive action.
+
+    Attributes
+    ----------
+    action: string - the name of the method
+    executed: bool - rather the action was executed
+    rows_before: int - number of rows in the database before the action
+    rows_affected: int - number of rows the action removes (or would have removed if not executed)
+    percent_lost: float - the percent of the database the rows_affected are
+    features_added: int - number of features the action adds (or would have added if not executed)
+    elapsed_seconds: float - the time it took to run the method
+    details: dictionary - method specific information
+    """
+
+    def __init__(self, action, executed, rows_before, rows_affected=0, features_added=0, elapsed_seconds=0.0,
+                 details=None):
+        self.action = action
+        self.executed = executed
+        self.rows_before = rows_before
+        self.rows_affected = rows_affected
+        self.features_added = features_added
+        self.elapsed_seconds = elapsed_seconds
+        self.details = details if details is not None else {}
+
+    @property
+    def percent_lost(self):
+        if not self.rows_before:
+            return 0.0
+        return round(self.rows_affected * 100 / self.rows_before, 2)
+
+    @property
+    def rows_after(self):
+        if self.executed:
+            return self.rows_before - self.rows_affected
+        return self.rows_before
+
+    def __repr__(self):
+        return "ActionReport(action={!r}, executed={}, rows_before={}, rows_affected={}, percent_lost={}, " \
+               "features_added={}, elapsed_seconds={:.4f})".format(self.action, self.executed, self.rows_before,
+                                                                   self.rows_affected, self.percent_lost,
+                                                                   self.features_added, self.elapsed_seconds)
+
+
+_current_policy = ExecutionPolicy()
+
+
+def set_execution_policy(policy=ExecutionPolicy.PROMPT, max_rows_lost=None, max_percent_lost=None,
+                         max_features_added=None):
+    """
+    Set the execution policy of the whole package.
+
+    :param policy: ExecutionPolicy or string - 'prompt', 'confirm', 'reject' or 'threshold'
+    If a string is given a new ExecutionPolicy will be created with the given limits.
+
+    :return: the previous ExecutionPolicy, so it can be restored.
+    """
+
+    global _current_policy
+    previous = _current_policy
+    if isinstance(policy, ExecutionPolicy):
+        _current_policy = policy
+    else:
+        _current_policy = ExecutionPolicy(policy, max_rows_lost, max_percent_lost, max_features_added)
+    return previous
+
+
+def get_execution_policy():
+    """
+    Returns the execution policy of the whole package.
+    """
+
+    return _current_policy
+
+
+def resolve_policy(policy=None):
+    """
+    Returns the ExecutionPolicy a method should consult:
+    the package policy if None was given, otherwise the given policy (a mode string is converted to a policy).
+    The 'threshold' string has no limits and raises ValueError - pass an ExecutionPolicy with the limits.
+    """
+
+    if policy is None:
+        return _current_policy
+    if isinstance(policy, ExecutionPolicy):
+        return policy
+    return ExecutionPolicy(policy)
+
+
+class Timer(object):
+    """
+    Measure the run time of a method for its ActionReport.
+    """
+
+    def __init__(self):
+        self._start = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._start
@@ -0,0 +1,93 @@
+"""
+General functions that are shared by all the libraries of the package.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from NBprocessing.src import constance_object
+
+
+def remove_rows_by_mask(database, mask):
+    """
+    Remove inplace all the rows of the database where the boolean mask is True using a single drop.
+    The rows are removed by their position and not by their index label, thus the removal
+    is correct on databases with non-unique indexes as well.
+    Returns the number of removed rows.
+    """
+
+    mask = np.asarray(mask, dtype=bool)
+    rows_to_remove = int(mask.sum())
+    if not rows_to_remove:
+        return 0
+
+    original_index = database.index
+    database.index = pd.RangeIndex(len(database))
+    database.drop(np.flatnonzero(mask), inplace=True)
+    database.index = original_index[~mask]
+    return rows_to_remove
+
+
+def get_random_generator(random_state=None):
+    """
+    Returns a numpy Generator from a seed (int), an existing Generator or None for a fresh random Generator.
+    """
+
+    return np.random.default_rng(random_state)
+
+
+def to_column_list(columns):
+    """
+    Returns the given column name or list/tuple of column names as a list of column names.
+    """
+
+    if isinstance(columns, (list, tuple)):
+        return list(columns)
+    return [columns]
+
+
+def smallest_int_dtype(max_value, min_value=-1):
+    """
+    Returns the smallest signed numpy integer dtype that holds all the values from 'min_value' to 'max_value'.
+    """
+
+    for dtype in (np.int8, np.int16, np.int32):
+        if np.iinfo(dtype).min <= min_value and max_value <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def iter_chunks(source, chunksize=100000, columns=None):
+    """
+    Yields the data of 'source' as pandas data frames of at most 'chunksize' rows, so data larger than
+    the memory can be processed chunk by chunk.
+    'source' can be a path to a CSV file, a path to a Parquet file ('.parquet' / '.pq', requires pyarrow),
+    a data frame or an iterable of data frames (which are yielded as they are).
+    'columns' - optional list of columns to read from a file.
+    """
+
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+        return
+
+    if not isinstance(source, (str, os.PathLike)):
+        yield from source
+        return
+
+    if os.fspath(source).lower().endswith((".parquet", ".pq")):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(constance_object.PYARROW_MISSING)
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    with pd.read_csv(source, chunksize=chunksize, usecols=columns) as reader:
+        yield from reader
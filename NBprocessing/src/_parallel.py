@@ -0,0 +1,28 @@
+"""
+Run a function over the columns of a database in parallel.
+
+numpy and pandas release the GIL in their heavy kernels (hashing, sorting, reductions),
+thus a thread pool gives a real speed up without copying the database to worker processes.
+
+Created by: Nir Barazida
+Good luck!
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def parallel_map(func, items, n_jobs=None):
+    """
+    Returns [func(item) for item in items] computed by 'n_jobs' threads.
+    n_jobs None or 1 runs sequentially, -1 uses all the cpus.
+    """
+
+    items = list(items)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if not n_jobs or n_jobs == 1 or len(items) < 2:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(n_jobs, len(items))) as executor:
+        return list(executor.map(func, items))
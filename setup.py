@@ -12,7 +12,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/nirbarazida/NBprocessing",
     packages=find_packages(exclude=['*test*', 'main*','ignore_files*']),
-    install_requires=['pandas', 'numpy', 'matplotlib', 'seaborn','plotly','scikit-learn'],
+    install_requires=['pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn','plotly','scikit-learn'],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,5 +1,8 @@
-from NBprocessing import NBcategorical
+from NBprocessing import NBcategorical, ExecutionPolicy, CategoryCombiner, CategoryEncoder, \
+    CategoryOneHotEncoder
 import unittest
+import pickle
+import numpy as np
 import pandas as pd
 
 
@@ -20,12 +23,44 @@ class TestCategorical(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             NBcategorical.remove_categories(['nir'], column_name, categories_to_drop)
+        with self.assertRaises(ValueError):
             NBcategorical.remove_categories(['nir'], ['fuel'], categories_to_drop)
+        with self.assertRaises(ValueError):
             NBcategorical.remove_categories(['nir'], column_name, ['nir'])
 
         with self.assertRaises(NameError):
             NBcategorical.remove_categories(self.database, 'nir', categories_to_drop)
 
+        with self.assertRaises(ValueError):
+            NBcategorical.remove_categories(self.database, column_name, categories_to_drop, 'nir')
+
+        report = NBcategorical.remove_categories(self.database, column_name, categories_to_drop, 'reject')
+        self.assertFalse(report.executed)
+        self.assertEqual(report.rows_affected, 64)
+        self.assertEqual(len(self.database), 4340)
+
+        policy = ExecutionPolicy('threshold', max_percent_lost=1)
+        report = NBcategorical.remove_categories(self.database, column_name, categories_to_drop, policy)
+        self.assertFalse(report.executed)
+
+        # a threshold policy without any limit would approve everything
+        with self.assertRaises(ValueError):
+            ExecutionPolicy('threshold')
+        with self.assertRaises(ValueError):
+            NBcategorical.remove_categories(self.database, column_name, categories_to_drop, 'threshold')
+        self.assertEqual(len(self.database), 4340)
+
+        report = NBcategorical.remove_categories(self.database, column_name, categories_to_drop, 'confirm')
+        self.assertTrue(report.executed)
+        self.assertEqual(report.rows_after, 4276)
+        self.assertEqual(len(self.database), 4276)
+
+        # removal is positional, rows that share an index label with a removed row are kept
+        database = pd.DataFrame({'fuel': ['CNG', 'Petrol', 'Diesel', 'LPG']}, index=[0, 0, 1, 1])
+        NBcategorical.remove_categories(database, column_name, categories_to_drop, 'confirm')
+        self.assertEqual(database['fuel'].tolist(), ['Petrol', 'Diesel'])
+        self.assertEqual(database.index.tolist(), [0, 1])
+
     def test_fill_na_by_ratio(self):
         print('fill_na_by_ratio\n')
 
@@ -33,6 +68,33 @@ class TestCategorical(unittest.TestCase):
             NBcategorical.fill_na_by_ratio(self.database, 'nir')
         with self.assertRaises(ValueError):
             NBcategorical.fill_na_by_ratio(['nir'], 'fuel')
+        with self.assertRaises(ValueError):
+            NBcategorical.fill_na_by_ratio(self.database, 'fuel', random_state='nir')
+
+        # the fill is positional, a shuffled index must not leave missing values or change known values
+        database = self.database.sample(frac=1, random_state=0)
+        fuel_before = database['fuel'].copy()
+        NBcategorical.fill_na_by_ratio(database, ['fuel', 'km_driven'], random_state=42)
+        self.assertEqual(database[['fuel', 'km_driven']].isna().sum().sum(), 0)
+        self.assertTrue(database['fuel'][fuel_before.notna()].equals(fuel_before.dropna()))
+
+        database_seeded = self.database.sample(frac=1, random_state=0)
+        NBcategorical.fill_na_by_ratio(database_seeded, ['fuel', 'km_driven'], random_state=42)
+        self.assertTrue(database.equals(database_seeded))
+
+    def test_fill_na_by_ratio_by_group(self):
+        print('fill_na_by_ratio by group\n')
+
+        database = pd.DataFrame({'brand': ['a', 'a', 'a', 'b', 'b', 'b', 'c'],
+                                 'fuel': ['Petrol', None, 'Petrol', 'Diesel', 'Diesel', None, None]},
+                                index=[9, 8, 7, 6, 5, 4, 3])
+        NBcategorical.fill_na_by_ratio(database, 'fuel', random_state=0, by='brand')
+        self.assertEqual(database['fuel'].tolist()[:6], ['Petrol'] * 3 + ['Diesel'] * 3)
+        # a group without known values is filled by the ratio of the whole column
+        self.assertIn(database['fuel'].iloc[6], ['Petrol', 'Diesel'])
+
+        with self.assertRaises(NameError):
+            NBcategorical.fill_na_by_ratio(database, 'fuel', by='nir')
 
     def test_combine_categories(self):
         print('combine_categories\n')
@@ -46,17 +108,167 @@ class TestCategorical(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             NBcategorical.combine_categories(['nir'], column_name)
+        with self.assertRaises(ValueError):
             NBcategorical.combine_categories(self.database, column_name, category_name, 1.1)
+        with self.assertRaises(ValueError):
             NBcategorical.combine_categories(self.database, column_name, category_name, -0.001)
+        with self.assertRaises(ValueError):
             NBcategorical.combine_categories(self.database, column_name, [category_name], threshold)
 
-        NBcategorical.combine_categories(self.database, column_name, category_name, 0.2)
-        len(self.database[column_name].value_counts())
+        combiner = NBcategorical.combine_categories(self.database, column_name, category_name, 0.2)
         self.assertEqual(len(self.database[column_name].value_counts()), 3)
+        self.assertEqual(sorted(combiner.combined_categories_[column_name]), ['CNG', 'Electric', 'LPG'])
+        self.assertEqual(self.database[column_name].isna().sum(), 3)
+
+    def test_category_combiner(self):
+        print('CategoryCombiner\n')
+
+        train = self.database.iloc[:3000].copy()
+        test = self.database.iloc[3000:].copy()
+        test.loc[test.index[0], 'fuel'] = 'Hydrogen'
+
+        combiner = CategoryCombiner('other', 0.02).fit(train, ['fuel', 'owner'])
+        combiner = pickle.loads(pickle.dumps(combiner))
+        combiner.transform(test)
+        self.assertEqual(test['fuel'].iloc[0], 'other')
+        self.assertEqual(set(test['fuel'].dropna()), {'Diesel', 'Petrol', 'other'})
+
+        test_categorical = self.database.iloc[3000:].astype({'owner': 'category'})
+        combiner.transform(test_categorical)
+        self.assertTrue(test_categorical['owner'].astype(object).equals(test['owner']))
+
+        # a numeric column keeps its dtype when the combined category is a number
+        database = pd.DataFrame({'seats': [4, 4, 4, 4, 5, 5, 5, 2, 7]})
+        CategoryCombiner(0, 0.2).fit_transform(database, 'seats')
+        self.assertEqual(database['seats'].dtype, 'int64')
+        self.assertEqual(database['seats'].tolist(), [4, 4, 4, 4, 5, 5, 5, 0, 0])
+
+        with self.assertRaises(ValueError):
+            CategoryCombiner().transform(test)
+
+    def test_category_ratio(self):
+        print('category_ratio\n')
+
+        ratio = NBcategorical.category_ratio(self.database, ['fuel', 'transmission'], num_categories=3, n_jobs=2)
+        self.assertEqual(list(ratio.columns), ['column', 'category', 'ratio', 'rank'])
+        self.assertEqual(len(ratio), 5)
+        fuel = ratio[ratio['column'] == 'fuel']
+        self.assertEqual(fuel['category'].tolist(), ['Diesel', 'Petrol', 'CNG'])
+        self.assertAlmostEqual(fuel['ratio'].iloc[0], 2152 / 4337)
+
+        styled = NBcategorical.category_ratio(self.database, ['fuel', 'transmission'], num_categories=3, style=True)
+        self.assertEqual(styled.data.loc['transmission', 2], '0.00')
+        self.assertEqual(styled.data.loc['fuel', 0], 'Diesel : 49.62%')
+        styled.to_html()
+
+        with self.assertRaises(NameError):
+            NBcategorical.category_ratio(self.database, ['nir'])
+
+    def test_label_encoder_features(self):
+        print('label_encoder_features\n')
+
+        train = self.database.iloc[:3000].copy()
+        test = self.database.iloc[3000:].copy()
+        test.loc[test.index[0], 'fuel'] = 'Hydrogen'
+
+        encoder = NBcategorical.label_encoder_features(train, ['fuel', 'name'], n_jobs=2)
+        self.assertEqual(train['fuel'].dtype, 'int8')
+        self.assertEqual(train['name'].dtype, 'int16')
+        self.assertEqual((train['fuel'] == -1).sum(), self.database['fuel'].iloc[:3000].isna().sum())
+
+        test.loc[test.index[1], 'fuel'] = np.nan
+        original_test = test.copy()
+        encoder.transform(test)
+        self.assertEqual(test['fuel'].iloc[0], -2)
+        self.assertEqual(test['fuel'].iloc[1], -1)
+        encoder.inverse_transform(test)
+        # 'Hydrogen' and 'Electric' are not in the train set and are decoded to '<unknown>',
+        # missing values stay missing
+        known = original_test['fuel'].isin(['Petrol', 'Diesel', 'CNG', 'LPG'])
+        expected = original_test['fuel'].where(known | original_test['fuel'].isna(), '<unknown>')
+        self.assertTrue(test['fuel'].equals(expected))
+        self.assertEqual(test['fuel'].iloc[0], '<unknown>')
+        self.assertTrue(pd.isna(test['fuel'].iloc[1]))
+
+        with self.assertRaises(ValueError):
+            CategoryEncoder().transform(test)
+        with self.assertRaises(ValueError):
+            NBcategorical.label_encoder_features(train, ['fuel'], n_jobs=0)
+
+    def test_OHE(self):
+        print('OHE\n')
+
+        policy = ExecutionPolicy('threshold', max_features_added=5)
+        database, features_list, report = NBcategorical.OHE(self.database, ['fuel', 'transmission'], policy,
+                                                             return_report=True)
+        self.assertTrue(report.executed)
+        self.assertEqual(report.features_added, 5)
+        self.assertEqual(database.shape[1], self.database.shape[1] + 5)
+
+        expected = pd.get_dummies(self.database, columns=['fuel', 'transmission'], dtype='uint8')
+        self.assertTrue(database.equals(expected))
+
+        database, features_list, report = NBcategorical.OHE(self.database, policy=policy, return_report=True)
+        self.assertFalse(report.executed)
+        self.assertIs(database, self.database)
+
+        # the test set is encoded to the columns of the train set
+        train, test = self.database.iloc[:3000], self.database.iloc[3000:]
+        train_encoded, features_list, report = NBcategorical.OHE(train, ['fuel'], 'confirm', sparse=True,
+                                                                 return_report=True)
+        test_encoded, features_list = NBcategorical.OHE(test, policy='confirm', sparse=True,
+                                                        encoder=report.details['encoder'])
+        self.assertEqual(list(train_encoded.columns), list(test_encoded.columns))
+        self.assertEqual(test_encoded['fuel_Diesel'].dtype, pd.SparseDtype('uint8', 0))
+
+        # by default the database and the features list are returned, as before the ActionReport
+        database, features_list = NBcategorical.OHE(self.database, ['fuel'], 'confirm')
+        self.assertEqual(features_list, ['fuel'])
+        with self.assertRaises(ValueError):
+            NBcategorical.OHE(self.database, ['fuel'], 'confirm', return_report=1)
+
+    def test_category_one_hot_encoder(self):
+        print('CategoryOneHotEncoder\n')
+
+        train, test = self.database.iloc[:3000], self.database.iloc[3000:]
+        encoder = CategoryOneHotEncoder('bucket').fit(train, ['fuel', 'owner'])
+        matrix = encoder.transform(test)
+        self.assertEqual(matrix.shape, (len(test), len(encoder.feature_names_)))
+        self.assertEqual(matrix.dtype, 'uint8')
+        # every known value is encoded to a single one, 'Electric' is in the 'fuel_unknown' bucket
+        self.assertEqual(matrix.sum(), test[['fuel', 'owner']].count().sum())
+        self.assertEqual(matrix[:, encoder.feature_names_.index('fuel_unknown')].sum(), 1)
+        self.assertTrue((matrix.toarray() == encoder.transform(test, 'dense').to_numpy()).all())
+
+        estimate = encoder.estimate(test)
+        self.assertEqual(estimate['features_added'], len(encoder.feature_names_) - 2)
+        self.assertLess(estimate['sparse_bytes'], estimate['dense_bytes'])
+
+        with self.assertRaises(ValueError):
+            CategoryOneHotEncoder('nir')
+        with self.assertRaises(ValueError):
+            encoder.transform(test, 'nir')
 
-    # def categories_not_in_common(train, test, column_name)
     def test_categories_not_in_common(self):
-        print('categories_not_in_common - to complete\n')
+        print('categories_not_in_common\n')
+
+        train = self.database.iloc[:3000].copy()
+        test = self.database.iloc[3000:].copy()
+
+        with self.assertRaises(ValueError):
+            NBcategorical.categories_not_in_common(['nir'], test, 'fuel')
+        with self.assertRaises(NameError):
+            NBcategorical.categories_not_in_common(train, test, ['fuel', 'nir'])
+
+        not_in_common = NBcategorical.categories_not_in_common(train, test, 'fuel')
+        self.assertEqual(not_in_common, {'fuel': ([], ['Electric'])})
+
+        not_in_common = NBcategorical.categories_not_in_common(train, test, align=True)
+        self.assertEqual(set(not_in_common), {'name', 'fuel', 'seller_type', 'transmission', 'owner'})
+        self.assertEqual(train['fuel'].dtype, test['fuel'].dtype)
+        self.assertEqual(list(train['fuel'].cat.categories), ['Petrol', 'Diesel', 'CNG', 'LPG', 'Electric'])
+        self.assertTrue(train['fuel'].astype(object).equals(self.database['fuel'].iloc[:3000]))
+        self.assertEqual(pd.get_dummies(train['fuel']).shape[1], pd.get_dummies(test['fuel']).shape[1])
 
 
 if __name__ == '__main__':
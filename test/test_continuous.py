@@ -0,0 +1,494 @@
+from NBprocessing import NBcontinuous, QuantileSketch, OutlierDetector, OutlierClipper, Discretizer, \
+    Scaler, SkewCorrector, ExecutionPolicy
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+
+class TestContinuous(unittest.TestCase):
+
+    def setUp(self):
+        print('setUp')
+        self.database = pd.read_pickle('./dataset_cars.pkl')
+
+    def tearDown(self):
+        print('tearDown\n')
+        pass
+
+    def test_fill_na_timedate(self):
+        print('fill_na_timedate\n')
+        times = pd.to_datetime(['2020-01-01', None, None, '2020-01-04', '2020-02-01', None, '2020-02-11', None])
+        database = pd.DataFrame({'user': ['a', 'a', 'a', 'a', 'b', 'b', 'b', 'c'], 'start': times,
+                                 'end': times + pd.Timedelta(hours=1)})
+
+        midpoint = database.copy()
+        NBcontinuous.fill_na_timedate(midpoint, ['start', 'end'])
+        self.assertEqual(midpoint['start'].iloc[1], pd.Timestamp('2020-01-21 12:00'))
+        self.assertEqual(midpoint['end'].iloc[7], pd.Timestamp('2020-01-21 13:00'))
+
+        by_user = database.copy()
+        NBcontinuous.fill_na_timedate(by_user, 'start', 'median', by='user')
+        self.assertEqual(by_user['start'].iloc[1], pd.Timestamp('2020-01-02 12:00'))
+        self.assertEqual(by_user['start'].iloc[5], pd.Timestamp('2020-02-06'))
+        # a group without any known value is left missing
+        self.assertTrue(pd.isna(by_user['start'].iloc[7]))
+
+        # the median is exact on the nanoseconds (a float median loses precision above 2^53 nanoseconds)
+        precise = pd.DataFrame({'start': pd.to_datetime(['2023-05-01 00:00:00.000000001', None,
+                                                         '2023-05-01 00:00:00.000000004',
+                                                         '2023-05-01 00:00:00.000000007'])})
+        NBcontinuous.fill_na_timedate(precise, 'start', 'median')
+        self.assertEqual(precise['start'].iloc[1], pd.Timestamp('2023-05-01 00:00:00.000000004'))
+
+        interpolated = database.copy()
+        NBcontinuous.fill_na_timedate(interpolated, 'start', 'interpolate', by='user')
+        self.assertEqual(interpolated['start'].iloc[:4].tolist(), list(pd.date_range('2020-01-01', periods=4)))
+        self.assertEqual(interpolated['start'].iloc[5], pd.Timestamp('2020-02-06'))
+
+        forward = database.copy()
+        NBcontinuous.fill_na_timedate(forward, 'start', 'ffill', by='user')
+        self.assertEqual(forward['start'].iloc[2], pd.Timestamp('2020-01-01'))
+        self.assertEqual(forward['start'].iloc[5], pd.Timestamp('2020-02-01'))
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.fill_na_timedate(database, 'user')
+        with self.assertRaises(ValueError):
+            NBcontinuous.fill_na_timedate(database, 'start', 'nir')
+
+        with self.assertRaises(NameError):
+            NBcontinuous.fill_na_timedate(database, 'nir')
+
+    def test_extract_datetime_features(self):
+        print('extract_datetime_features\n')
+        times = pd.Series(pd.date_range('1960-02-27 22:45', '2030-03-02', periods=5000))
+        database = pd.DataFrame({'start': times, 'end': times.where(times.index % 10 != 0)})
+
+        added = NBcontinuous.extract_datetime_features(database, ['start', 'end'], reference='2000-01-01')
+        self.assertEqual(len(added), 16)
+        self.assertEqual(database['start_year'].dtype, 'int16')
+        self.assertEqual(database['start_hour'].dtype, 'int8')
+        self.assertEqual(database['end_month'].dtype, 'Int8')
+        for feature in ['year', 'month', 'day', 'dayofweek', 'hour', 'minute']:
+            self.assertEqual(database['start_' + feature].tolist(), getattr(times.dt, feature).tolist())
+        self.assertEqual(database['start_is_weekend'].tolist(), (times.dt.dayofweek >= 5).tolist())
+        self.assertEqual(database['start_elapsed_seconds'].tolist(),
+                         ((times - pd.Timestamp('2000-01-01')).dt.total_seconds() // 1).astype(int).tolist())
+        self.assertTrue(database['end_day'].isna().equals(times.index.to_series() % 10 == 0))
+
+        NBcontinuous.extract_datetime_features(database, 'start', ['hour'])
+        self.assertEqual(database.shape[1], 18)
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.extract_datetime_features(database, 'start_year')
+        with self.assertRaises(ValueError):
+            NBcontinuous.extract_datetime_features(database, 'start', ['nir'])
+        with self.assertRaises(ValueError):
+            NBcontinuous.extract_datetime_features(database, 'start', reference='nir')
+
+    def test_remove_outliers_by_boundaries(self):
+        print('remove_outliers_by_boundaries\n')
+        column_name = 'selling_price'
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_boundaries(['nir'], column_name, 0.01, 0.99)
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_boundaries(self.database, column_name, 0.01, 1.5)
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_boundaries(self.database, column_name, 0.01, 0.99, 'nir')
+
+        with self.assertRaises(NameError):
+            NBcontinuous.remove_outliers_by_boundaries(self.database, 'nir', 0.01, 0.99)
+
+        report = NBcontinuous.remove_outliers_by_boundaries(self.database, column_name, 0.01, 0.99, 'reject')
+        self.assertFalse(report.executed)
+        self.assertEqual(len(self.database), 4340)
+
+        report = NBcontinuous.remove_outliers_by_boundaries(self.database, column_name, 0.01, 0.99, 'confirm')
+        self.assertTrue(report.executed)
+        self.assertEqual(len(self.database), 4340 - report.rows_affected)
+
+    def test_remove_outliers_by_boundaries_many_columns(self):
+        print('remove_outliers_by_boundaries many columns\n')
+
+        expected_mask = pd.Series(False, index=self.database.index)
+        for column in ['year', 'selling_price', 'km_driven']:
+            column_values = self.database[column]
+            expected_mask |= ~column_values.between(column_values.quantile(0.05), column_values.quantile(0.95))
+
+        year_quantile = self.database['year'].quantile(0.05)
+        report = NBcontinuous.remove_outliers_by_boundaries(self.database, None, 0.05, 0.95, 'confirm')
+        self.assertEqual(report.rows_affected, expected_mask.sum())
+        self.assertEqual(set(report.details['rows_lost_per_column']), {'year', 'selling_price', 'km_driven'})
+        self.assertGreaterEqual(sum(report.details['rows_lost_per_column'].values()), report.rows_affected)
+        self.assertEqual(report.details['boundaries']['year'][0], year_quantile)
+        self.assertTrue(self.database.index.equals(expected_mask[~expected_mask].index))
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_boundaries(self.database, ['year', 'fuel'], 0.05, 0.95, 'confirm')
+
+        # as Series.between, a row with a missing value in a checked column is removed
+        database = pd.DataFrame({'a': [1.0, np.nan, 2.0, 3.0, 100.0], 'b': [np.nan, 1.0, 1.0, 1.0, 1.0]})
+        report = NBcontinuous.remove_outliers_by_boundaries(database, 'a', 0.0, 0.9, 'confirm')
+        self.assertEqual(report.rows_affected, 2)
+        self.assertEqual(database['a'].tolist(), [1.0, 2.0, 3.0])
+
+    def test_get_num_outliers_by_value(self):
+        print('get_num_outliers_by_value\n')
+        filter_dict_up = {'selling_price': 3000000, 'km_driven': 300000}
+        filter_dict_down = {'year': 2000, 'km_driven': 1000}
+
+        result = NBcontinuous.get_num_outliers_by_value(self.database, filter_dict_up, filter_dict_down)
+        above_price = self.database['selling_price'] > 3000000
+        km_outlier = (self.database['km_driven'] > 300000) | (self.database['km_driven'] < 1000)
+        under_year = self.database['year'] < 2000
+
+        self.assertEqual(list(result['per_column'].index), ['selling_price', 'km_driven', 'year'])
+        self.assertEqual(result['per_column'].at['km_driven', 'total'], km_outlier.sum())
+        self.assertEqual(result['union'], (above_price | km_outlier | under_year).sum())
+        self.assertEqual(result['overlap'].at['km_driven', 'year'], (km_outlier & under_year).sum())
+        self.assertEqual(result['overlap'].at['year', 'year'], under_year.sum())
+
+    def test_remove_outliers_by_value(self):
+        print('remove_outliers_by_value\n')
+        filter_dict_up = {'selling_price': 5000000, 'km_driven': 500000}
+        filter_dict_down = {'year': 2000}
+
+        expected = ((self.database['selling_price'] > 5000000) | (self.database['km_driven'] > 500000) |
+                    (self.database['year'] < 2000)).sum()
+        report = NBcontinuous.remove_outliers_by_value(self.database, filter_dict_up, filter_dict_down, 'reject')
+        self.assertFalse(report.executed)
+        self.assertEqual(report.rows_affected, expected)
+        self.assertEqual(len(self.database), 4340)
+
+        policy = ExecutionPolicy('threshold', max_rows_lost=expected - 1)
+        report = NBcontinuous.remove_outliers_by_value(self.database, filter_dict_up, filter_dict_down, policy)
+        self.assertFalse(report.executed)
+
+        report = NBcontinuous.remove_outliers_by_value(self.database, filter_dict_up, filter_dict_down, 'confirm')
+        self.assertTrue(report.executed)
+        self.assertEqual(report.rows_affected, expected)
+        self.assertEqual(len(self.database), 4340 - expected)
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_value(self.database, filter_dict_up, filter_dict_down, 'nir')
+
+        database = pd.DataFrame({'a': [1, 100, 2, 3]}, index=[7, 7, 8, 8])
+        NBcontinuous.remove_outliers_by_value(database, {'a': 50}, policy='confirm')
+        self.assertEqual(database['a'].tolist(), [1, 2, 3])
+        self.assertEqual(database.index.tolist(), [7, 8, 8])
+
+    def test_quantile_sketches(self):
+        print('quantile_sketches\n')
+        quantiles = np.linspace(0.01, 0.99, 99)
+
+        sketches = NBcontinuous.quantile_sketches('./dataset_cars.csv', None, chunksize=500, random_state=0)
+        self.assertEqual(set(sketches), {'year', 'selling_price', 'km_driven'})
+
+        # sketches of two halves merged as in two worker processes
+        first = NBcontinuous.quantile_sketches(self.database.iloc[:2000], 'km_driven', random_state=1)['km_driven']
+        second = NBcontinuous.quantile_sketches(self.database.iloc[2000:], 'km_driven', random_state=2)['km_driven']
+        sketches['km_driven'] = first.merge(second)
+
+        for column, sketch in sketches.items():
+            values = self.database[column].dropna().to_numpy()
+            self.assertEqual(sketch.count, len(values))
+            self.assertEqual(sketch.quantile(0), values.min())
+            self.assertEqual(sketch.quantile(1), values.max())
+
+            # the rank of the estimate must be within the documented error from the requested quantile
+            estimates = sketch.quantile(quantiles)
+            rank_below = (values[:, None] < estimates).mean(axis=0)
+            rank_up_to = (values[:, None] <= estimates).mean(axis=0)
+            rank_error = np.maximum(rank_below - quantiles, quantiles - rank_up_to).max()
+            self.assertLessEqual(rank_error, 0.015)
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.quantile_sketches(5)
+        with self.assertRaises(ValueError):
+            NBcontinuous.quantile_sketches('./dataset_cars.csv', 'year', k=2)
+        with self.assertRaises(ValueError):
+            QuantileSketch().merge('nir')
+
+        with self.assertRaises(NameError):
+            NBcontinuous.quantile_sketches(self.database, 'nir')
+
+    def test_quantile_sketches_compaction(self):
+        print('quantile_sketches compaction\n')
+        quantiles = np.linspace(0.01, 0.99, 99)
+        random_generator = np.random.default_rng(0)
+        values = random_generator.lognormal(size=400000)
+
+        # a CSV file of two columns of which only one is sketched
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stream.csv')
+            pd.DataFrame({'value': values, 'other': random_generator.integers(0, 10, len(values))}) \
+                .to_csv(path, index=False)
+            sketch = NBcontinuous.quantile_sketches(path, 'value', chunksize=20000, random_state=0)['value']
+            values = np.sort(pd.read_csv(path, usecols=['value'])['value'].to_numpy())
+
+        self.assertEqual(sketch.count, len(values))
+        # the sketch is compacted to a small fraction of the stream
+        self.assertLess(sketch.size, len(values) / 100)
+
+        estimates = sketch.quantile(quantiles)
+        rank_below = np.searchsorted(values, estimates, side='left') / len(values)
+        rank_up_to = np.searchsorted(values, estimates, side='right') / len(values)
+        rank_error = np.maximum(rank_below - quantiles, quantiles - rank_up_to).max()
+        self.assertLessEqual(rank_error, 0.015)
+
+    def test_remove_outliers_by_sketches(self):
+        print('remove_outliers_by_sketches\n')
+        sketches = NBcontinuous.quantile_sketches('./dataset_cars.csv', ['selling_price', 'year'], chunksize=1000,
+                                                  random_state=0)
+        filtered = pd.concat(NBcontinuous.remove_outliers_by_sketches('./dataset_cars.csv', sketches, 0.05, 0.95,
+                                                                      chunksize=1000))
+
+        top = {column: sketch.quantile(0.95) for column, sketch in sketches.items()}
+        bottom = {column: sketch.quantile(0.05) for column, sketch in sketches.items()}
+        expected = self.database[~((self.database['selling_price'] > top['selling_price']) |
+                                   (self.database['selling_price'] < bottom['selling_price']) |
+                                   (self.database['year'] > top['year']) | (self.database['year'] < bottom['year']))]
+        self.assertEqual(filtered.index.tolist(), expected.index.tolist())
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_sketches(self.database, {'year': 5}, 0.05, 0.95)
+
+    def test_outlier_detector(self):
+        print('OutlierDetector\n')
+        columns = ['year', 'selling_price', 'km_driven']
+
+        detector = OutlierDetector('iqr').fit(self.database)
+        outliers = detector.outliers(self.database)
+        self.assertEqual(list(outliers.columns), columns)
+        for column in columns:
+            first_quartile, third_quartile = self.database[column].quantile([0.25, 0.75])
+            iqr = third_quartile - first_quartile
+            expected = (self.database[column] < first_quartile - 1.5 * iqr) | \
+                       (self.database[column] > third_quartile + 1.5 * iqr)
+            self.assertTrue(outliers[column].equals(expected))
+
+        mad_outliers = OutlierDetector('mad', 3).fit_outliers(self.database, 'km_driven')['km_driven']
+        km_driven = self.database['km_driven']
+        mad = (km_driven - km_driven.median()).abs().median()
+        self.assertTrue(mad_outliers.equals((km_driven - km_driven.median()).abs() * 0.6745 / mad > 3))
+
+        zscore_outliers = OutlierDetector('zscore').fit_outliers(self.database, ['year'])['year']
+        year = self.database['year']
+        self.assertTrue(zscore_outliers.equals((year - year.mean()).abs() / year.std() > 3))
+
+        # the fitted boundaries plug into the value based methods
+        result = NBcontinuous.get_num_outliers_by_value(self.database, *detector.filter_dicts())
+        self.assertEqual(result['union'], outliers.any(axis=1).sum())
+
+        with self.assertRaises(ValueError):
+            OutlierDetector('nir')
+        with self.assertRaises(ValueError):
+            OutlierDetector('iqr', -1)
+        with self.assertRaises(ValueError):
+            OutlierDetector().outliers(self.database)
+
+    def test_remove_outliers_by_method(self):
+        print('remove_outliers_by_method\n')
+        train, test = self.database.iloc[:3000].copy(), self.database.iloc[3000:].copy()
+
+        report = NBcontinuous.remove_outliers_by_method(train, None, 'mad', policy='confirm')
+        self.assertEqual(len(train), 3000 - report.rows_affected)
+        self.assertEqual(set(report.details['boundaries']), {'year', 'selling_price', 'km_driven'})
+
+        expected = report.details['detector'].outliers_mask(test).sum()
+        report = NBcontinuous.remove_outliers_by_method(test, policy='confirm', detector=report.details['detector'])
+        self.assertEqual(report.rows_affected, expected)
+        self.assertEqual(len(test), 1340 - expected)
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_method(self.database, 'year', 'nir')
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_method(self.database, 'fuel', policy='confirm')
+        with self.assertRaises(ValueError):
+            NBcontinuous.remove_outliers_by_method(self.database, detector=OutlierDetector())
+
+    def test_clip_outliers_by_value(self):
+        print('clip_outliers_by_value\n')
+        expected = self.database['selling_price'].clip(upper=3000000)
+        km_driven_values = self.database['km_driven'].to_numpy()
+
+        clipper = NBcontinuous.clip_outliers_by_value(self.database, {'selling_price': 3000000},
+                                                      {'km_driven': 1000.5, 'year': 2000.5})
+        self.assertIsInstance(clipper, OutlierClipper)
+        self.assertEqual(len(self.database), 4340)
+        self.assertTrue(self.database['selling_price'].equals(expected))
+        self.assertEqual(self.database['km_driven'].min(), 1000.5)
+        self.assertEqual(self.database['km_driven'].isna().sum(), 4)
+        # the float column is clipped into its own array
+        self.assertEqual(np.nanmin(km_driven_values), 1000.5)
+        # the integer column keeps its dtype with the boundary rounded inwards
+        self.assertEqual(self.database['year'].dtype, 'int64')
+        self.assertEqual(self.database['year'].min(), 2001)
+
+        # under copy on write the column is replaced, a series taken before is not changed
+        with pd.option_context('mode.copy_on_write', True):
+            database = pd.read_pickle('./dataset_cars.pkl')
+            km_driven = database['km_driven']
+            NBcontinuous.clip_outliers_by_value(database, filter_dict_down={'km_driven': 1000.5})
+            self.assertEqual(database['km_driven'].min(), 1000.5)
+            self.assertEqual(km_driven.min(), 1)
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.clip_outliers_by_value(self.database, {'fuel': 5})
+        with self.assertRaises(ValueError):
+            NBcontinuous.clip_outliers_by_value(self.database, 'nir')
+
+        with self.assertRaises(NameError):
+            NBcontinuous.clip_outliers_by_value(self.database, {'nir': 5})
+
+    def test_clip_outliers_by_boundaries(self):
+        print('clip_outliers_by_boundaries\n')
+        train, test = self.database.iloc[:3000].copy(), self.database.iloc[3000:].copy()
+        bottom, top = train['selling_price'].quantile([0.05, 0.95])
+
+        clipper = NBcontinuous.clip_outliers_by_boundaries(train, None, 0.05, 0.95)
+        self.assertEqual(set(clipper.boundaries_), {'year', 'selling_price', 'km_driven'})
+        self.assertEqual(clipper.boundaries_['selling_price'], (bottom, top))
+        self.assertEqual(train['selling_price'].max(), top)
+        self.assertEqual(len(train), 3000)
+
+        expected = test['selling_price'].clip(bottom, top)
+        clipper.transform(test)
+        self.assertTrue(test['selling_price'].equals(expected))
+
+        detector = OutlierDetector('iqr').fit(self.database, 'km_driven')
+        detector.clip(self.database)
+        self.assertFalse(detector.outliers(self.database)['km_driven'].any())
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.clip_outliers_by_boundaries(self.database, 'fuel', 0.05, 0.95)
+        with self.assertRaises(ValueError):
+            NBcontinuous.clip_outliers_by_boundaries(self.database, 'year', 0.05, 2)
+        with self.assertRaises(ValueError):
+            OutlierClipper().transform(self.database)
+
+    def test_discretize(self):
+        print('discretize\n')
+        train, test = self.database.iloc[:3000].copy(), self.database.iloc[3000:].copy()
+        expected_train = pd.qcut(train['km_driven'], 10, labels=False, duplicates='drop')
+        edges = pd.qcut(train['km_driven'], 10, retbins=True, duplicates='drop')[1]
+        expected_test = pd.cut(test['km_driven'].clip(edges[0], edges[-1]), edges, labels=False,
+                               include_lowest=True)
+
+        discretizer = NBcontinuous.discretize(train, ['km_driven', 'year'], 10)
+        self.assertIsInstance(discretizer, Discretizer)
+        self.assertEqual(train['km_driven'].dtype, 'int8')
+        self.assertTrue((train['km_driven'] == expected_train.fillna(-1)).all())
+
+        discretizer.transform(test)
+        self.assertTrue((test['km_driven'] == expected_test.fillna(-1)).all())
+        self.assertEqual(test['km_driven'].isin([-1]).sum(), self.database['km_driven'].iloc[3000:].isna().sum())
+
+        uniform = NBcontinuous.discretize(self.database, 'selling_price', 4, 'uniform')
+        self.assertEqual(len(uniform.bin_edges_['selling_price']), 5)
+        self.assertEqual(set(self.database['selling_price'].unique()), {-1, 0, 1, 2, 3})
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.discretize(self.database, 'fuel')
+        with self.assertRaises(ValueError):
+            NBcontinuous.discretize(self.database, 'year', 1)
+        with self.assertRaises(ValueError):
+            NBcontinuous.discretize(self.database, 'year', 5, 'nir')
+
+    def test_scale(self):
+        print('scale\n')
+        train, test = self.database.iloc[:3000].copy(), self.database.iloc[3000:].copy()
+        price = train['selling_price'].copy()
+        price_values = train['selling_price'].to_numpy()
+
+        scaler = NBcontinuous.scale(train)
+        self.assertIsInstance(scaler, Scaler)
+        self.assertEqual(set(scaler.center_), {'year', 'selling_price', 'km_driven'})
+        self.assertTrue(np.allclose(train['selling_price'], (price - price.mean()) / price.std(ddof=0),
+                                    equal_nan=True))
+        # the float column is scaled in its own array
+        self.assertTrue(np.allclose(price_values, train['selling_price'], equal_nan=True))
+        self.assertEqual(train['year'].dtype, 'float64')
+        self.assertAlmostEqual(train['year'].std(ddof=0), 1)
+
+        # under copy on write the column is replaced, a series taken before is not changed
+        with pd.option_context('mode.copy_on_write', True):
+            database = pd.read_pickle('./dataset_cars.pkl')
+            price = database['selling_price']
+            NBcontinuous.scale(database, 'selling_price')
+            self.assertAlmostEqual(database['selling_price'].mean(), 0)
+            self.assertTrue(price.equals(self.database['selling_price']))
+
+        # reuse the serialized parameters on the test set
+        year = test['year'].copy()
+        loaded = Scaler.from_dict(json.loads(json.dumps(scaler.to_dict())))
+        loaded.transform(test)
+        self.assertTrue(np.allclose(test['year'], (year - scaler.center_['year']) / scaler.scale_['year']))
+        loaded.inverse_transform(test)
+        self.assertTrue(np.allclose(test['year'], year))
+
+        minmax = NBcontinuous.scale(self.database, ['km_driven', 'selling_price'], 'minmax', 'float32')
+        self.assertEqual(self.database['km_driven'].dtype, 'float32')
+        self.assertEqual(self.database['km_driven'].min(), 0)
+        self.assertEqual(self.database['km_driven'].max(), 1)
+        self.assertEqual(self.database['km_driven'].isna().sum(), 4)
+        self.assertEqual(minmax.to_dict()['dtype'], 'float32')
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.scale(self.database, 'fuel')
+        with self.assertRaises(ValueError):
+            NBcontinuous.scale(self.database, 'year', 'nir')
+        with self.assertRaises(ValueError):
+            NBcontinuous.scale(self.database, 'year', 'robust', 'int8')
+
+    def test_correct_skewness(self):
+        print('correct_skewness\n')
+        from scipy import stats
+
+        train, test = self.database.iloc[:3000].copy(), self.database.iloc[3000:].copy()
+        price = train['selling_price'].dropna().to_numpy()
+        km_driven = test['km_driven'].copy()
+
+        corrector = NBcontinuous.correct_skewness(train, ['selling_price', 'km_driven', 'year'], threshold=1,
+                                                  n_jobs=2)
+        self.assertIsInstance(corrector, SkewCorrector)
+        self.assertAlmostEqual(corrector.skewness_['selling_price'], stats.skew(price))
+        self.assertEqual(set(corrector.transforms_), {'selling_price', 'km_driven'})
+        transform_name, price_lambda = corrector.transforms_['selling_price']
+        self.assertEqual(transform_name, 'boxcox')
+        self.assertAlmostEqual(price_lambda, stats.boxcox_normmax(price, method='mle'), places=3)
+        self.assertLess(abs(stats.skew(train['selling_price'].dropna())), abs(stats.skew(price)))
+        self.assertEqual(train['year'].dtype, 'int64')
+
+        corrector.transform(test)
+        self.assertEqual(corrector.transforms_['km_driven'][0], 'boxcox')
+        km_lambda = corrector.transforms_['km_driven'][1]
+        self.assertTrue(np.allclose(test['km_driven'], stats.boxcox(km_driven.to_numpy(), km_lambda),
+                                    equal_nan=True))
+
+        # under copy on write the column is replaced, a series taken before is not changed
+        with pd.option_context('mode.copy_on_write', True):
+            database = self.database.iloc[3000:].copy()
+            km_driven = database['km_driven']
+            corrector.transform(database)
+            self.assertTrue(np.allclose(database['km_driven'], test['km_driven'], equal_nan=True))
+            self.assertTrue(km_driven.equals(self.database['km_driven'].iloc[3000:]))
+
+        all_prices = self.database['selling_price'].dropna().to_numpy()
+        yeo_johnson = NBcontinuous.correct_skewness(self.database, 'selling_price', 'yeo-johnson')
+        self.assertAlmostEqual(yeo_johnson.transforms_['selling_price'][1], stats.yeojohnson_normmax(all_prices),
+                               places=3)
+
+        with self.assertRaises(ValueError):
+            NBcontinuous.correct_skewness(self.database, 'fuel')
+        with self.assertRaises(ValueError):
+            NBcontinuous.correct_skewness(self.database, 'year', 'nir')
+        with self.assertRaises(ValueError):
+            NBcontinuous.correct_skewness(pd.DataFrame({'a': [-1.0, 0, 0, 0, 50]}), 'a', 'boxcox')
+
+
+if __name__ == '__main__':
+    unittest.main()
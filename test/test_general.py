@@ -0,0 +1,282 @@
+from NBprocessing import NBgeneral, NBcategorical, DatasetProfile, ExecutionPolicy
+import importlib.util
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+
+class TestGeneral(unittest.TestCase):
+
+    def setUp(self):
+        print('setUp')
+        self.database = pd.read_pickle('./dataset_cars.pkl')
+
+    def tearDown(self):
+        print('tearDown\n')
+        pass
+
+    def test_missing_values(self):
+        print('missing_values\n')
+        missing_values = NBgeneral.missing_values(self.database)
+
+        expected = self.database.isnull().sum()
+        expected = expected[expected > 0].sort_values(ascending=False)
+        self.assertEqual(missing_values.index.tolist(), expected.index.tolist())
+        self.assertEqual(missing_values['#Missing_values'].tolist(), expected.tolist())
+        self.assertEqual(missing_values['%Missing_values'].tolist(),
+                         (100 * round(expected / len(self.database), 3)).tolist())
+
+        # blocks smaller than a column are summed over the rows
+        from NBprocessing.general._general_functions_general import null_counts
+        self.assertEqual(null_counts(self.database, block_values=1000).tolist(),
+                         self.database.isnull().sum().tolist())
+
+        self.assertTrue(NBgeneral.missing_values(self.database.dropna()).empty)
+
+    def test_missing_values_by_chunks(self):
+        print('missing_values_by_chunks\n')
+        expected = NBgeneral.missing_values(self.database)
+
+        by_frame = NBgeneral.missing_values_by_chunks(self.database, chunksize=500)
+        pd.testing.assert_frame_equal(by_frame, expected)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cars.csv')
+            self.database.to_csv(path, index=False)
+            by_file = NBgeneral.missing_values_by_chunks(path, ['km_driven', 'year'], chunksize=1000)
+        self.assertEqual(by_file.index.tolist(), ['km_driven'])
+        self.assertEqual(by_file['#Missing_values'].tolist(), [expected.loc['km_driven', '#Missing_values']])
+
+        chunks = (self.database.iloc[start:start + 1000] for start in range(0, len(self.database), 1000))
+        pd.testing.assert_frame_equal(NBgeneral.missing_values_by_chunks(chunks), expected)
+
+        with self.assertRaises(ValueError):
+            NBgeneral.missing_values_by_chunks(self.database, chunksize=0)
+        with self.assertRaises(NameError):
+            NBgeneral.missing_values_by_chunks(self.database, 'not a column')
+
+    def test_split_and_check(self):
+        print('split_and_check\n')
+        from sklearn.model_selection import train_test_split
+        database = self.database
+
+        X_train, X_test, y_train, y_test = NBgeneral.split_and_check(database, 'selling_price')
+        expected = train_test_split(database.drop('selling_price', axis=1), database['selling_price'],
+                                    test_size=0.3, random_state=42)
+        for split, expected_split in zip((X_train, X_test, y_train, y_test), expected):
+            pd.testing.assert_frame_equal(pd.DataFrame(split), pd.DataFrame(expected_split))
+
+        # the test size is not replaced by the default anymore
+        train, test = NBgeneral.split_and_check(database, 'selling_price', 0.2, return_indices=True)
+        self.assertEqual(len(test), int(np.ceil(0.2 * len(database))))
+        self.assertEqual(sorted(np.concatenate([train, test]).tolist()), list(range(len(database))))
+
+        train, test = NBgeneral.split_and_check(database, 'selling_price', method='stratified', by='owner',
+                                                return_indices=True)
+        train_ratio = database['owner'].iloc[train].value_counts(normalize=True)
+        test_ratio = database['owner'].iloc[test].value_counts(normalize=True)
+        self.assertLess((train_ratio - test_ratio).abs().max(), 0.01)
+
+        train, test = NBgeneral.split_and_check(database, 'selling_price', method='group', by='name',
+                                                return_indices=True)
+        self.assertFalse(set(database['name'].iloc[train]) & set(database['name'].iloc[test]))
+
+        X_train, X_test, y_train, y_test = NBgeneral.split_and_check(database, 'selling_price', 0.25,
+                                                                     method='time', by='year')
+        self.assertLessEqual(X_train['year'].max(), X_test['year'].min())
+        self.assertEqual(len(X_test), len(y_test))
+        self.assertNotIn('selling_price', X_train.columns)
+
+        with self.assertRaises(ValueError):
+            NBgeneral.split_and_check(database, 'selling_price', method='group')
+        with self.assertRaises(ValueError):
+            NBgeneral.split_and_check(database, 'selling_price', method='shuffle')
+        with self.assertRaises(NameError):
+            NBgeneral.split_and_check(database, 'selling_price', method='time', by='not a column')
+
+    def test_k_fold_split(self):
+        print('k_fold_split\n')
+        database = self.database
+
+        folds = list(NBgeneral.k_fold_split(database, 'selling_price', 4, return_indices=True))
+        self.assertEqual(len(folds), 4)
+        self.assertEqual(sorted(np.concatenate([test for _, test in folds]).tolist()), list(range(len(database))))
+
+        for train, test in NBgeneral.k_fold_split(database, 'selling_price', 3, method='group', by='name',
+                                                  return_indices=True):
+            self.assertFalse(set(database['name'].iloc[train]) & set(database['name'].iloc[test]))
+
+        for X_train, X_test, y_train, y_test in NBgeneral.k_fold_split(database, 'selling_price', 3,
+                                                                       method='time', by='year'):
+            self.assertLessEqual(X_train['year'].max(), X_test['year'].min())
+            self.assertEqual(len(X_train), len(y_train))
+
+        with self.assertRaises(ValueError):
+            NBgeneral.k_fold_split(database, 'selling_price', 1)
+
+    def test_profile(self):
+        print('profile\n')
+        profile = NBgeneral.profile(self.database, num_categories=3, n_jobs=2)
+        self.assertIsInstance(profile, DatasetProfile)
+        summary = profile.summary_
+        self.assertEqual(summary.index.tolist(), self.database.columns.tolist())
+
+        self.assertEqual(summary['missing'].tolist(), self.database.isnull().sum().tolist())
+        self.assertEqual(summary['unique'].tolist(), self.database.nunique().tolist())
+        for column_name in ['year', 'selling_price', 'km_driven']:
+            column = self.database[column_name]
+            self.assertAlmostEqual(summary.at[column_name, 'mean'], column.mean(), places=6)
+            self.assertAlmostEqual(summary.at[column_name, 'std'], column.std(), places=6)
+            self.assertEqual(summary.at[column_name, 'min'], column.min())
+            self.assertEqual(summary.at[column_name, 'max'], column.max())
+            quartiles = np.nanquantile(column, [0.25, 0.5, 0.75])
+            self.assertEqual(summary.loc[column_name, ['25%', '50%', '75%']].tolist(), quartiles.tolist())
+            interquartile_range = quartiles[2] - quartiles[0]
+            outliers = (column < quartiles[0] - 1.5 * interquartile_range) | \
+                       (column > quartiles[2] + 1.5 * interquartile_range)
+            self.assertEqual(summary.at[column_name, 'outliers'], outliers.sum())
+        self.assertTrue(np.isnan(summary.at['fuel', 'mean']))
+
+        # the consumers read the profile instead of scanning the database again
+        pd.testing.assert_frame_equal(NBgeneral.missing_values(self.database, profile=profile),
+                                      NBgeneral.missing_values(self.database))
+        for columns_to_check in (['transmission', 'fuel'], None):
+            pd.testing.assert_frame_equal(
+                NBcategorical.category_ratio(self.database, columns_to_check, num_categories=2, profile=profile),
+                NBcategorical.category_ratio(self.database, columns_to_check, num_categories=2))
+
+        with self.assertRaises(ValueError):
+            NBcategorical.category_ratio(self.database, ['fuel'], num_categories=5, profile=profile)
+        with self.assertRaises(ValueError):
+            NBgeneral.missing_values(self.database, profile=DatasetProfile())
+        with self.assertRaises(ValueError):
+            NBcategorical.category_ratio(self.database, ['fuel'], profile=DatasetProfile())
+        with self.assertRaises(ValueError):
+            NBgeneral.missing_values(self.database, profile='nir')
+
+    def test_reduce_memory(self):
+        print('reduce_memory\n')
+        database = self.database.copy()
+        database['exact_float'] = database['year'] / 4
+        database['inexact_float'] = database['year'] / 3
+        database['nullable_int'] = pd.array(np.where(np.arange(len(database)) % 7, 300, None), dtype='Int64')
+        database['big_int'] = np.arange(len(database), dtype=np.int64) * 2 ** 40
+        original = database.copy()
+
+        report = NBgeneral.reduce_memory(database)
+        self.assertEqual(database['year'].dtype, np.int16)
+        self.assertEqual(database['exact_float'].dtype, np.float32)
+        self.assertEqual(database['inexact_float'].dtype, np.float64)
+        self.assertEqual(database['nullable_int'].dtype, 'Int16')
+        self.assertEqual(database['big_int'].dtype, np.int64)
+        for column_name in ['fuel', 'seller_type', 'transmission', 'owner']:
+            self.assertEqual(database[column_name].dtype, 'category')
+        # the prices are whole numbers - exact in float32
+        self.assertEqual(database['selling_price'].dtype, np.float32)
+        self.assertEqual(database['name'].dtype, 'category')
+        self.assertNotIn('big_int', report.index)
+        self.assertTrue((report['memory_after'] < report['memory_before']).all())
+        self.assertLess(database.memory_usage(deep=True).sum(), original.memory_usage(deep=True).sum() / 2)
+
+        # no value is changed
+        for column_name in original:
+            pd.testing.assert_series_equal(database[column_name].astype(object), original[column_name].astype(object))
+
+        # the car names are a third unique
+        strings = original[['name', 'fuel']].copy()
+        report = NBgeneral.reduce_memory(strings, category_threshold=0.2)
+        self.assertEqual(report.index.tolist(), ['fuel'])
+        self.assertEqual(strings['name'].dtype, object)
+        NBgeneral.reduce_memory(strings, 'name', category_threshold=0)
+        self.assertEqual(strings['name'].dtype, object)
+
+        with self.assertRaises(ValueError):
+            NBgeneral.reduce_memory(strings, category_threshold=2)
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_reduce_memory_arrow_strings(self):
+        print('reduce_memory arrow strings\n')
+        database = self.database.copy()
+        NBgeneral.reduce_memory(database, arrow_strings=True)
+        self.assertEqual(str(database['name'].dtype), 'string')
+        self.assertEqual(database['name'].tolist(), self.database['name'].tolist())
+
+    def test_get_num_duplicates(self):
+        print('get_num_duplicates\n')
+        counts = NBgeneral.get_num_duplicates(self.database)
+        self.assertEqual(counts['duplicates'], self.database.duplicated().sum())
+        self.assertEqual(counts['duplicated_groups'],
+                         self.database.duplicated(keep=False).sum() - self.database.duplicated().sum())
+        self.assertEqual(counts['collisions'], 0)
+
+        subset = NBgeneral.get_num_duplicates(self.database, ['fuel', 'owner'])
+        self.assertEqual(subset['duplicates'], self.database.duplicated(['fuel', 'owner']).sum())
+
+        # an integer and a string of the same text have the same hash - the collision is resolved
+        from NBprocessing.general._general_functions_general import row_hashes
+        database = pd.DataFrame({'value': [5, '5', 5, '5', 'a']})
+        hashes = row_hashes(database)
+        self.assertEqual(hashes[0], hashes[1])
+        counts = NBgeneral.get_num_duplicates(database)
+        self.assertEqual(counts['duplicates'], 2)
+        self.assertEqual(counts['collisions'], 1)
+
+        # integers above 2^53 are distinct although they are equal as float64
+        database = pd.DataFrame({'id': [2 ** 53, 2 ** 53 + 1, 2 ** 53 + 2, 2 ** 53 + 1]})
+        counts = NBgeneral.get_num_duplicates(database)
+        self.assertEqual(counts['duplicates'], database.duplicated().sum())
+        self.assertEqual(counts['duplicates'], 1)
+        self.assertEqual(counts['collisions'], 0)
+
+    def test_remove_duplicates(self):
+        print('remove_duplicates\n')
+        for keep in ('first', 'last', False):
+            database = self.database.copy()
+            report = NBgeneral.remove_duplicates(database, ['name', 'year'], keep=keep, policy='confirm')
+            expected = self.database.drop_duplicates(['name', 'year'], keep=keep)
+            pd.testing.assert_frame_equal(database, expected)
+            self.assertEqual(report.rows_affected, len(self.database) - len(expected))
+
+        database = self.database.copy()
+        report = NBgeneral.remove_duplicates(database, policy=ExecutionPolicy('reject'))
+        self.assertFalse(report.executed)
+        self.assertEqual(len(database), len(self.database))
+
+        with self.assertRaises(ValueError):
+            NBgeneral.remove_duplicates(database, keep=0)
+
+        database = pd.DataFrame({'id': [2 ** 53, 2 ** 53 + 1, 2 ** 53 + 2, 2 ** 62 + 1, 2 ** 62 + 1]})
+        report = NBgeneral.remove_duplicates(database, policy='confirm')
+        self.assertEqual(report.rows_affected, 1)
+        self.assertEqual(database['id'].tolist(), [2 ** 53, 2 ** 53 + 1, 2 ** 53 + 2, 2 ** 62 + 1])
+
+    def test_remove_duplicates_by_chunks(self):
+        print('remove_duplicates_by_chunks\n')
+        expected = self.database.drop_duplicates()
+        deduplicated = pd.concat(NBgeneral.remove_duplicates_by_chunks(self.database, chunksize=700))
+        pd.testing.assert_frame_equal(deduplicated, expected)
+
+        # two files that overlap, the first has an integer column and the second missing values in it
+        with tempfile.TemporaryDirectory() as directory:
+            first_path, second_path = os.path.join(directory, 'first.csv'), os.path.join(directory, 'second.csv')
+            first = self.database.iloc[:3000].dropna().astype({'km_driven': 'int64'})
+            second = self.database.iloc[2000:]
+            first.to_csv(first_path, index=False)
+            second.to_csv(second_path, index=False)
+            chunks = list(NBgeneral.remove_duplicates_by_chunks([first_path, second_path], ['name', 'km_driven'],
+                                                                chunksize=1000))
+        combined = pd.concat([first, second], ignore_index=True)
+        expected = combined.drop_duplicates(['name', 'km_driven'])
+        self.assertEqual(sum(len(chunk) for chunk in chunks), len(expected))
+        self.assertEqual(pd.concat(chunks)['name'].tolist(), expected['name'].tolist())
+
+        # large integer ids across chunks are matched exactly, not as float64
+        ids = pd.DataFrame({'id': [2 ** 53 + position for position in range(6)] + [2 ** 53 + 1]})
+        deduplicated = pd.concat(NBgeneral.remove_duplicates_by_chunks(ids, chunksize=2))
+        self.assertEqual(deduplicated['id'].tolist(), ids['id'].iloc[:6].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+import unittest
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('seaborn', 'matplotlib', 'plotly', 'sklearn', 'scipy')
+
+# generous bound of the cumulative import time of the package itself, the eager import took over a second
+MAX_IMPORT_MICROSECONDS = 100000
+
+
+class TestImport(unittest.TestCase):
+
+    def _run(self, code, *args):
+        environment = dict(os.environ, PYTHONPATH=PACKAGE_ROOT)
+        return subprocess.run([sys.executable] + list(args) + ['-c', code], env=environment,
+                              capture_output=True, text=True, check=True)
+
+    def test_import_time(self):
+        print('import time\n')
+
+        result = self._run('import NBprocessing', '-X', 'importtime')
+        cumulative = [int(line.split('|')[1]) for line in result.stderr.splitlines()
+                      if line.split('|')[-1].strip() == 'NBprocessing']
+        self.assertEqual(len(cumulative), 1)
+        self.assertLess(cumulative[0], MAX_IMPORT_MICROSECONDS)
+
+    def test_heavy_modules_not_imported(self):
+        print('heavy modules not imported\n')
+
+        code = ("import sys, pandas as pd\n"
+                "from NBprocessing import NBgeneral, NBcategorical, NBcontinuous, NBplot\n"
+                "NBgeneral.missing_values(pd.DataFrame({'a': [1, None]}))\n"
+                "print(','.join(module for module in %r if module in sys.modules))" % (HEAVY_MODULES,))
+        self.assertEqual(self._run(code).stdout.strip(), '')
+
+        code = "import sys, NBprocessing\nprint('pandas' in sys.modules)"
+        self.assertEqual(self._run(code).stdout.strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()